@@ -1,18 +1,31 @@
 from .interactive_menu import InteractiveMenu
 from .config import MenuConfig
 from .version import __version__
-from .search import SearchEngine
+from .search import CacheInfo, SearchEngine
+from .sharded_search import ShardedSearchEngine
+from .field_search import FieldSearchEngine
 from .groups import OptionGroup, GroupRenderer
 from .themes import MenuTheme, get_theme, list_themes
+from .shortcuts import ShortcutMap
+from .options import LazyOptionTable, OptionTable
+from .level import MenuLevel, SearchHit
 
 __all__ = [
     'InteractiveMenu',
     'MenuConfig',
     '__version__',
     'SearchEngine',
+    'CacheInfo',
+    'ShardedSearchEngine',
+    'FieldSearchEngine',
     'OptionGroup',
     'GroupRenderer',
     'MenuTheme',
     'get_theme',
     'list_themes',
+    'ShortcutMap',
+    'OptionTable',
+    'LazyOptionTable',
+    'MenuLevel',
+    'SearchHit',
 ]
@@ -0,0 +1,105 @@
+"""Non-blocking line input for the asyncio API of InteractiveMenu.
+
+This module connects stdin to an ``asyncio.StreamReader`` so that
+``ask_async()`` can wait for answers without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import Union
+
+
+class ExecutorLineReader:
+    """Line reader that reads stdin in the loop's default executor.
+
+    Used when stdin is not a terminal (a pipe or a redirected file) and
+    where it cannot be attached to the event loop, such as on the Windows
+    proactor loop. Lines stay in ``sys.stdin``'s buffer between sessions,
+    so answers read ahead by one session are seen by the next.
+    """
+
+    async def readline(self) -> Union[bytes, str]:
+        """Read one line from stdin.
+
+        Returns:
+            The line including its newline, or an empty string at EOF.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, sys.stdin.readline)
+
+    def close(self) -> None:
+        """Release the reader; stdin itself is left untouched."""
+
+
+class PipeLineReader:
+    """Line reader over a duplicate of stdin attached to the event loop.
+
+    Attaching a pipe to the loop switches its file description to
+    non-blocking mode, which a terminal shares between stdin and stdout.
+    ``close()`` detaches the duplicate and restores the blocking mode stdin
+    had before, so later ``input()`` calls and large writes behave normally.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, transport: asyncio.ReadTransport,
+                 fd: int, blocking: bool) -> None:
+        """Initialize the reader.
+
+        Args:
+            reader: Stream fed by the duplicated stdin.
+            transport: The loop's transport reading the duplicate.
+            fd: The stdin file descriptor.
+            blocking: Whether ``fd`` was blocking before it was attached.
+        """
+        self._reader = reader
+        self._transport = transport
+        self._fd = fd
+        self._blocking = blocking
+
+    async def readline(self) -> bytes:
+        """Read one line from stdin.
+
+        Returns:
+            The line including its newline, or empty bytes at EOF.
+        """
+        return await self._reader.readline()
+
+    def close(self) -> None:
+        """Detach from the event loop and restore stdin's blocking mode."""
+        self._transport.close()
+        os.set_blocking(self._fd, self._blocking)
+
+
+async def connect_stdin() -> Union[PipeLineReader, ExecutorLineReader]:
+    """Create a reader for stdin bound to the running event loop.
+
+    The caller must ``close()`` the reader when its session ends. Only a
+    terminal is attached to the loop: it returns one line per read, so
+    closing the reader after a session discards no answers, whereas a
+    pipe hands over every pending line at once.
+
+    Returns:
+        A ``PipeLineReader`` fed by a duplicate of a terminal stdin, or an
+        ``ExecutorLineReader`` otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        if not sys.stdin.isatty():
+            return ExecutorLineReader()
+        fd = sys.stdin.fileno()
+        blocking = os.get_blocking(fd)
+    except (AttributeError, OSError, ValueError):
+        return ExecutorLineReader()
+    # Closing the transport closes its pipe, so it gets a duplicate of fd 0
+    pipe = os.fdopen(os.dup(fd), 'rb', buffering=0)
+    reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    try:
+        transport, _ = await loop.connect_read_pipe(lambda: protocol, pipe)
+    except (NotImplementedError, OSError, ValueError):
+        pipe.close()
+        os.set_blocking(fd, blocking)
+        return ExecutorLineReader()
+    return PipeLineReader(reader, transport, fd, blocking)
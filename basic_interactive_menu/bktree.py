@@ -0,0 +1,133 @@
+"""BK-tree over words for typo-tolerant search.
+
+This module provides the Levenshtein edit distance and a BK-tree, a
+metric tree that finds every word within a maximum distance of a query
+word. Each child edge is labelled with its distance to the parent, so by
+the triangle inequality a lookup only descends into children whose label
+is within ``max_distance`` of the query's distance to the parent, and
+visits a small part of the vocabulary for small distances.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Compute the edit distance between two strings.
+
+    Insertions, deletions and substitutions each cost 1. The dynamic
+    programming columns are encoded as bit vectors (Myers' algorithm as
+    formulated by Hyyrö), so each character of the longer string costs a
+    handful of integer operations instead of a loop over the other string.
+
+    Args:
+        a: First string.
+        b: Second string.
+
+    Returns:
+        The minimum number of edits turning ``a`` into ``b``.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    # Bit i of peq[char] is set where b[i] == char
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    full = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    positive, negative = full, 0
+    distance = len(b)
+    for char in a:
+        eq = peq.get(char, 0)
+        vertical = eq | negative
+        horizontal = (((eq & positive) + positive) ^ positive) | eq
+        up = negative | ~(horizontal | positive)
+        down = positive & horizontal
+        if up & last:
+            distance += 1
+        elif down & last:
+            distance -= 1
+        up = (up << 1) | 1
+        down <<= 1
+        positive = (down | ~(vertical | up)) & full
+        negative = up & vertical & full
+    return distance
+
+
+class _Node:
+    __slots__ = ('word', 'children')
+
+    def __init__(self, word: str) -> None:
+        self.word = word
+        self.children: Dict[int, _Node] = {}
+
+
+class BKTree:
+    """Metric tree of words under the Levenshtein distance.
+
+    Example:
+        >>> tree = BKTree(["margherita", "marinara", "pepperoni"])
+        >>> tree.search("margerita", 2)
+        [(1, 'margherita')]
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        """Initialize the tree.
+
+        Args:
+            words: Initial words; duplicates are stored once.
+        """
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self.add(words)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, words: Iterable[str]) -> None:
+        """Insert words, skipping ones already in the tree.
+
+        Args:
+            words: Words to insert.
+        """
+        for word in words:
+            node = self._root
+            if node is None:
+                self._root = _Node(word)
+                self._size += 1
+                continue
+            while True:
+                distance = levenshtein(word, node.word)
+                if distance == 0:
+                    break
+                child = node.children.get(distance)
+                if child is None:
+                    node.children[distance] = _Node(word)
+                    self._size += 1
+                    break
+                node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Find the words within ``max_distance`` edits of a word.
+
+        Args:
+            word: The query word.
+            max_distance: Maximum edit distance (non-negative).
+
+        Returns:
+            ``(distance, word)`` pairs, closest first, then alphabetically.
+        """
+        found: List[Tuple[int, str]] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(word, node.word)
+            if distance <= max_distance:
+                found.append((distance, node.word))
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for edge, child in node.children.items() if low <= edge <= high)
+        found.sort()
+        return found
@@ -145,3 +145,13 @@ class MenuConfig:
 
         if "multiple" in config and not isinstance(config["multiple"], bool):
             raise ValueError("'multiple' must be a boolean")
+
+        if "search_index" in config and not isinstance(config["search_index"], str):
+            raise ValueError("'search_index' must be a string")
+
+        if "search_fields" in config:
+            search_fields = config["search_fields"]
+            if not isinstance(search_fields, dict) or not all(
+                    isinstance(weight, (int, float)) and not isinstance(weight, bool)
+                    for weight in search_fields.values()):
+                raise ValueError("'search_fields' must map field names to numeric weights")
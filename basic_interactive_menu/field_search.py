@@ -0,0 +1,165 @@
+"""Ranked search over several weighted fields per option.
+
+This module lets options be found by searchable fields other than their
+display name, such as a SKU, aliases or a description. Each field gets
+its own SearchEngine (a trigram index over that field's values), and a
+query's matches in every field are combined into one ranked list using
+per-field weights.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from basic_interactive_menu.search import QUERY_CACHE_SIZE, SearchEngine
+
+# Field holding the option's display name in InteractiveMenu
+NAME_FIELD = 'name'
+
+# Weight of the name field unless one is given
+NAME_WEIGHT = 1.0
+
+# Multipliers of a field's weight when the query is the whole field
+# value, or a prefix of it, rather than a substring
+EXACT_MULTIPLIER = 4.0
+PREFIX_MULTIPLIER = 2.0
+
+
+def field_text(value: Any) -> str:
+    """Convert a field value to the text that is searched.
+
+    Args:
+        value: The value; None for a missing field, a list, tuple or set
+            for several terms (e.g. tags or aliases), anything else is
+            converted with ``str()``.
+
+    Returns:
+        The searchable text.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return " ".join(str(item) for item in value)
+    return str(value)
+
+
+def check_weights(weights: Mapping[str, float]) -> None:
+    """Validate search field weights.
+
+    Args:
+        weights: Weight of each searched field.
+
+    Raises:
+        ValueError: If no field is given or a weight is not positive.
+    """
+    if not weights:
+        raise ValueError("At least one search field is required")
+    for field, weight in weights.items():
+        if weight <= 0:
+            raise ValueError(f"Weight of field '{field}' must be positive, got {weight}")
+
+
+class FieldSearchEngine:
+    """Substring search over weighted option fields, ranked by score.
+
+    Every option is a record mapping field names to values. Each field is
+    indexed separately, and an option's score for a query is the sum of
+    the weights of the fields containing the query, multiplied by
+    ``EXACT_MULTIPLIER`` when the query equals the field value and by
+    ``PREFIX_MULTIPLIER`` when it starts it. Fields missing from a record
+    are searched as empty text.
+
+    Example:
+        >>> engine = FieldSearchEngine(
+        ...     [{'name': "Blue Widget", 'sku': "BW-100"}, {'name': "Red Gadget", 'sku': "RG-200"}],
+        ...     weights={'name': 1.0, 'sku': 2.0})
+        >>> engine.search("bw-100")
+        [0]
+    """
+
+    def __init__(self, records: Iterable[Mapping[str, Any]], weights: Mapping[str, float],
+                 cache_size: int = QUERY_CACHE_SIZE) -> None:
+        """Initialize the engine.
+
+        Args:
+            records: Field values of each option, in option order.
+            weights: Weight of each searched field; other fields are ignored.
+            cache_size: Query cache size of each field index.
+
+        Raises:
+            ValueError: If no field is given or a weight is not positive.
+        """
+        check_weights(weights)
+        self.weights: Dict[str, float] = dict(weights)
+        self._engines: Dict[str, SearchEngine] = {
+            field: SearchEngine([], cache_size=cache_size) for field in self.weights
+        }
+        self._count = 0
+        self.add(records)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Append options and index only the new ones.
+
+        Args:
+            records: Field values of each new option.
+        """
+        columns: Dict[str, List[str]] = {field: [] for field in self.weights}
+        count = 0
+        for record in records:
+            for field, column in columns.items():
+                column.append(field_text(record.get(field)))
+            count += 1
+        for field, column in columns.items():
+            self._engines[field].add(column)
+        self._count += count
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Search every field and rank the matching options.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+            limit: Maximum number of results, or None for all matches.
+
+        Returns:
+            Indices of the matching options, best first; ties keep option order.
+        """
+        if not query:
+            return list(range(self._count if limit is None else min(limit, self._count)))
+
+        folded_query = query.casefold()
+        scores: Dict[int, float] = {}
+        for field, weight in self.weights.items():
+            engine = self._engines[field]
+            folded = engine._folded
+            for i in engine.search(query):
+                text = folded[i]
+                if text == folded_query:
+                    score = weight * EXACT_MULTIPLIER
+                elif text.startswith(folded_query):
+                    score = weight * PREFIX_MULTIPLIER
+                else:
+                    score = weight
+                scores[i] = scores.get(i, 0.0) + score
+
+        def rank(i: int) -> Any:
+            return (-scores[i], i)
+
+        if limit is None:
+            return sorted(scores, key=rank)
+        return heapq.nsmallest(limit, scores, key=rank)
+
+    def is_match(self, index: int, query: str) -> bool:
+        """Check whether any searched field of one option contains the query.
+
+        Args:
+            index: The option index.
+            query: Search string; matching is case-insensitive.
+
+        Returns:
+            True if the option exists and one of its fields contains the query.
+        """
+        return any(engine.is_match(index, query) for engine in self._engines.values())
@@ -18,8 +18,18 @@ Example:
 
 from __future__ import annotations
 
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Callable, Generator, Iterable, Iterator, Optional, Sequence, TextIO, TypeVar, Union
+
+from basic_interactive_menu.field_search import NAME_FIELD, NAME_WEIGHT, FieldSearchEngine, check_weights
+from basic_interactive_menu.level import MenuLevel, SearchHit
+from basic_interactive_menu.options import LazyOptionTable, OptionTable
+from basic_interactive_menu.search import SEARCH_MODES, SearchEngine, _summarize
+from basic_interactive_menu.shortcuts import ShortcutMap
+
+T = TypeVar('T')
 
 
 class InteractiveMenu:
@@ -33,6 +43,8 @@ class InteractiveMenu:
         DEFAULT_TITLE: The default title displayed when no title is set.
         DEFAULT_MULTIPLE_ALLOWED: Default setting for multiple selection mode.
         DEBUG: Global debug flag for verbose output.
+        SEARCH_PAGE_SIZE: Search results listed per query on levels
+            without a page size.
 
     Example:
         >>> menu = InteractiveMenu()
@@ -48,6 +60,7 @@ class InteractiveMenu:
     DEFAULT_TITLE: str = "Choose an option"
     DEFAULT_MULTIPLE_ALLOWED: bool = False
     DEBUG: bool = False
+    SEARCH_PAGE_SIZE: int = 20
 
     def __init__(self, multiple_allowed: bool = False, debug: bool = False) -> None:
         """Initialize an InteractiveMenu instance.
@@ -58,20 +71,56 @@ class InteractiveMenu:
             debug: Enable debug output for troubleshooting. Defaults to False.
         """
         self.current_index: int = 0
-        self.options: List[List[Dict[str, str]]] = [[]]
-        self.menu_title: List[str] = [self.DEFAULT_TITLE]
-        self.multiple_allowed: List[bool] = [multiple_allowed]
+        self.levels: List[MenuLevel] = [MenuLevel(self.DEFAULT_TITLE, multiple_allowed)]
         self.DEBUG: bool = debug
-        self.keys: List[Optional[str]] = [None]
-        self.results: List[Optional[Union[str, List[str]]]] = [None]
-        self.shortcuts: List[Dict[str, int]] = [{}]
         self.quit: bool = False
         self.end: bool = False
+        self._spare_level: Optional[MenuLevel] = None  # Popped level kept for reuse
 
         # v0.3 features
-        self.search_enabled: List[bool] = [False]
-        self.groups: List[List] = [[]]  # List of group renderers per level
         self.theme: Any = None  # Will be set by set_theme()
+        self.output: Optional[TextIO] = None  # None writes to the current sys.stdout
+        self.input_reader: Optional[Callable[[str], str]] = None  # None reads with input()
+        self.headless: bool = False  # True skips rendering and all output
+        self.global_search_enabled: bool = False  # '//' searches every level
+
+    @property
+    def _level(self) -> MenuLevel:
+        """The MenuLevel record of the current depth."""
+        return self.levels[self.current_index]
+
+    # Per-level views kept for backwards compatibility; each builds a new list.
+    @property
+    def options(self) -> List[OptionTable]:
+        return [level.options for level in self.levels]
+
+    @property
+    def menu_title(self) -> List[str]:
+        return [level.title for level in self.levels]
+
+    @property
+    def multiple_allowed(self) -> List[bool]:
+        return [level.multiple_allowed for level in self.levels]
+
+    @property
+    def keys(self) -> List[Optional[str]]:
+        return [level.key for level in self.levels]
+
+    @property
+    def results(self) -> List[Optional[Union[str, List[str]]]]:
+        return [level.result for level in self.levels]
+
+    @property
+    def shortcuts(self) -> List[ShortcutMap]:
+        return [level.shortcuts for level in self.levels]
+
+    @property
+    def search_enabled(self) -> List[bool]:
+        return [level.search_enabled for level in self.levels]
+
+    @property
+    def groups(self) -> List[List[Any]]:
+        return [level.groups for level in self.levels]
 
     def has_quit(self) -> bool:
         return self.quit
@@ -92,7 +141,7 @@ class InteractiveMenu:
         """
         if self.quit:
             return self
-        self.keys[self.current_index] = key
+        self._level.key = key
         return self
 
     def set_title(self, title_text: str) -> 'InteractiveMenu':
@@ -106,51 +155,95 @@ class InteractiveMenu:
         """
         if self.quit:
             return self
-        self.menu_title[self.current_index] = title_text
+        self._level.title = title_text
         return self
 
-    def add_option(self, name: str, shortcut: Optional[str] = None) -> 'InteractiveMenu':
+    def add_option(self, name: str, shortcut: Optional[str] = None, **fields: Any) -> 'InteractiveMenu':
         """Add a single option to the current menu.
 
         Args:
             name: The display name of the option.
             shortcut: Optional single-character shortcut key. If None, auto-generated
                 from the first alphabetic character of the name.
+            **fields: Optional searchable fields such as ``sku``, ``aliases``
+                or ``description``. They are stored beside the option,
+                never displayed, and searched when passed to
+                ``enable_search(fields=...)``.
 
         Returns:
             Self, for method chaining.
         """
         if self.quit:
             return self
-        option_index = len(self.options[self.current_index])
-        self.options[self.current_index].append({'name': name})
+        option_index = len(self._level.options)
+        self._level.options.append(name, **fields)
+        self._options_added(option_index)
 
         if shortcut is not None:
             shortcut = shortcut.lower()
-            if shortcut in self.shortcuts[self.current_index]:
-                existing_idx = self.shortcuts[self.current_index][shortcut]
-                raise ValueError(f"Shortcut '{shortcut}' conflicts with option at index {existing_idx}")
-            self.shortcuts[self.current_index][shortcut] = option_index
+            self._level.shortcuts.assign(shortcut, option_index)
 
         if self.DEBUG:
             print(f"Added option: {name} (shortcut: {shortcut})")
         return self
 
-    def add_options(self, items: List[str]) -> 'InteractiveMenu':
+    def add_options(self, items: Iterable[str]) -> 'InteractiveMenu':
         """Add multiple options to the current menu.
 
+        The options are appended in a single pass, so any iterable works,
+        including generators that are consumed exactly once.
+
         Args:
-            items: A list of option display names to add.
+            items: An iterable of option display names to add.
 
         Returns:
             Self, for method chaining.
         """
         if self.quit:
             return self
-        for item in items:
-            self.add_option(item)
+        options = self._level.options
+        first_index = len(options)
+        options.extend(items)
+        self._options_added(first_index)
         if self.DEBUG:
-            print(f"Added options: {items}")
+            print(f"Added options: {options[first_index:]}")
+        return self
+
+    def add_option_source(self, provider: Any,
+                          cache_size: int = LazyOptionTable.DEFAULT_CACHE_SIZE) -> 'InteractiveMenu':
+        """Add options that are produced lazily by a provider.
+
+        The provider is only read as rendering, search or selection needs
+        entries, so large directories or datasets are not enumerated up
+        front. It can be a sequence supporting ``__getitem__``/``__len__``
+        (entries are fetched by index and at most ``cache_size`` are kept),
+        an iterator or iterable (entries are pulled in order as far as
+        needed), or a callable returning either, which is called on first
+        use. Entries are converted with ``str()``.
+
+        Options from a source get no auto-generated shortcuts; combine it
+        with ``set_page_size()`` to keep frames independent of its size.
+
+        Args:
+            provider: The option provider.
+            cache_size: Maximum number of sequence entries kept materialized.
+
+        Returns:
+            Self, for method chaining.
+
+        Raises:
+            ValueError: If the level already has an option source.
+        """
+        if self.quit:
+            return self
+        level = self._level
+        if level.options.is_lazy():
+            raise ValueError("Menu level already has an option source")
+        level.options = LazyOptionTable(provider, cache_size=cache_size, prefix=level.options)
+        level.first_index = None
+        level.search_engine = None
+        level.field_search_engine = None
+        self._invalidate_render()
         return self
 
     def allow_multiple(self) -> 'InteractiveMenu':
@@ -164,21 +257,160 @@ class InteractiveMenu:
         """
         if self.quit:
             return self
-        self.multiple_allowed[self.current_index] = True
+        self._level.multiple_allowed = True
         if self.DEBUG:
-            print(f"Allow multiple: {self.multiple_allowed[self.current_index]}")
+            print(f"Allow multiple: {self._level.multiple_allowed}")
         return self
 
-    def enable_search(self) -> 'InteractiveMenu':
+    def enable_search(self, mode: str = 'substring',
+                      fields: Optional[Dict[str, float]] = None, typos: int = 0) -> 'InteractiveMenu':
         """Enable search functionality for the current menu.
 
         When enabled, users can press '/' to enter search mode and
         filter options by typing a query string.
 
+        Args:
+            mode: 'substring' lists every option containing the query, in
+                menu order. 'fuzzy' matches the query as a subsequence
+                (so "mgrta" finds "Margherita") and lists the best
+                matches ranked. 'words' lists the options having a word
+                that starts with each query word (so "veg bur" finds
+                "Veggie Burger"), in menu order.
+            fields: Weights of option fields (set with ``add_option(...,
+                **fields)``) searched besides the name, e.g.
+                ``{'sku': 2.0, 'description': 0.5}``. Substring matches in
+                any field are then listed ranked by the summed weights of
+                the matching fields; the name has weight 1.0 unless
+                ``'name'`` is given.
+            typos: When a query finds nothing, list the option names whose
+                words are each within this many edits of a query word (so
+                "magherita" finds "Margherita"), closest first. 0 disables
+                the fallback.
+
+        Returns:
+            Self, for method chaining.
+
+        Raises:
+            ValueError: If mode is not a known search mode, fields are
+                combined with fuzzy mode, a weight is not positive, or
+                typos is negative.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}', expected one of {', '.join(SEARCH_MODES)}")
+        if fields is not None:
+            if mode != 'substring':
+                raise ValueError("Search fields require substring search mode")
+            fields = {NAME_FIELD: NAME_WEIGHT, **fields}
+            check_weights(fields)
+        if typos < 0:
+            raise ValueError(f"Typos must not be negative, got {typos}")
+        self._level.search_enabled = True
+        self._level.search_mode = mode
+        self._level.search_fields = fields
+        self._level.field_search_engine = None
+        self._level.search_typos = typos
+        return self
+
+    def enable_global_search(self) -> 'InteractiveMenu':
+        """Enable '//' search across every level of the menu.
+
+        Typing '//' searches the options of all levels built so far (for
+        example after returning to a parent with 'r') and lists each hit
+        with its path: the selections of the levels above it followed by
+        the option. Choosing a hit selects it on its level, keeping those
+        ancestor selections, and continues with the level after it.
+
+        Returns:
+            Self, for method chaining.
+        """
+        if self.quit:
+            return self
+        self.global_search_enabled = True
+        return self
+
+    def iter_search_all(self, query: str, limit: Optional[int] = None) -> Iterator[SearchHit]:
+        """Yield the options of every level that contain the query.
+
+        Each level's search index is built on the first search that
+        reaches it and extended as options are added, so it is shared with
+        '/' search on that level.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+            limit: Maximum number of hits to yield, or None for all.
+
+        Returns:
+            Iterator over the hits, by depth and then option index.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit must not be negative, got {limit}")
+        return islice(self._iter_hits(query), limit)
+
+    def _iter_hits(self, query: str) -> Iterator[SearchHit]:
+        """Generate the hits of ``iter_search_all()``.
+
+        Args:
+            query: Search string.
+
+        Yields:
+            The hits, by depth and then option index.
+        """
+        path: List[str] = []
+        for depth, level in enumerate(self.levels):
+            if level.options.has_index(0):
+                engine = self._search_engine(level)
+                ancestors = tuple(path)
+                for index in engine.iter_search(query):
+                    name = engine.options[index]
+                    yield SearchHit(depth, index, name, ancestors + (name,))
+            result = level.result
+            path.append(", ".join(result) if isinstance(result, list) else str(result))
+
+    def use_search_index(self, path: Union[str, Path]) -> 'InteractiveMenu':
+        """Keep the current menu's search index in a file.
+
+        On the first search the index is memory-mapped from ``path``
+        instead of being built; if the file is missing or was written for
+        different options, the index is built and saved there for next
+        time. Useful for large, rarely changing option lists.
+
+        Args:
+            path: The index file.
+
+        Returns:
+            Self, for method chaining.
+        """
+        if self.quit:
+            return self
+        self._level.search_index_path = Path(path)
+        self._level.search_engine = None
+        return self
+
+    def set_page_size(self, size: Optional[int]) -> 'InteractiveMenu':
+        """Render the current menu one page of options at a time.
+
+        In paged mode only the options of the current page are displayed,
+        while index and shortcut selection still work against the full
+        option list. Users navigate with '>' (next page), '<' (previous
+        page), ':N' (go to page N) and '@N' (show the page holding option N).
+
+        Args:
+            size: Number of options per page, or None to show all options.
+
         Returns:
             Self, for method chaining.
+
+        Raises:
+            ValueError: If size is smaller than 1.
         """
-        self.search_enabled[self.current_index] = True
+        if size is not None and size < 1:
+            raise ValueError(f"Page size must be at least 1, got {size}")
+        self._level.page_size = size
+        self._level.page = 0
+        self._invalidate_render()
         return self
 
     def add_group(self, name: str, options: List[str]) -> 'InteractiveMenu':
@@ -201,7 +433,7 @@ class InteractiveMenu:
             raise ValueError(f"Group '{name}' cannot have empty options")
 
         from basic_interactive_menu.groups import OptionGroup
-        self.groups[self.current_index].append(OptionGroup(name=name, options=options))
+        self._level.groups.append(OptionGroup(name=name, options=options))
 
         for option in options:
             self.add_option(option)
@@ -223,13 +455,105 @@ class InteractiveMenu:
             self.theme = get_theme(theme)
         else:
             self.theme = theme
+        self._invalidate_render(all_levels=True)
+        return self
+
+    def set_output(self, stream: Optional[TextIO]) -> 'InteractiveMenu':
+        """Set the stream that menu frames and messages are written to.
+
+        Each frame is written with a single ``write()`` followed by one
+        ``flush()``, which keeps redraws cheap on slow terminals.
+
+        Args:
+            stream: A text stream such as ``sys.stderr`` or ``io.StringIO``.
+                None (the default) writes to whatever ``sys.stdout`` is at
+                the time of writing.
+
+        Returns:
+            Self, for method chaining.
+        """
+        self.output = stream
+        return self
+
+    def set_input(self, reader: Optional[Callable[[str], str]]) -> 'InteractiveMenu':
+        """Set the function used to read answers.
+
+        The function receives the prompt and returns the answer, like the
+        builtin ``input()``. Injecting it per menu avoids patching
+        ``builtins.input`` globally, so menus can be driven from several
+        threads at once.
+
+        Args:
+            reader: The input function, or None to use ``input()``.
+
+        Returns:
+            Self, for method chaining.
+        """
+        self.input_reader = reader
         return self
 
+    def use_script(self, inputs: Iterable[str], render: bool = False) -> 'InteractiveMenu':
+        """Answer all following prompts from a sequence of scripted inputs.
+
+        Args:
+            inputs: The answers, consumed in order. Running out raises
+                EOFError, as ``input()`` does at end of file.
+            render: Whether to keep rendering frames and messages. When
+                False (the default) frames are never built and nothing is
+                written.
+
+        Returns:
+            Self, for method chaining.
+
+        Example:
+            >>> results = (InteractiveMenu()
+            ...            .use_script(["0", "y"])
+            ...            .set_key("fruit")
+            ...            .add_option("Apple")
+            ...            .ask()
+            ...            .get_all_results())
+        """
+        answers = iter(inputs)
+
+        def read(prompt: str) -> str:
+            try:
+                return next(answers)
+            except StopIteration:
+                raise EOFError("Scripted inputs exhausted") from None
+
+        self.input_reader = read
+        self.headless = not render
+        return self
+
+    def run_script(self, inputs: Iterable[str],
+                   render: bool = False) -> Optional[Union[Dict[str, Any], 'InteractiveMenu']]:
+        """Run ask() and get_all_results() with scripted inputs.
+
+        The previous input function and output mode are restored afterwards.
+
+        Args:
+            inputs: The answers, consumed in order.
+            render: Whether to render frames and messages.
+
+        Returns:
+            Same as get_all_results(): the results dictionary once confirmed.
+        """
+        previous = (self.input_reader, self.headless)
+        self.use_script(inputs, render=render)
+        try:
+            return self.ask().get_all_results()
+        finally:
+            self.input_reader, self.headless = previous
+
     @classmethod
     def from_file(cls, file_path: Union[str, Path]) -> 'InteractiveMenu':
         """Create an InteractiveMenu from a configuration file.
 
         Supports JSON and YAML (if pyyaml is installed) file formats.
+        A ``search_index`` entry enables search with its index kept in
+        that file, resolved relative to the configuration file, and a
+        ``search_fields`` entry (field -> weight) enables search over the
+        extra keys of dict options.
 
         Args:
             file_path: Path to the configuration file.
@@ -263,6 +587,16 @@ class InteractiveMenu:
         if key:
             menu.set_key(key)
 
+        search_fields = config.get("search_fields")
+        if search_fields:
+            menu.enable_search(fields=search_fields)
+
+        search_index = config.get("search_index")
+        if search_index:
+            if not search_fields:
+                menu.enable_search()
+            menu.use_search_index(Path(file_path).parent / search_index)
+
         options = config.get("options", [])
         for option in options:
             if isinstance(option, str):
@@ -270,8 +604,10 @@ class InteractiveMenu:
             elif isinstance(option, dict):
                 name = option.get("name")
                 shortcut = option.get("shortcut")
+                fields = {field: value for field, value in option.items()
+                          if field not in ("name", "shortcut")}
                 if name:
-                    menu.add_option(name, shortcut=shortcut)
+                    menu.add_option(name, shortcut=shortcut, **fields)
 
         return menu
 
@@ -279,20 +615,29 @@ class InteractiveMenu:
         """Auto-generate shortcuts for options without explicit shortcuts.
 
         Uses the first unique alphabetic character from each option name.
+        Options scanned by a previous call are skipped: shortcut characters
+        are never released, so an option that found no free character then
+        cannot find one now. Levels backed by an option source are left
+        alone, since scanning them would materialize every option.
         """
-        current_shortcuts = self.shortcuts[self.current_index].copy()
-        used_chars = set(current_shortcuts.keys())
+        shortcuts = self._level.shortcuts
+        options = self._level.options
+        if options.is_lazy():
+            return
+        used_chars = set(shortcuts.keys())
 
-        for idx, option in enumerate(self.options[self.current_index]):
-            if idx in current_shortcuts.values():
+        for idx in range(shortcuts.scanned, len(options)):
+            if shortcuts.has_index(idx):
                 continue
 
-            name = option['name']
+            name = options.name_at(idx)
             for char in name.lower():
                 if char.isalpha() and char not in used_chars:
-                    self.shortcuts[self.current_index][char] = idx
+                    shortcuts.assign(char, idx)
                     used_chars.add(char)
+                    self._invalidate_render()
                     break
+        shortcuts.scanned = len(options)
 
     def _get_option_shortcut(self, index: int) -> Optional[str]:
         """Get the shortcut character for an option by index.
@@ -303,10 +648,7 @@ class InteractiveMenu:
         Returns:
             The shortcut character or None if no shortcut is assigned.
         """
-        for shortcut, idx in self.shortcuts[self.current_index].items():
-            if idx == index:
-                return shortcut
-        return None
+        return self._level.shortcuts.shortcut_for(index)
 
     def _has_parent(self) -> bool:
         if self.DEBUG:
@@ -322,156 +664,617 @@ class InteractiveMenu:
         self._check_index_validity()
 
     def _is_new(self) -> bool:
-        return len(self.options[self.current_index]) == 0
+        return not self._level.options.has_index(0)
 
     def _need_new(self) -> bool:
-        return self.current_index >= len(self.options)
+        return self.current_index >= len(self.levels)
 
     def _is_last(self) -> bool:
         if self.DEBUG:
-            print(f"Is last: {self.current_index} == {len(self.options) - 1}")
-        return self.current_index == len(self.options) - 1
+            print(f"Is last: {self.current_index} == {len(self.levels) - 1}")
+        return self.current_index == len(self.levels) - 1
 
     def _to_next(self) -> None:
         self.current_index += 1
         if self._need_new():
-            self.options.append([])
-            self.menu_title.append(self.DEFAULT_TITLE)
-            self.multiple_allowed.append(self.DEFAULT_MULTIPLE_ALLOWED)
-            self.keys.append(None)
-            self.results.append(None)
-            self.shortcuts.append({})
-            self.search_enabled.append(False)
-            self.groups.append([])
+            level = self._spare_level
+            if level is None:
+                level = MenuLevel(self.DEFAULT_TITLE, self.DEFAULT_MULTIPLE_ALLOWED)
+            else:
+                self._spare_level = None
+                level.reset(self.DEFAULT_TITLE, self.DEFAULT_MULTIPLE_ALLOWED)
+            self.levels.append(level)
         self._check_index_validity()
 
     def _remove_last(self) -> None:
-        self.options.pop()
-        self.menu_title.pop()
-        self.multiple_allowed.pop()
-        self.keys.pop()
-        self.results.pop()
-        self.shortcuts.pop()
-        self.search_enabled.pop()
-        self.groups.pop()
+        self._spare_level = self.levels.pop()
         self.current_index -= 1
         self._check_index_validity()
 
     def _check_index_validity(self) -> None:
         if self.DEBUG:
-            print(f"Checking index validity: {self.current_index} in range (0, {len(self.options)})")
-        assert 0 <= self.current_index < len(self.options), "Invalid index, something went wrong"
+            print(f"Checking index validity: {self.current_index} in range (0, {len(self.levels)})")
+        assert 0 <= self.current_index < len(self.levels), "Invalid index, something went wrong"
 
     def _is_multiple_allowed(self) -> bool:
-        return self.multiple_allowed[self.current_index]
+        return self._level.multiple_allowed
 
-    def _print_history(self) -> None:
-        if not self._has_parent():
+    def _run_flow(self, flow: Generator[str, str, T]) -> T:
+        """Run a prompt flow to completion, answering each prompt with the input function.
+
+        Args:
+            flow: A generator yielding prompts and receiving the answers.
+
+        Returns:
+            The flow's return value.
+        """
+        read = self.input_reader if self.input_reader is not None else input
+        try:
+            prompt = next(flow)
+            while True:
+                prompt = flow.send(read(prompt))
+        except StopIteration as stop:
+            return stop.value
+
+    async def _run_flow_async(self, flow: Generator[str, str, T], reader: Any) -> T:
+        """Run a prompt flow to completion, awaiting each answer from ``reader``.
+
+        Args:
+            flow: A generator yielding prompts and receiving the answers.
+            reader: An object with an ``async readline()`` method returning
+                bytes or str, such as ``asyncio.StreamReader``. None reads
+                from stdin without blocking the event loop for this flow
+                and restores stdin afterwards.
+
+        Returns:
+            The flow's return value.
+
+        Raises:
+            EOFError: If the reader reaches end of input before the flow ends.
+        """
+        stdin_reader = None
+        if reader is None:
+            from basic_interactive_menu.async_input import connect_stdin
+
+            reader = stdin_reader = await connect_stdin()
+        try:
+            prompt = next(flow)
+            while True:
+                self._write(prompt)
+                line = await reader.readline()
+                if not line:
+                    raise EOFError("EOF while waiting for menu input")
+                if isinstance(line, bytes):
+                    line = line.decode()
+                prompt = flow.send(line.rstrip("\r\n"))
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            if stdin_reader is not None:
+                stdin_reader.close()
+
+    def _write(self, text: str) -> None:
+        """Write text to the output stream with a single write and flush."""
+        if self.headless:
             return
-        print("History:", end=" ")
+        stream = self.output if self.output is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def _render_history(self) -> str:
+        if not self._has_parent():
+            return ""
+        parts = ["History: "]
         for i in range(self.current_index):
             if i > 0:
-                print("->", end=" ")
-            key = self.keys[i]
-            result = self.results[i]
+                parts.append("-> ")
+            key = self.levels[i].key
+            result = self.levels[i].result
             if key is not None:
-                print(f"{key}=", end="")
+                parts.append(f"{key}=")
             if isinstance(result, list):
-                print("[" + ", ".join(result) + "]", end=" ")
+                parts.append("[" + ", ".join(result) + "] ")
             elif result is not None:
-                print(result, end=" ")
-        print()
+                parts.append(f"{result} ")
+        parts.append("\n")
+        return "".join(parts)
 
     def _save_result_once(self, value: Union[str, List[str]]) -> None:
-        self.results[self.current_index] = value
+        self._level.result = value
         if self.DEBUG:
-            print(f"Saved result: {self.keys[self.current_index]} = {value}")
+            print(f"Saved result: {self._level.key} = {value}")
             print(f"Now results: {self.results}")
         self._to_next()
 
-    def _handle_search_mode(self) -> None:
+    def _search_flow(self) -> Generator[str, str, bool]:
         """Handle interactive search mode for filtering options.
 
         Users can type a query string and see matching options.
         Press Enter to select from filtered results, '/' again or Esc to exit search.
-        """
-        from basic_interactive_menu.search import SearchEngine
 
-        option_names = [opt['name'] for opt in self.options[self.current_index]]
-        engine = SearchEngine(option_names)
+        Yields:
+            Prompts; the answer to each prompt is sent back in.
+
+        Returns:
+            True if an option was selected, False if search was exited.
+        """
+        level = self._level
+        searcher: Union[SearchEngine, FieldSearchEngine]
+        if level.search_fields is None:
+            engine = searcher = self._search_engine()
+            option_names: Sequence[str] = engine.options
+        else:
+            searcher = self._field_search_engine()
+            option_names = level.options.names()
 
         while True:
             prompt = "Filter: "
             if self.theme:
                 prompt = self.theme.apply_prompt("Filter: ")
-            query = input(prompt).strip().lower()
+            query = (yield prompt).strip()
 
             # Exit search mode with '/' again or empty input
             if query == '/' or query == '':
-                print("Exited search mode")
-                return
+                self._write("Exited search mode\n")
+                return False
+
+            mode = level.search_mode
+            results: Optional[Iterator[int]] = None
+            page_size = level.page_size or self.SEARCH_PAGE_SIZE
+            approximate = False
+            if mode == 'fuzzy':
+                matches = engine.fuzzy_search(query)
+            else:
+                if mode == 'words':
+                    results = iter(engine.token_search(query))
+                elif isinstance(searcher, FieldSearchEngine):
+                    # Ranking needs every match; only a page is listed
+                    results = iter(searcher.search(query))
+                else:
+                    # Only the first page is searched before it is displayed
+                    results = searcher.iter_search(query)
+                matches = list(islice(results, page_size))
 
-            matches = engine.search(query)
+            if not matches and level.search_typos:
+                # Fall back to the closest option names within the allowed edits
+                matches = self._search_engine().approximate_search(
+                    query, level.search_typos, limit=page_size)
+                results = None
+                approximate = True
 
             if not matches:
-                print("No matches found. Try again or '/' to exit.")
+                self._write("No matches found. Try again or '/' to exit.\n")
                 continue
 
             # Display filtered results
-            print(f"\n{engine.get_matches_summary(query)}")
-            print("-" * 30)
-            for idx in matches:
-                shortcut = self._get_option_shortcut(idx)
-                if shortcut:
-                    print(f"[{idx}/{shortcut.upper()}]: {option_names[idx]}")
+            if not self.headless:
+                extra = None if results is None else next(results, None)
+                if approximate:
+                    header = "No exact matches; did you mean:"
+                elif extra is None:
+                    header = _summarize(option_names, matches)
                 else:
-                    print(f"[{idx}]: {option_names[idx]}")
+                    header = f"First {len(matches)} matches"
+                lines = [f"\n{header}", "-" * 30]
+                for idx in matches:
+                    shortcut = self._get_option_shortcut(idx)
+                    if shortcut:
+                        lines.append(f"[{idx}/{shortcut.upper()}]: {option_names[idx]}")
+                    else:
+                        lines.append(f"[{idx}]: {option_names[idx]}")
+                self._write("\n".join(lines) + "\n")
+                if results is not None and extra is not None:
+                    # Counted after the first page is on screen
+                    total = len(matches) + 1 + sum(1 for _ in results)
+                    self._write(f"{total} matches available; refine the query to narrow them\n")
 
             # Get selection from filtered results
             prompt = "Select (or '/' to search again): "
             if self.theme:
                 prompt = self.theme.apply_prompt("Select (or '/' to search again): ")
-            select = input(prompt).strip().lower()
+            select = (yield prompt).strip().lower()
 
             if select == '/':
                 continue  # Search again
-            elif select.isdigit() and int(select) in matches:
+            elif select.isdigit() and (int(select) in matches if approximate
+                                       else self._search_accepts(searcher, int(select), query, matches)):
                 selected_index = int(select)
                 if self._is_multiple_allowed():
-                    self._save_result_once([self.options[self.current_index][selected_index]['name']])
+                    self._save_result_once([option_names[selected_index]])
                 else:
-                    self._save_result_once(self.options[self.current_index][selected_index]['name'])
-                return
+                    self._save_result_once(option_names[selected_index])
+                return True
             else:
-                print("Invalid selection. Try again.")
+                self._write("Invalid selection. Try again.\n")
+
+    def _search_accepts(self, searcher: Union[SearchEngine, FieldSearchEngine], index: int,
+                        query: str, matches: List[int]) -> bool:
+        """Check whether an option may be selected after searching for a query.
+
+        Args:
+            searcher: The level's search engine.
+            index: The entered option index.
+            query: The search query.
+            matches: The listed matches.
+
+        Returns:
+            True if the option matches the query in the level's search mode.
+        """
+        mode = self._level.search_mode
+        if mode == 'fuzzy':
+            # Only the ranked results are fuzzy matches worth choosing
+            return index in matches
+        if mode == 'words':
+            assert isinstance(searcher, SearchEngine)
+            return searcher.is_token_match(index, query)
+        return searcher.is_match(index, query)
 
-    def _print_groups(self) -> None:
-        """Print options organized by groups.
+    def _global_search_flow(self) -> Generator[str, str, bool]:
+        """Handle '//' search across every menu level.
 
-        For menus with groups, displays headers and options with
-        proper global indexing.
+        Hits are numbered in the order listed; choosing one selects its
+        option on its own level.
+
+        Yields:
+            Prompts; the answer to each prompt is sent back in.
+
+        Returns:
+            True if a hit was selected, False if search was exited.
+        """
+        while True:
+            prompt = "Search all levels: "
+            if self.theme:
+                prompt = self.theme.apply_prompt("Search all levels: ")
+            query = (yield prompt).strip()
+
+            if query in ('/', '//', ''):
+                self._write("Exited search mode\n")
+                return False
+
+            # Only the first page is searched before it is displayed
+            results = self.iter_search_all(query)
+            hits = list(islice(results, self.SEARCH_PAGE_SIZE))
+            if not hits:
+                self._write("No matches found. Try again or '//' to exit.\n")
+                continue
+
+            if not self.headless:
+                extra = next(results, None)
+                if extra is not None:
+                    header = f"First {len(hits)} matches on all levels"
+                elif len(hits) == 1:
+                    header = "1 match on all levels"
+                else:
+                    header = f"{len(hits)} matches on all levels"
+                lines = [f"\n{header}", "-" * 30]
+                lines.extend(f"[{number}]: {hit}" for number, hit in enumerate(hits))
+                self._write("\n".join(lines) + "\n")
+                if extra is not None:
+                    total = len(hits) + 1 + sum(1 for _ in results)
+                    self._write(f"{total} matches available; refine the query to narrow them\n")
+
+            prompt = "Select (or '//' to search again): "
+            if self.theme:
+                prompt = self.theme.apply_prompt("Select (or '//' to search again): ")
+            select = (yield prompt).strip()
+
+            if select in ('/', '//'):
+                continue
+            elif select.isdigit() and int(select) < len(hits):
+                hit = hits[int(select)]
+                self.current_index = hit.depth
+                if self._is_multiple_allowed():
+                    self._save_result_once([hit.name])
+                else:
+                    self._save_result_once(hit.name)
+                return True
+            else:
+                self._write("Invalid selection. Try again.\n")
+
+    def _search_engine(self, level: Optional[MenuLevel] = None) -> SearchEngine:
+        """Get the search index of a level, building it on first use.
+
+        The index is kept on the level and extended as options are added,
+        so later search sessions and returns via 'r' reuse it. With
+        ``use_search_index()`` it is loaded from (or saved to) a file.
+
+        Args:
+            level: The level; defaults to the current one.
+
+        Returns:
+            The level's search engine.
+        """
+        if level is None:
+            level = self._level
+        if level.search_engine is None:
+            names = level.options.names()
+            path = level.search_index_path
+            engine = None
+            if path is not None:
+                try:
+                    engine = SearchEngine.load(path, options=names)
+                except (OSError, ValueError):
+                    # Missing, unreadable or stale: build it in memory instead
+                    pass
+            if engine is None:
+                engine = SearchEngine(names)
+                if path is not None:
+                    # Saved outside the except block so no traceback keeps
+                    # a failed load's frames alive while the file is replaced
+                    try:
+                        engine.save(path)
+                    except OSError:
+                        # The file is only a cache; search works without it
+                        pass
+            level.search_engine = engine
+        return level.search_engine
+
+    def _field_search_engine(self) -> FieldSearchEngine:
+        """Get the field search index of the current level, building it on first use.
+
+        Returns:
+            The level's field search engine.
+        """
+        level = self._level
+        assert level.search_fields is not None
+        if level.field_search_engine is None:
+            level.field_search_engine = FieldSearchEngine(self._field_records(0), level.search_fields)
+        return level.field_search_engine
+
+    def _field_records(self, first_index: int) -> Iterator[Dict[str, Any]]:
+        """Read the searched fields of the current level's options.
+
+        Args:
+            first_index: Index of the first option to read.
+
+        Yields:
+            The searched field values of each option from ``first_index``.
+        """
+        level = self._level
+        options = level.options
+        fields = [field for field in level.search_fields or () if field != NAME_FIELD]
+        for index, name in enumerate(options.names()[first_index:], first_index):
+            record = {field: options.metadata_at(index, field) for field in fields}
+            record[NAME_FIELD] = name
+            yield record
+
+    def _options_added(self, first_index: int) -> None:
+        """Update derived per-level state after options were appended.
+
+        Args:
+            first_index: Index of the first new option.
+        """
+        self._invalidate_render()
+        level = self._level
+        if level.first_index is not None:
+            names = level.first_index
+            for idx, name in enumerate(level.options[first_index:], first_index):
+                names.setdefault(name, idx)
+        if level.search_engine is not None:
+            level.search_engine.add(level.options[first_index:])
+        if level.field_search_engine is not None:
+            level.field_search_engine.add(self._field_records(first_index))
+
+    def _render_groups(self, lines: List[str], start: int = 0, stop: Optional[int] = None) -> int:
+        """Render options organized by groups.
+
+        For menus with groups, appends headers and options with
+        proper global indexing to ``lines``. Only options whose global
+        index falls in ``[start, stop)`` are rendered.
+
+        Returns:
+            The number of option rows rendered.
         """
         from basic_interactive_menu.groups import GroupRenderer
 
         renderer = GroupRenderer()
 
-        # Build groups from options
-        option_names = [opt['name'] for opt in self.options[self.current_index]]
-        for group in self.groups[self.current_index]:
+        # Name -> first option index, kept on the level so a paged frame
+        # costs the page, not a pass over every option
+        level = self._level
+        first_index = level.first_index
+        if first_index is None:
+            first_index = {}
+            for idx, name in enumerate(level.options):
+                first_index.setdefault(name, idx)
+            level.first_index = first_index
+        for group in level.groups:
             renderer.add_group(group.name, group.options)
 
-        global_index = 0
-        for group_idx, group in enumerate(renderer.groups):
-            print(renderer.render_header(group))
-            for option in group.options:
+        rendered = 0
+        group_start = 0
+        for group in renderer.groups:
+            count = len(group.options)
+            first = max(start - group_start, 0)
+            last = count if stop is None else min(count, stop - group_start)
+            if first < last:
+                lines.append(renderer.render_header(group))
+            for local_index in range(first, last):
+                option = group.options[local_index]
                 # Find the actual index of this option
-                actual_index = option_names.index(option)
+                actual_index = first_index[option]
                 shortcut = self._get_option_shortcut(actual_index)
                 if shortcut:
-                    print(renderer.render_option(global_index, option, shortcut))
+                    lines.append(renderer.render_option(group_start + local_index, option, shortcut))
+                else:
+                    lines.append(renderer.render_option(group_start + local_index, option))
+                rendered += 1
+            group_start += count
+        return rendered
+
+    def _render_options(self, lines: List[str], start: int = 0, stop: Optional[int] = None) -> int:
+        """Render the options of the current level in ``[start, stop)``, one line each.
+
+        Returns:
+            The number of option rows rendered.
+        """
+        theme = self.theme
+        names = self._level.options[start:stop]
+        for idx, name in enumerate(names, start):
+            shortcut = self._get_option_shortcut(idx)
+            if theme:
+                if shortcut:
+                    lines.append(f"[{idx}/{theme.apply_shortcut(shortcut.upper())}]: {theme.apply_option(name)}")
+                else:
+                    lines.append(f"[{idx}]: {theme.apply_option(name)}")
+            else:
+                if shortcut:
+                    lines.append(f"[{idx}/{shortcut.upper()}]: {name}")
                 else:
-                    print(renderer.render_option(global_index, option))
-                global_index += 1
+                    lines.append(f"[{idx}]: {name}")
+        return len(names)
+
+    def _invalidate_render(self, all_levels: bool = False) -> None:
+        """Drop memoized option rows so the next frame re-renders them.
+
+        Args:
+            all_levels: Invalidate every level instead of only the current one.
+        """
+        if all_levels:
+            for level in self.levels:
+                level.option_block = None
+        else:
+            self._level.option_block = None
+
+    def _option_block(self) -> str:
+        """Return the rendered option rows of the current level.
+
+        The block is memoized per level, so re-prompting after invalid input
+        reuses it instead of formatting every row again.
+        """
+        block = self._level.option_block
+        if block is None:
+            lines: List[str] = []
+            size = self._level.page_size
+            if size is None:
+                start, stop = 0, None
+            else:
+                start = self._level.page * size
+                stop = start + size
+            if self._level.groups:
+                rendered = self._render_groups(lines, start, stop)
+            else:
+                rendered = self._render_options(lines, start, stop)
+            if size is not None:
+                count = self._option_count()
+                pages = self._page_count()
+                lines.append(f"Page {self._level.page + 1}/{'?' if pages is None else pages} "
+                             f"(options {start}-{start + max(rendered - 1, 0)} of "
+                             f"{'?' if count is None else count})")
+            block = "".join(line + "\n" for line in lines)
+            self._level.option_block = block
+        return block
+
+    def _option_count(self) -> Optional[int]:
+        """Return the number of displayed option rows, or None while unknown.
+
+        The count is unknown for option sources that have not been read to
+        the end yet.
+        """
+        if self._level.groups:
+            return sum(group.option_count() for group in self._level.groups)
+        options = self._level.options
+        return len(options) if options.length_known() else None
+
+    def _has_row(self, index: int) -> bool:
+        """Check whether the current level displays an option row at ``index``."""
+        if self._level.groups:
+            return 0 <= index < sum(group.option_count() for group in self._level.groups)
+        return self._level.options.has_index(index)
+
+    def _page_count(self) -> Optional[int]:
+        size = self._level.page_size
+        if size is None:
+            return 1
+        count = self._option_count()
+        if count is None:
+            return None
+        return max((count + size - 1) // size, 1)
+
+    def _go_to_page(self, page: int) -> None:
+        self._level.page = page
+        self._invalidate_render()
+
+    def _handle_page_command(self, choice: str) -> bool:
+        """Handle a paging command in paged mode.
+
+        Args:
+            choice: The (lowercased) user input.
+
+        Returns:
+            True if the input was a paging command, False otherwise.
+        """
+        size = self._level.page_size
+        if size is None:
+            return False
+        page = self._level.page
+        if choice == '>':
+            if self._has_row((page + 1) * size):
+                self._go_to_page(page + 1)
+            else:
+                self._write("Already on the last page.\n")
+            return True
+        if choice == '<':
+            if page > 0:
+                self._go_to_page(page - 1)
+            else:
+                self._write("Already on the first page.\n")
+            return True
+        if len(choice) > 1 and choice[0] == ':' and choice[1:].isdigit():
+            target = int(choice[1:])
+            if target == 1 or (target > 1 and self._has_row((target - 1) * size)):
+                self._go_to_page(target - 1)
+            else:
+                pages = self._page_count()
+                if pages is None:
+                    self._write(f"Page {target} does not exist.\n")
+                else:
+                    self._write(f"Page must be between 1 and {pages}.\n")
+            return True
+        if len(choice) > 1 and choice[0] == '@' and choice[1:].isdigit():
+            target = int(choice[1:])
+            if self._has_row(target):
+                self._go_to_page(target // size)
+            else:
+                self._write(f"Option {target} does not exist.\n")
+            return True
+        return False
+
+    def render(self) -> str:
+        """Render the current menu level as a single frame.
+
+        The frame contains the step title, history, options and the
+        available commands, exactly as ``ask()`` displays it.
+
+        Returns:
+            The complete frame text, ending with a newline.
+        """
+        parts = [
+            "\n" + "-" * 30 + "\n",
+            f"Step {self.current_index + 1}:  {self._level.title}\n",
+            "-" * 30 + "\n",
+            self._render_history(),
+        ]
+
+        # Apply theme if set
+        if self.theme:
+            parts.append(self.theme.apply_border("-" * 30) + "\n")
+
+        # Option rows come from the per-level cache
+        parts.append(self._option_block())
+
+        parts.append("[q]: Quit\n")
+        if self._has_parent():
+            parts.append("[r]: Return to parent\n")
+        if self._is_multiple_allowed():
+            parts.append("[*]: Enter indices (e.g., 0 1,2) to select multiple\n")
+        if self._level.search_enabled:
+            parts.append("[/]: Search\n")
+        if self.global_search_enabled:
+            parts.append("[//]: Search all levels\n")
+        if self._level.page_size is not None:
+            parts.append("[</>]: Previous/next page (:N go to page N, @N show option N)\n")
+        return "".join(parts)
 
     def ask(self, title: Optional[str] = None, key: Optional[str] = None) -> 'InteractiveMenu':
         """Display the menu and prompt for user input.
@@ -491,15 +1294,24 @@ class InteractiveMenu:
         Returns:
             Self, for method chaining.
         """
+        self._run_flow(self._ask_flow(title, key))
+        return self
+
+    def _ask_flow(self, title: Optional[str], key: Optional[str]) -> Generator[str, str, None]:
+        """Run one ask() session independently of how input is read.
+
+        Yields:
+            Prompts; the answer to each prompt is sent back in.
+        """
         # If this is a restart, we need to reset the state
-        if self.end and self.current_index == 0 and len(self.options[0]) == 0:
+        if self.end and self.current_index == 0 and not self.levels[0].options.has_index(0):
             # This is a restart, reset everything
             self.end = False
             
         if self.DEBUG:
             print(f"Asking with ended {self.end} and quit {self.quit}")
         if self.quit:
-            return self
+            return
         if key is not None:
             self.set_key(key)
         if title is not None:
@@ -509,66 +1321,48 @@ class InteractiveMenu:
         self._auto_generate_shortcuts()
 
         while True:
-            print("\n" + "-" * 30)
-            print(f"Step {self.current_index + 1}: ", self.menu_title[self.current_index])
-            print("-" * 30)
-            self._print_history()
-
-            # Apply theme if set
-            if self.theme:
-                print(self.theme.apply_border("-" * 30))
-
-            # Display groups or regular options
-            if self.groups[self.current_index]:
-                self._print_groups()
-            else:
-                for idx, option in enumerate(self.options[self.current_index]):
-                    shortcut = self._get_option_shortcut(idx)
-                    if self.theme:
-                        if shortcut:
-                            print(f"[{idx}/{self.theme.apply_shortcut(shortcut.upper())}]: {self.theme.apply_option(option['name'])}")
-                        else:
-                            print(f"[{idx}]: {self.theme.apply_option(option['name'])}")
-                    else:
-                        if shortcut:
-                            print(f"[{idx}/{shortcut.upper()}]: {option['name']}")
-                        else:
-                            print(f"[{idx}]: {option['name']}")
-
-            print("[q]: Quit")
-            if self._has_parent():
-                print("[r]: Return to parent")
-            if self._is_multiple_allowed():
-                print("[*]: Enter indices (e.g., 0 1,2) to select multiple")
-            if self.search_enabled[self.current_index]:
-                print("[/]: Search")
+            if not self.headless:
+                self._write(self.render())
 
             prompt = "Choose an option: "
             if self.theme:
                 prompt = self.theme.apply_prompt("Choose an option: ")
-            choice = input(prompt).strip().lower()
+            choice = (yield prompt).strip().lower()
+
+            # Search across every level
+            if self.global_search_enabled and choice == '//':
+                selected = yield from self._global_search_flow()
+                if selected and self._is_new():
+                    return
+                continue
 
             # Search mode
-            if self.search_enabled[self.current_index] and choice == '/':
-                self._handle_search_mode()
+            if self._level.search_enabled and choice == '/':
+                selected = yield from self._search_flow()
+                if selected and self._is_new():
+                    return
+                continue
+
+            # Paging commands
+            if self._handle_page_command(choice):
                 continue
 
             # Check for single-character shortcut
-            if len(choice) == 1 and choice.isalpha() and choice in self.shortcuts[self.current_index]:
-                selected_index = self.shortcuts[self.current_index][choice]
+            if len(choice) == 1 and choice.isalpha() and choice in self._level.shortcuts:
+                selected_index = self._level.shortcuts[choice]
                 if self._is_multiple_allowed():
-                    self._save_result_once([self.options[self.current_index][selected_index]['name']])
+                    self._save_result_once([self._level.options.name_at(selected_index)])
                 else:
-                    self._save_result_once(self.options[self.current_index][selected_index]['name'])
+                    self._save_result_once(self._level.options.name_at(selected_index))
                 if self._is_new():
-                    return self
+                    return
                 continue
             elif choice == 'q':
-                print("Exiting...")
+                self._write("Exiting...\n")
                 self.quit = True
-                return self
+                return
             elif self._has_parent() and choice == 'r':
-                print("\nReturning to parent menu...\n")
+                self._write("\nReturning to parent menu...\n\n")
                 self._to_parent()
                 continue
             elif self._is_multiple_allowed():
@@ -576,26 +1370,63 @@ class InteractiveMenu:
                 try:
                     indices_str = selected_indices_input.replace(',', ' ').split()
                     selected_indices = [int(i) for i in indices_str]
-                    results = [self.options[self.current_index][i]['name'] for i in selected_indices if 0 <= i < len(self.options[self.current_index])]
+                    options = self._level.options
+                    results = [options.name_at(i) for i in selected_indices if options.has_index(i)]
 
                     if not results:
-                        print("Error: You must select at least one option.")
+                        self._write("Error: You must select at least one option.\n")
                         continue
 
                     self._save_result_once(results)
                     if self._is_new():
-                        return self
+                        return
                     continue
                 except Exception as e:
-                    print("Invalid input format. Please enter indices separated by space or comma.")
+                    self._write("Invalid input format. Please enter indices separated by space or comma.\n")
                     continue
-            elif choice.isdigit() and 0 <= int(choice) < len(self.options[self.current_index]):
-                self._save_result_once(self.options[self.current_index][int(choice)]['name'])
+            elif choice.isdigit() and self._level.options.has_index(int(choice)):
+                self._save_result_once(self._level.options.name_at(int(choice)))
                 if self._is_new():
-                    return self
+                    return
                 continue
             else:
-                print("Invalid input. Please try again.")
+                self._write("Invalid input. Please try again.\n")
+
+    async def ask_async(self, title: Optional[str] = None, key: Optional[str] = None,
+                        reader: Any = None) -> 'InteractiveMenu':
+        """Asynchronous version of ask() that does not block the event loop.
+
+        Navigation works exactly as in ask(): 'q', 'r', shortcuts, multiple
+        selection, paging and search. Prompts are written to the output
+        stream and answers are awaited line by line.
+
+        Args:
+            title: Optional title to override the current menu title.
+            key: Optional key name for storing the result.
+            reader: Optional object with an ``async readline()`` method, such
+                as an ``asyncio.StreamReader``. Defaults to stdin.
+
+        Returns:
+            Self, for method chaining.
+
+        Example:
+            >>> menu = await InteractiveMenu().add_options(["A", "B"]).ask_async()
+            >>> results = await menu.get_all_results_async()
+        """
+        await self._run_flow_async(self._ask_flow(title, key), reader)
+        return self
+
+    async def get_all_results_async(self, reader: Any = None) -> Optional[Union[Dict[str, Any], 'InteractiveMenu']]:
+        """Asynchronous version of get_all_results().
+
+        Args:
+            reader: Optional object with an ``async readline()`` method, such
+                as an ``asyncio.StreamReader``. Defaults to stdin.
+
+        Returns:
+            Same as get_all_results().
+        """
+        return await self._run_flow_async(self._confirm_flow(), reader)
 
     def _reset(self) -> None:
         self.current_index = 0
@@ -616,6 +1447,14 @@ class InteractiveMenu:
             For multiple selections, values are lists of strings.
             For single selections, values are strings.
         """
+        return self._run_flow(self._confirm_flow())
+
+    def _confirm_flow(self) -> Generator[str, str, Optional[Union[Dict[str, Any], 'InteractiveMenu']]]:
+        """Run the get_all_results() confirmation independently of how input is read.
+
+        Yields:
+            Prompts; the answer to each prompt is sent back in.
+        """
         if self.DEBUG:
             print(f"Get all results")
         if self.quit:
@@ -625,23 +1464,24 @@ class InteractiveMenu:
         if not self.end:
             self.end = True
             # Only remove last if we have more than one level and it's empty
-            if len(self.options) > 1 and len(self.options[-1]) == 0:
+            if len(self.levels) > 1 and not self.levels[-1].options.has_index(0):
                 self._remove_last()
             # Filter out None keys and create a clean dictionary
             results: Dict[str, Any] = {}
             # Use all levels that have keys and results
-            for i in range(len(self.keys)):
-                key = self.keys[i]
-                result = self.results[i]
+            for level in self.levels:
+                key = level.key
+                result = level.result
                 if key is not None and result is not None:
                     results[key] = result
             
-            print("\nCurrent selections:")
+            summary = ["\nCurrent selections:"]
             for k, v in results.items():
-                print(f"{k}: {v}")
+                summary.append(f"{k}: {v}")
+            self._write("\n".join(summary) + "\n")
 
             while True:
-                confirm = input("\nConfirm selection? (y/n/r=restart/l=last): ").strip().lower()
+                confirm = (yield "\nConfirm selection? (y/n/r=restart/l=last): ").strip().lower()
                 if confirm == 'y':
                     return results
                 elif confirm == 'n':
@@ -654,7 +1494,7 @@ class InteractiveMenu:
                     # For last, we also return self to allow building a new menu
                     return self
                 else:
-                    print("Invalid input. Please enter y/n/r")
+                    self._write("Invalid input. Please enter y/n/r\n")
         else:
             # This is a restart or last option, so we need to ask again
             # Return self to allow continuing the chain
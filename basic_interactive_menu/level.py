@@ -0,0 +1,117 @@
+"""Per-depth state for InteractiveMenu.
+
+This module provides the record that holds everything belonging to one
+level of a (possibly nested) menu workflow, and the record describing an
+option found by a search across levels.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from basic_interactive_menu.field_search import FieldSearchEngine
+from basic_interactive_menu.options import OptionTable
+from basic_interactive_menu.search import SearchEngine
+from basic_interactive_menu.shortcuts import ShortcutMap
+
+
+class MenuLevel:
+    """State of a single menu level.
+
+    Pushing or popping a level of a nested workflow is a single list
+    operation on these records. Derived state such as the rendered option
+    rows is cached on the level it belongs to.
+
+    Attributes:
+        options: The options of this level.
+        title: The menu title.
+        multiple_allowed: Whether multiple selection is enabled.
+        key: The result key name.
+        result: The selected value, once chosen.
+        shortcuts: Shortcut <-> option index mapping.
+        search_enabled: Whether '/' search is enabled.
+        search_mode: 'substring', 'fuzzy' (ranked subsequence) or 'words'
+            (word-prefix) search.
+        groups: Option groups displayed at this level.
+        page_size: Options per page, or None to render every option.
+        page: The current page in paged mode.
+        option_block: Memoized rendered option rows, or None when stale.
+        first_index: Index of the first option with each name, used by
+            grouped rendering; built on first use and extended as options
+            are added.
+        search_engine: Search index over the options, built on first search.
+        search_index_path: File the search index is loaded from and saved to.
+        search_fields: Weights of the fields searched, or None to search names only.
+        field_search_engine: Index over the searched fields, built on first search.
+        search_typos: Edits per word tolerated when a search finds nothing,
+            or 0 to report no matches.
+    """
+
+    __slots__ = (
+        'options', 'title', 'multiple_allowed', 'key', 'result', 'shortcuts',
+        'search_enabled', 'search_mode', 'groups', 'page_size', 'page', 'option_block',
+        'first_index',
+        'search_engine', 'search_index_path', 'search_fields', 'field_search_engine',
+        'search_typos',
+    )
+
+    def __init__(self, title: str, multiple_allowed: bool = False) -> None:
+        """Initialize an empty level.
+
+        Args:
+            title: The menu title.
+            multiple_allowed: Whether multiple selection is enabled.
+        """
+        self.reset(title, multiple_allowed)
+
+    def reset(self, title: str, multiple_allowed: bool = False) -> None:
+        """Clear the level so the record can be reused.
+
+        Args:
+            title: The menu title.
+            multiple_allowed: Whether multiple selection is enabled.
+        """
+        self.options: OptionTable = OptionTable()
+        self.title: str = title
+        self.multiple_allowed: bool = multiple_allowed
+        self.key: Optional[str] = None
+        self.result: Optional[Union[str, List[str]]] = None
+        self.shortcuts: ShortcutMap = ShortcutMap()
+        self.search_enabled: bool = False
+        self.search_mode: str = 'substring'
+        self.groups: List[Any] = []
+        self.page_size: Optional[int] = None
+        self.page: int = 0
+        self.option_block: Optional[str] = None
+        self.first_index: Optional[Dict[str, int]] = None
+        self.search_engine: Optional[SearchEngine] = None
+        self.search_index_path: Optional[Path] = None
+        self.search_fields: Optional[Dict[str, float]] = None
+        self.field_search_engine: Optional[FieldSearchEngine] = None
+        self.search_typos: int = 0
+
+    def __repr__(self) -> str:
+        return f"MenuLevel(title={self.title!r}, key={self.key!r}, options={len(self.options)})"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """An option found by a search across every menu level.
+
+    Attributes:
+        depth: Index of the level holding the option.
+        index: Index of the option within that level.
+        name: The option name.
+        path: The selections of the levels above ``depth``, followed by
+            ``name``.
+    """
+
+    depth: int
+    index: int
+    name: str
+    path: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        return " > ".join(self.path)
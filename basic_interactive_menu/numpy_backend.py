@@ -0,0 +1,86 @@
+"""NumPy-vectorized substring search for SearchEngine.
+
+This module is only imported when NumPy is installed and the ``numpy``
+search backend is selected. The case-folded options are packed into one
+contiguous UTF-8 byte buffer with an offsets array, query occurrences are
+found with whole-buffer comparisons, and match positions are mapped back
+to option indices with ``np.searchsorted`` on the offsets.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List
+
+import numpy as np  # type: ignore
+
+from basic_interactive_menu.search import SEPARATOR
+
+
+class NumpyCorpus:
+    """Byte-buffer view of case-folded options for vectorized search.
+
+    The corpus reads from a list that only ever grows (the engine's folded
+    options) and packs it lazily, so appending options just marks the
+    buffer stale until the next query.
+    """
+
+    def __init__(self, texts: List[str]) -> None:
+        """Initialize the corpus.
+
+        Args:
+            texts: Case-folded option texts; may be appended to later.
+        """
+        self._texts = texts
+        self._packed = -1
+        self._buffer: Any = None
+        self._offsets: Any = None
+        self._byte_counts: Any = None
+
+    def _pack(self) -> None:
+        """Pack the texts into the byte buffer if options were added."""
+        if self._packed == len(self._texts):
+            return
+        encoded = [(text + SEPARATOR).encode('utf-8') for text in self._texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)),
+                  out=offsets[1:])
+        self._buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        self._offsets = offsets
+        # Byte frequencies pick the rarest query byte to start from
+        self._byte_counts = np.bincount(self._buffer, minlength=256)
+        self._packed = len(self._texts)
+
+    def search(self, query: str) -> List[int]:
+        """Find the options containing the query.
+
+        Args:
+            query: Non-empty case-folded query without ``SEPARATOR``.
+
+        Returns:
+            Sorted indices of the matching options.
+        """
+        self._pack()
+        buffer = self._buffer
+        pattern = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+        length = len(pattern)
+        if length > len(buffer):
+            return []
+
+        # Start from the occurrences of the rarest query byte, then keep
+        # the positions where every other query byte lines up
+        rarest = int(np.argmin(self._byte_counts[pattern]))
+        positions = np.flatnonzero(buffer == pattern[rarest]) - rarest
+        positions = positions[(positions >= 0) & (positions <= len(buffer) - length)]
+        for k in range(length):
+            if k != rarest and len(positions):
+                positions = positions[buffer[positions + k] == pattern[k]]
+        if not len(positions):
+            return []
+
+        # Positions are ascending, so equal indices are adjacent
+        indices = np.searchsorted(self._offsets, positions, side='right') - 1
+        first = np.empty(len(indices), dtype=bool)
+        first[0] = True
+        np.not_equal(indices[1:], indices[:-1], out=first[1:])
+        result: List[int] = indices[first].tolist()
+        return result
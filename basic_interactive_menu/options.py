@@ -0,0 +1,355 @@
+"""Compact option storage for InteractiveMenu.
+
+This module provides the per-level option table. Option names are kept in
+a single flat list instead of one dict per option, and optional metadata
+lives in sparse side columns that the render path never touches. Options
+can also be supplied lazily by a provider and materialized on demand.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+
+class OptionTable:
+    """Array-backed table of the options of one menu level.
+
+    Names are stored in a flat list; metadata columns are sparse
+    dictionaries keyed by option index, so an option without metadata
+    costs a single list slot on top of its name.
+
+    Example:
+        >>> table = OptionTable(["Apple", "Banana"])
+        >>> table.append("Cherry")
+        2
+        >>> table.name_at(2)
+        'Cherry'
+        >>> table[0:2]
+        ['Apple', 'Banana']
+    """
+
+    __slots__ = ('_names', '_columns')
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Initialize the table.
+
+        Args:
+            names: Optional initial option names.
+        """
+        self._names: List[str] = list(names)
+        self._columns: Dict[str, Dict[int, Any]] = {}
+
+    def append(self, name: str, **metadata: Any) -> int:
+        """Append an option.
+
+        Args:
+            name: The display name of the option.
+            **metadata: Optional metadata values stored in side columns.
+
+        Returns:
+            The index of the new option.
+        """
+        index = len(self._names)
+        self._names.append(name)
+        for column, value in metadata.items():
+            self.set_metadata(index, column, value)
+        return index
+
+    def extend(self, names: Iterable[str]) -> None:
+        """Append several options in one pass.
+
+        Args:
+            names: Option names to append.
+        """
+        self._names.extend(names)
+
+    def name_at(self, index: int) -> str:
+        """Get the display name of an option.
+
+        Args:
+            index: The option index.
+
+        Returns:
+            The option name.
+        """
+        return self._names[index]
+
+    def names(self) -> List[str]:
+        """Get all option names.
+
+        Returns:
+            The underlying name list. Callers must not modify it.
+        """
+        return self._names
+
+    def set_metadata(self, index: int, column: str, value: Any) -> None:
+        """Store a metadata value for an option.
+
+        Args:
+            index: The option index.
+            column: The metadata column name.
+            value: The value to store.
+
+        Raises:
+            IndexError: If the option does not exist.
+        """
+        if not self.has_index(index):
+            raise IndexError(f"Option index {index} out of range")
+        self._columns.setdefault(column, {})[index] = value
+
+    def metadata_at(self, index: int, column: str, default: Any = None) -> Any:
+        """Get a metadata value of an option.
+
+        Args:
+            index: The option index.
+            column: The metadata column name.
+            default: Value returned when the option has no such metadata.
+
+        Returns:
+            The stored value or ``default``.
+        """
+        values = self._columns.get(column)
+        if values is None:
+            return default
+        return values.get(index, default)
+
+    def has_index(self, index: int) -> bool:
+        """Check whether an option exists, without materializing the rest.
+
+        Args:
+            index: The option index.
+
+        Returns:
+            True if ``0 <= index < len(self)``.
+        """
+        return 0 <= index < len(self._names)
+
+    def length_known(self) -> bool:
+        """Check whether ``len()`` is available without pulling more options.
+
+        Returns:
+            True for eager tables.
+        """
+        return True
+
+    def is_lazy(self) -> bool:
+        """Check whether options come from a lazy provider.
+
+        Returns:
+            False for eager tables.
+        """
+        return False
+
+    def columns(self) -> List[str]:
+        """Get the names of all metadata columns.
+
+        Returns:
+            List of column names.
+        """
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        return self._names[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        return f"OptionTable({self._names!r})"
+
+
+class LazyOptionTable(OptionTable):
+    """Option table backed by a provider that is only read on demand.
+
+    The provider can be:
+
+    - a sequence supporting ``__getitem__`` and ``__len__``: entries are
+      fetched by index and kept in a bounded LRU cache;
+    - an iterator or other iterable: entries are pulled in order only as
+      far as an access needs, and kept once pulled;
+    - a callable returning either of the above: it is called on first use.
+
+    Options added before the provider are kept as an eager prefix, so
+    index ``i`` maps to ``provider[i - len(prefix)]``. Entries are
+    converted with ``str()``.
+
+    Example:
+        >>> table = LazyOptionTable(range(10**9))
+        >>> table.name_at(123456789)
+        '123456789'
+    """
+
+    __slots__ = ('_provider', '_sequence', '_iterator', '_pulled', '_cache', '_cache_size')
+
+    DEFAULT_CACHE_SIZE: int = 1024
+
+    def __init__(self, provider: Any, cache_size: int = DEFAULT_CACHE_SIZE,
+                 prefix: Optional[OptionTable] = None) -> None:
+        """Initialize the table.
+
+        Args:
+            provider: A callable, iterable or ``__getitem__``/``__len__`` sequence.
+            cache_size: Maximum number of sequence entries kept materialized.
+            prefix: Table whose options (and metadata) precede the
+                provider's entries.
+
+        Raises:
+            ValueError: If cache_size is smaller than 1.
+        """
+        if cache_size < 1:
+            raise ValueError(f"Cache size must be at least 1, got {cache_size}")
+        super().__init__()
+        if prefix is not None:
+            self._names = prefix.names()[:]
+            self._columns = {column: dict(values) for column, values in prefix._columns.items()}
+        self._provider: Any = provider
+        self._sequence: Optional[Sequence[Any]] = None
+        self._iterator: Optional[Iterator[Any]] = None
+        self._pulled: List[str] = []
+        self._cache: OrderedDict[int, str] = OrderedDict()
+        self._cache_size: int = cache_size
+
+    def _resolve(self) -> None:
+        """Turn the provider into a sequence or iterator on first use."""
+        if self._provider is None:
+            return
+        source = self._provider
+        self._provider = None
+        if callable(source) and not hasattr(source, '__getitem__') and not hasattr(source, '__next__'):
+            source = source()
+        if hasattr(source, '__getitem__') and hasattr(source, '__len__'):
+            self._sequence = source
+        else:
+            self._iterator = iter(source)
+
+    def _pull_until(self, count: int) -> None:
+        """Pull iterator entries until ``count`` are materialized or it ends."""
+        iterator = self._iterator
+        if iterator is None:
+            return
+        pulled = self._pulled
+        while len(pulled) < count:
+            try:
+                pulled.append(str(next(iterator)))
+            except StopIteration:
+                self._iterator = None
+                return
+
+    def _source_name(self, index: int) -> str:
+        """Get the provider entry at ``index``, relative to the provider."""
+        self._resolve()
+        sequence = self._sequence
+        if sequence is None:
+            self._pull_until(index + 1)
+            return self._pulled[index]
+        cache = self._cache
+        name = cache.get(index)
+        if name is not None:
+            cache.move_to_end(index)
+            return name
+        name = str(sequence[index])
+        cache[index] = name
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return name
+
+    def append(self, name: str, **metadata: Any) -> int:
+        raise ValueError("Options cannot be added after an option source")
+
+    def extend(self, names: Iterable[str]) -> None:
+        raise ValueError("Options cannot be added after an option source")
+
+    def name_at(self, index: int) -> str:
+        prefix = len(self._names)
+        if index < 0:
+            index += len(self)
+        if index < 0:
+            raise IndexError(f"Option index {index} out of range")
+        if index < prefix:
+            return self._names[index]
+        return self._source_name(index - prefix)
+
+    def names(self) -> List[str]:
+        """Get all option names, materializing the whole provider.
+
+        Returns:
+            A new list of every option name.
+        """
+        self._resolve()
+        if self._sequence is not None:
+            return self._names + [str(item) for item in self._sequence]
+        self._pull_until(sys.maxsize)
+        return self._names + self._pulled
+
+    def has_index(self, index: int) -> bool:
+        if index < 0:
+            return False
+        prefix = len(self._names)
+        if index < prefix:
+            return True
+        self._resolve()
+        if self._sequence is not None:
+            return index - prefix < len(self._sequence)
+        self._pull_until(index - prefix + 1)
+        return index - prefix < len(self._pulled)
+
+    def length_known(self) -> bool:
+        self._resolve()
+        return self._iterator is None
+
+    def is_lazy(self) -> bool:
+        return True
+
+    def materialized_count(self) -> int:
+        """Get the number of provider entries currently held in memory.
+
+        Returns:
+            The number of cached or pulled entries.
+        """
+        return len(self._cache) + len(self._pulled)
+
+    def __len__(self) -> int:
+        self._resolve()
+        if self._sequence is not None:
+            return len(self._names) + len(self._sequence)
+        self._pull_until(sys.maxsize)
+        return len(self._names) + len(self._pulled)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+            if start < 0 or (stop is not None and stop < 0) or step != 1:
+                return self.names()[index]
+            names: List[str] = []
+            position = start
+            while (stop is None or position < stop) and self.has_index(position):
+                names.append(self.name_at(position))
+                position += 1
+            return names
+        return self.name_at(index)
+
+    def __iter__(self) -> Iterator[str]:
+        position = 0
+        while self.has_index(position):
+            yield self.name_at(position)
+            position += 1
+
+    def __repr__(self) -> str:
+        return f"LazyOptionTable(prefix={self._names!r}, materialized={self.materialized_count()})"
@@ -1,50 +1,646 @@
 """Search functionality for InteractiveMenu.
 
 This module provides zero-dependency search capabilities for filtering
-menu options by user query.
+menu options by user query: exact substring search and ranked fuzzy
+(subsequence) search.
 """
 
 from __future__ import annotations
 
-from typing import List
+import heapq
+import re
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from basic_interactive_menu.bktree import BKTree
+
+GRAM_SIZE = 3
+
+# Search modes accepted by InteractiveMenu.enable_search()
+SEARCH_MODES = ('substring', 'fuzzy', 'words')
+
+# Words of options and queries for word-prefix search
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Terminates every option in the NumPy backend's byte buffer
+SEPARATOR = "\x00"
+
+# Substring search backends accepted by SearchEngine
+BACKENDS = ('python', 'numpy', 'auto')
+
+# Option count from which backend='auto' picks NumPy when it is installed
+NUMPY_MIN_OPTIONS = 10_000
+
+# Posting/candidate length ratio above which binary-search probing wins
+SKEW_THRESHOLD = 16
+
+# Maximum number of (query, matches) states kept for refinement
+REFINEMENT_DEPTH = 32
+
+# Number of query results kept by the LRU cache by default
+QUERY_CACHE_SIZE = 128
+
+# Number of ranked results fuzzy search returns by default
+FUZZY_LIMIT = 50
+
+# New words up to which add() inserts into the sorted vocabulary one by
+# one; larger batches are sorted and merged with it in one pass
+INSORT_MAX_WORDS = 32
+
+# Edits per word approximate search tolerates by default
+APPROXIMATE_MAX_DISTANCE = 2
+
+# Fuzzy scoring weights, in the spirit of fzf
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+
+def _intersect(candidates: List[int], postings: List[int]) -> List[int]:
+    """Intersect a short sorted candidate list with a long sorted posting list.
+
+    Each candidate is located in ``postings`` by binary search, so the cost
+    depends on the (short) candidate list rather than the posting length.
+
+    Args:
+        candidates: Sorted option indices.
+        postings: Sorted option indices.
+
+    Returns:
+        Sorted indices present in both lists.
+    """
+    result: List[int] = []
+    position = 0
+    end = len(postings)
+    for candidate in candidates:
+        position = bisect_left(postings, candidate, position, end)
+        if position == end:
+            break
+        if postings[position] == candidate:
+            result.append(candidate)
+    return result
+
+
+def _intersect_all(postings: List[List[int]]) -> List[int]:
+    """Intersect several sorted posting lists.
+
+    Lists are visited shortest first. Skewed lists are probed by binary
+    search; comparable ones are intersected as a hash set, sorting only
+    once at the end.
+
+    Args:
+        postings: Sorted option index lists (at least one).
+
+    Returns:
+        Sorted indices present in every list.
+    """
+    postings = sorted(postings, key=len)
+    candidates: Union[List[int], Set[int]] = postings[0]
+    for other in postings[1:]:
+        if len(other) >= SKEW_THRESHOLD * len(candidates):
+            if isinstance(candidates, set):
+                candidates = sorted(candidates)
+            candidates = _intersect(candidates, other)
+        else:
+            if not isinstance(candidates, set):
+                candidates = set(candidates)
+            candidates.intersection_update(other)
+        if not candidates:
+            return []
+    if isinstance(candidates, set):
+        return sorted(candidates)
+    return list(candidates)
+
+
+def _fuzzy_score(text: str, query: str, start: int) -> int:
+    """Score a subsequence match of ``query`` in ``text``.
+
+    The match found from ``start`` is tightened by walking back from its
+    last character, then each matched character earns ``SCORE_MATCH``
+    plus a bonus for starting a word or continuing a run, and gaps between
+    matched characters are penalized.
+
+    Args:
+        text: Case-folded option text containing ``query`` as a subsequence.
+        query: Non-empty case-folded query.
+        start: Position of the leftmost match of the first query character.
+
+    Returns:
+        The score; higher is better.
+    """
+    position = start
+    for char in query:
+        position = text.find(char, position) + 1
+    # Walk back for the latest start that still ends at the same position
+    positions = [0] * len(query)
+    position -= 1
+    positions[-1] = position
+    for n in range(len(query) - 2, -1, -1):
+        position = text.rfind(query[n], start, position)
+        positions[n] = position
+
+    score = 0
+    previous = -2
+    for n, position in enumerate(positions):
+        bonus = BONUS_BOUNDARY if position == 0 or not text[position - 1].isalnum() else 0
+        if n == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+        elif position == previous + 1:
+            bonus = max(bonus, BONUS_CONSECUTIVE)
+        else:
+            score += SCORE_GAP_START + SCORE_GAP_EXTENSION * (position - previous - 2)
+        score += SCORE_MATCH + bonus
+        previous = position
+    return score
+
+
+def _summarize(options: Sequence[str], matches: Sequence[int]) -> str:
+    """Describe a match list in one line.
+
+    Args:
+        options: All option strings.
+        matches: Indices of the matching options.
+
+    Returns:
+        Summary string describing the matches.
+    """
+    count = len(matches)
+
+    if count == 0:
+        return "No matches found"
+    elif count == 1:
+        return f"1 match: {options[matches[0]]}"
+    elif count <= 3:
+        matched_names = [options[i] for i in matches]
+        return f"{count} matches: {', '.join(matched_names)}"
+    else:
+        return f"{count} matches available"
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of a SearchEngine query cache.
+
+    Attributes:
+        hits: Queries answered from the cache.
+        misses: Queries that had to be computed.
+        maxsize: Maximum number of cached results.
+        currsize: Number of results currently cached.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
 
 class SearchEngine:
-    """Zero-dependency fuzzy search engine for menu options.
+    """Zero-dependency substring search engine for menu options.
+
+    Options are case-folded once at construction into a parallel corpus.
+    They are indexed by their trigrams (substrings of three characters). A
+    query is answered by intersecting the posting lists of its trigrams,
+    smallest first, and verifying only the surviving candidates against the
+    folded corpus, so queries allocate no per-option strings.
+
+    The engine also keeps a small stack of recent ``(query, matches)``
+    states. A query that extends a stacked one only filters that query's
+    matches, and states the new query no longer extends are popped, so
+    typing or deleting a character costs time proportional to the current
+    match set rather than the corpus.
+
+    ``fuzzy_search()`` matches the query as a subsequence instead, so
+    "mgrta" finds "Margherita", and returns the best matches ranked.
 
-    Provides character-based indexing for efficient substring matching.
+    Results of both kinds of query are kept in a bounded LRU cache that is
+    cleared whenever options are added; ``cache_info()`` reports its hit
+    and miss counts.
+
+    With the ``numpy`` backend, substring queries skip the trigram index
+    and scan a packed byte buffer of the folded options with vectorized
+    comparisons instead (see ``numpy_backend``), which builds much faster
+    and suits large one-shot filters. Every query then scans the whole
+    corpus, so interactive type-ahead and first pages stay on the default
+    ``python`` backend.
     """
 
-    def __init__(self, options: List[str]) -> None:
+    def __init__(self, options: Iterable[str], cache_size: int = QUERY_CACHE_SIZE,
+                 backend: str = 'python') -> None:
         """Initialize the search engine with menu options.
 
         Args:
-            options: List of option strings to search through.
+            options: Option strings to search through. They are copied, so
+                later changes to the caller's list are not seen; use
+                ``add()`` to index more options.
+            cache_size: Maximum number of query results cached; 0 disables
+                the cache.
+            backend: 'python' (trigram index), 'numpy' (vectorized scan),
+                or 'auto' to use NumPy when it is installed and there are
+                at least ``NUMPY_MIN_OPTIONS`` options. Opt into 'numpy'
+                or 'auto' for one-shot filters over large corpora.
+
+        Raises:
+            ValueError: If cache_size is negative, backend is unknown, or
+                backend is 'numpy' and NumPy is not installed.
         """
-        self.options = options
-        self._index = self._build_index()
+        if cache_size < 0:
+            raise ValueError(f"Cache size must not be negative, got {cache_size}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown search backend '{backend}', expected one of {', '.join(BACKENDS)}")
+        options = list(options)
+        self.options: List[str] = []
+        self._folded: List[str] = []
+        self._index: DefaultDict[str, List[int]] = defaultdict(list)
+        self._refinements: List[Tuple[str, List[int]]] = []
+        self._cache: OrderedDict[Hashable, List[int]] = OrderedDict()
+        self._cache_size = cache_size
+        self._hits = 0
+        self._misses = 0
+        # Character postings for the fuzzy prefilter, built on first use
+        self._char_index: Optional[DefaultDict[str, List[int]]] = None
+        # Word postings and their sorted vocabulary for word-prefix search,
+        # built on first use; new words are merged into the vocabulary
+        self._token_index: Optional[Dict[str, List[int]]] = None
+        self._vocabulary: List[str] = []
+        # BK-tree over the vocabulary for approximate search, built on first use
+        self._bktree: Optional[BKTree] = None
+        self._numpy: Optional[Any] = None
+        # Memory map backing the data of a loaded engine
+        self._mapping: Optional[Any] = None
+        if backend == 'numpy' or (backend == 'auto' and len(options) >= NUMPY_MIN_OPTIONS):
+            try:
+                from basic_interactive_menu.numpy_backend import NumpyCorpus
+            except ImportError:
+                if backend == 'numpy':
+                    raise ValueError(
+                        "NumPy is required for the numpy search backend. "
+                        "Install it with: pip install numpy"
+                    )
+            else:
+                self._numpy = NumpyCorpus(self._folded)
+        self.backend = 'python' if self._numpy is None else 'numpy'
+        self.add(options)
+
+    def add(self, options: Iterable[str]) -> None:
+        """Append options and index only the new ones.
+
+        Args:
+            options: Option strings to append.
+        """
+        if not isinstance(self.options, list):
+            self._materialize()
+        start = len(self.options)
+        self.options.extend(options)
+        # Share the option string when folding leaves it unchanged
+        append = self._folded.append
+        for option in self.options[start:]:
+            text = option.casefold()
+            append(option if text == option else text)
+        # The NumPy corpus reads the folded list and repacks on its own
+        if self._numpy is None:
+            self._index_from(start)
+        if self._char_index is not None:
+            self._char_index_from(start)
+        if self._token_index is not None:
+            self._token_index_from(start)
+        # New options may match stacked or cached queries
+        self._refinements.clear()
+        self._cache.clear()
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the options and trigram index to a binary file.
 
-    def _build_index(self) -> dict[str, List[int]]:
-        """Build a character-to-indices mapping for fast lookup.
+        Engines for large, rarely changing option lists can then be
+        mapped with ``load()`` instead of rebuilt in every process.
+
+        Args:
+            path: Destination file.
+        """
+        from basic_interactive_menu.search_index import save_index
+
+        save_index(self, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], options: Optional[Sequence[str]] = None,
+             cache_size: int = QUERY_CACHE_SIZE) -> 'SearchEngine':
+        """Memory-map an index file written by ``save()``.
+
+        Names, the folded corpus and postings are read from the mapped
+        file on demand, so loading costs no index build and processes
+        mapping the same file share its pages. Adding options to a loaded
+        engine first copies it into memory and unmaps the file; ``close()``
+        unmaps it without copying, after which the engine must not be used.
+
+        Args:
+            path: The index file.
+            options: The options the index must cover; their hash is
+                checked against the one stored in the file.
+            cache_size: Maximum number of query results cached.
+
+        Returns:
+            The loaded engine, using the python backend.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: If the file is invalid or does not match ``options``.
+        """
+        from basic_interactive_menu.search_index import load_index
+
+        return load_index(path, options, cache_size)
+
+    def close(self) -> None:
+        """Unmap the index file of an engine returned by ``load()``.
+
+        The file can then be replaced or deleted, which Windows refuses
+        while it is mapped. The engine must not be searched afterwards.
+        Engines built in memory have nothing to release.
+        """
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self) -> 'SearchEngine':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _attach(self, options: Sequence[str], folded: Sequence[str], index: Any,
+                mapping: Any = None) -> None:
+        """Use read-only (e.g. memory-mapped) options, corpus and postings.
+
+        Args:
+            options: The option names.
+            folded: The case-folded names.
+            index: Mapping-like trigram -> sorted postings with ``get()``
+                and ``items()``.
+            mapping: Object whose ``close()`` releases the data, if any.
+        """
+        # Read-only sequences; add() copies them into lists first
+        self.options = options  # type: ignore[assignment]
+        self._folded = folded  # type: ignore[assignment]
+        self._index = index
+        self._mapping = mapping
+        self._refinements.clear()
+        self._cache.clear()
+
+    def _materialize(self) -> None:
+        """Copy attached read-only data into in-memory lists and release it."""
+        self.options = list(self.options)
+        self._folded = list(self._folded)
+        self._index = defaultdict(list, {gram: list(postings) for gram, postings in self._index.items()})
+        self.close()
+
+    def _trigram_postings(self) -> DefaultDict[str, List[int]]:
+        """Get the trigram index, building one if the backend does not keep it.
 
         Returns:
-            Dictionary mapping each character to list of option indices
-            containing that character.
+            Mapping of trigram to sorted option indices.
         """
-        index: dict[str, List[int]] = {}
-        for i, option in enumerate(self.options):
-            # Index by lowercase characters for case-insensitive search
-            for char in option.lower():
-                if char.isalnum():
-                    if char not in index:
-                        index[char] = []
-                    if i not in index[char]:
-                        index[char].append(i)
+        if self._numpy is None:
+            return self._index
+        index: DefaultDict[str, List[int]] = defaultdict(list)
+        self._index_from(0, index)
         return index
 
+    def _index_from(self, start: int, index: Optional[DefaultDict[str, List[int]]] = None) -> None:
+        """Add the trigrams of the options from ``start`` onward to the index.
+
+        Each option contributes its deduplicated trigram set once and
+        postings are append-only, so construction is linear in the total
+        text length. New options always have the highest indices, so
+        postings stay sorted without a final sort.
+
+        Args:
+            start: Index of the first option not yet indexed.
+            index: Index to fill instead of the engine's own.
+        """
+        if index is None:
+            index = self._index
+        for i, text in enumerate(self._folded[start:], start):
+            for gram in {text[j:j + GRAM_SIZE] for j in range(len(text) - GRAM_SIZE + 1)}:
+                index[gram].append(i)
+
+    def _char_index_from(self, start: int) -> None:
+        """Add the characters of the options from ``start`` onward to the character index.
+
+        Args:
+            start: Index of the first option not yet indexed.
+        """
+        if self._char_index is None:
+            self._char_index = defaultdict(list)
+        index = self._char_index
+        for i, text in enumerate(self._folded[start:], start):
+            for char in set(text):
+                index[char].append(i)
+
+    def _token_index_from(self, start: int) -> None:
+        """Add the words of the options from ``start`` onward to the word index.
+
+        Args:
+            start: Index of the first option not yet indexed.
+        """
+        index = self._token_index
+        building = index is None
+        if index is None:
+            index = self._token_index = {}
+        new_words: List[str] = []
+        for i, text in enumerate(self._folded[start:], start):
+            for token in set(TOKEN_PATTERN.findall(text)):
+                postings = index.get(token)
+                if postings is None:
+                    index[token] = [i]
+                    new_words.append(token)
+                else:
+                    postings.append(i)
+        if building:
+            self._vocabulary = sorted(index)
+        elif len(new_words) <= INSORT_MAX_WORDS:
+            for word in new_words:
+                insort(self._vocabulary, word)
+        else:
+            # Timsort merges the two sorted runs in linear time
+            self._vocabulary.extend(sorted(new_words))
+            self._vocabulary.sort()
+        if new_words and self._bktree is not None:
+            self._bktree.add(new_words)
+
+    def _prefix_postings(self, prefix: str) -> List[int]:
+        """Get the options having a word that starts with ``prefix``.
+
+        The words sharing a prefix form one contiguous run of the sorted
+        vocabulary, located by binary search.
+
+        Args:
+            prefix: Case-folded word prefix.
+
+        Returns:
+            Sorted option indices.
+        """
+        assert self._token_index is not None
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        if end - start == 1:
+            return self._token_index[vocabulary[start]]
+        postings: Set[int] = set()
+        for word in vocabulary[start:end]:
+            postings.update(self._token_index[word])
+        return sorted(postings)
+
+    def token_search(self, query: str) -> List[int]:
+        """Search for options whose words start with every word of the query.
+
+        Options and queries are split into words (runs of letters, digits
+        and underscores), so "veg bur" finds "Veggie Burger" regardless of
+        word order. Each query word is resolved by binary search over the
+        sorted vocabulary of a word index built on first use, and the
+        per-word postings are intersected, so the cost depends on the
+        vocabulary size logarithmically and on the posting lengths, not on
+        the option count.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+
+        Returns:
+            List of indices of the matching options, in option order.
+        """
+        tokens = set(TOKEN_PATTERN.findall(query.casefold()))
+        if not tokens:
+            return list(range(len(self.options)))
+
+        key = ('words', frozenset(tokens))
+        matches = self._cache_get(key)
+        if matches is None:
+            if self._token_index is None:
+                self._token_index_from(0)
+            postings: List[List[int]] = []
+            for token in tokens:
+                token_postings = self._prefix_postings(token)
+                if not token_postings:
+                    postings = []
+                    break
+                postings.append(token_postings)
+            matches = _intersect_all(postings) if postings else []
+            self._cache_put(key, matches)
+        return list(matches)
+
+    def approximate_search(self, query: str, max_distance: int = APPROXIMATE_MAX_DISTANCE,
+                           limit: Optional[int] = None) -> List[int]:
+        """Search for options matching every query word up to a few typos.
+
+        Each query word is looked up in a BK-tree over the vocabulary of
+        the word index, which only visits the part of the vocabulary that
+        can lie within ``max_distance`` edits (Levenshtein distance). An
+        option matches when every query word is within ``max_distance``
+        of one of its words; its distance is the sum over the query words
+        of the closest such word.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+            max_distance: Maximum edits per query word.
+            limit: Maximum number of results, or None for all matches.
+
+        Returns:
+            Indices of the matching options, closest first; ties keep
+            option order.
+
+        Raises:
+            ValueError: If max_distance or limit is negative.
+        """
+        if max_distance < 0:
+            raise ValueError(f"Maximum distance must not be negative, got {max_distance}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit must not be negative, got {limit}")
+        tokens = sorted(set(TOKEN_PATTERN.findall(query.casefold())))
+        if not tokens:
+            return list(islice(range(len(self.options)), limit))
+
+        key = ('approximate', tuple(tokens), max_distance, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+        if self._token_index is None:
+            self._token_index_from(0)
+        if self._bktree is None:
+            self._bktree = BKTree(self._vocabulary)
+        token_index = self._token_index
+        assert token_index is not None
+
+        totals: Optional[Dict[int, int]] = None
+        for token in tokens:
+            closest: Dict[int, int] = {}
+            # Words come closest first, so the first distance seen is the smallest
+            for distance, word in self._bktree.search(token, max_distance):
+                for i in token_index[word]:
+                    closest.setdefault(i, distance)
+            if totals is None:
+                totals = closest
+            else:
+                totals = {i: total + closest[i] for i, total in totals.items() if i in closest}
+            if not totals:
+                break
+        assert totals is not None
+
+        def rank(i: int) -> Tuple[int, int]:
+            return (totals[i], i)
+
+        if limit is None:
+            ranked = sorted(totals, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, totals, key=rank)
+        self._cache_put(key, ranked)
+        return list(ranked)
+
+    def is_token_match(self, index: int, query: str) -> bool:
+        """Check whether one option has a word starting with every query word.
+
+        Args:
+            index: The option index.
+            query: Search string; matching is case-insensitive.
+
+        Returns:
+            True if the option exists and matches the query word by word.
+        """
+        if not 0 <= index < len(self.options):
+            return False
+        words = TOKEN_PATTERN.findall(self._folded[index])
+        return all(any(word.startswith(token) for word in words)
+                   for token in TOKEN_PATTERN.findall(query.casefold()))
+
+    def _candidates(self, query: str) -> List[int]:
+        """Get the options containing every trigram of the query.
+
+        Args:
+            query: Case-folded query of at least ``GRAM_SIZE`` characters.
+
+        Returns:
+            Sorted candidate indices.
+        """
+        grams = {query[j:j + GRAM_SIZE] for j in range(len(query) - GRAM_SIZE + 1)}
+        postings = []
+        for gram in grams:
+            gram_postings = self._index.get(gram)
+            if gram_postings is None:
+                return []
+            postings.append(gram_postings)
+        return _intersect_all(postings)
+
     def search(self, query: str) -> List[int]:
         """Search for options matching the query.
 
+        Matching is case-insensitive; the query is case-folded here, so
+        callers need not normalize it.
+
         Args:
             query: Search string to match against options.
 
@@ -54,45 +650,309 @@ class SearchEngine:
         if not query:
             return list(range(len(self.options)))
 
-        query = query.lower()
+        query = query.casefold()
+        key = ('substring', query)
+        matches = self._cache_get(key)
+        base = self._refinement_base(query)
+        if base is not None and base[0] == query:
+            return list(base[1] if matches is None else matches)
+
+        if matches is None:
+            if base is not None and (self._numpy is not None or len(query) < GRAM_SIZE
+                                     or len(base[1]) <= self._shortest_postings(query)):
+                folded = self._folded
+                matches = [i for i in base[1] if query in folded[i]]
+            else:
+                matches = self._lookup(query)
+            self._cache_put(key, matches)
+
+        self._push_refinement(query, matches)
+        return list(matches)
+
+    def iter_search(self, query: str, limit: Optional[int] = None) -> Iterator[int]:
+        """Yield the options matching the query lazily, in index order.
 
-        # Use character index to efficiently collect candidate indices
-        candidates: set[int] = set()
-        for char in query:
-            if char.isalnum() and char in self._index:
-                candidates.update(self._index[char])
+        Matches are verified one at a time against the smallest available
+        candidate source (a cached or stacked result, the shortest posting
+        list of the query's trigrams, or every option for short queries),
+        so the first results arrive without computing the whole match
+        list. A fully consumed iteration is cached like ``search()``.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+            limit: Maximum number of matches to yield, or None for all.
+
+        Returns:
+            Iterator over the matching indices.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit must not be negative, got {limit}")
+        return islice(self._iter_matches(query), limit)
+
+    def _iter_matches(self, query: str) -> Iterator[int]:
+        """Generate the matches of a query for ``iter_search()``.
+
+        Args:
+            query: Search string to match against options.
+
+        Yields:
+            Matching indices in index order.
+        """
+        if not query:
+            yield from range(len(self.options))
+            return
+
+        query = query.casefold()
+        key = ('substring', query)
+        matches = self._cache_get(key)
+        base = self._refinement_base(query)
+        if matches is None and base is not None and base[0] == query:
+            matches = base[1]
+        if matches is not None:
+            # Stored results are never modified, only replaced
+            yield from matches
+            return
+
+        folded = self._folded
+        candidates: Optional[Iterable[int]] = None if base is None else base[1]
+        if self._numpy is None and len(query) >= GRAM_SIZE:
+            index = self._index
+            postings = min((index.get(query[j:j + GRAM_SIZE], ()) for j in range(len(query) - GRAM_SIZE + 1)),
+                           key=len)
+            if base is None or len(postings) < len(base[1]):
+                candidates = postings
+        elif candidates is None and self._numpy is not None:
+            # The vectorized pass finds every match at once
+            candidates = self._lookup(query)
+
+        count = len(self.options)
+        found: List[int] = []
+        if candidates is None:
+            for i, text in enumerate(folded):
+                if query in text:
+                    found.append(i)
+                    yield i
+        else:
+            for i in candidates:
+                if query in folded[i]:
+                    found.append(i)
+                    yield i
+
+        # Options added meanwhile were not all visited
+        if len(self.options) == count:
+            self._cache_put(key, found)
+            self._push_refinement(query, found)
+
+    def is_match(self, index: int, query: str) -> bool:
+        """Check whether one option contains the query.
+
+        Args:
+            index: The option index.
+            query: Search string; matching is case-insensitive.
+
+        Returns:
+            True if the option exists and contains the query.
+        """
+        return 0 <= index < len(self.options) and query.casefold() in self._folded[index]
+
+    def cache_info(self) -> CacheInfo:
+        """Get query cache statistics.
+
+        Returns:
+            Hit and miss counts and the cache size.
+        """
+        return CacheInfo(self._hits, self._misses, self._cache_size, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Empty the query cache and reset its statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _cache_get(self, key: Hashable) -> Optional[List[int]]:
+        """Look up a cached result, counting the hit or miss.
+
+        Args:
+            key: The query key.
+
+        Returns:
+            The cached matches (not to be modified) or None.
+        """
+        matches = self._cache.get(key)
+        if matches is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return matches
+
+    def _cache_put(self, key: Hashable, matches: List[int]) -> None:
+        """Cache a result, evicting the least recently used one if full.
+
+        Args:
+            key: The query key.
+            matches: The matches; the cache keeps this list.
+        """
+        if self._cache_size == 0:
+            return
+        self._cache[key] = matches
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _push_refinement(self, query: str, matches: List[int]) -> None:
+        """Stack a query state, dropping the oldest beyond ``REFINEMENT_DEPTH``.
+
+        Args:
+            query: Case-folded query.
+            matches: Its matches; the stack keeps this list.
+        """
+        refinements = self._refinements
+        refinements.append((query, matches))
+        if len(refinements) > REFINEMENT_DEPTH:
+            del refinements[0]
+
+    def reset_refinements(self) -> None:
+        """Forget the stacked query states, e.g. when a new search session starts."""
+        self._refinements.clear()
+
+    def _refinement_base(self, query: str) -> Optional[Tuple[str, List[int]]]:
+        """Pop stacked states the query does not extend and return the top.
+
+        Every option containing ``query`` also contains any substring of
+        it, so the matches of a stacked query found in ``query`` are a
+        superset of the answer.
+
+        Args:
+            query: Case-folded query.
+
+        Returns:
+            The closest ``(query, matches)`` state or None.
+        """
+        refinements = self._refinements
+        while refinements and refinements[-1][0] not in query:
+            refinements.pop()
+        return refinements[-1] if refinements else None
+
+    def _shortest_postings(self, query: str) -> int:
+        """Get the length of the shortest posting list among the query's trigrams.
+
+        Args:
+            query: Case-folded query of at least ``GRAM_SIZE`` characters.
+
+        Returns:
+            The posting length (0 if some trigram is not indexed).
+        """
+        index = self._index
+        return min(len(index.get(query[j:j + GRAM_SIZE], ()))
+                   for j in range(len(query) - GRAM_SIZE + 1))
+
+    def _lookup(self, query: str) -> List[int]:
+        """Answer a query from the index (or NumPy corpus) alone.
+
+        Args:
+            query: Non-empty case-folded query.
+
+        Returns:
+            Sorted indices of the matching options.
+        """
+        folded = self._folded
+        if self._numpy is not None:
+            # The separator would let a match span two packed options
+            if SEPARATOR in query:
+                return [i for i, text in enumerate(folded) if query in text]
+            result: List[int] = self._numpy.search(query)
+            return result
+
+        # Queries shorter than a trigram cannot use the index
+        if len(query) < GRAM_SIZE:
+            return [i for i, text in enumerate(folded) if query in text]
+
+        candidates = self._candidates(query)
+        if len(query) == GRAM_SIZE:
+            return candidates
 
         # Validate candidates with actual substring matching
-        result: list[int] = []
-        for i in candidates:
-            if query in self.options[i].lower():
-                result.append(i)
+        return [i for i in candidates if query in folded[i]]
 
-        # Also check any options that might match but weren't in index
-        for i, option in enumerate(self.options):
-            if i not in candidates and query in option.lower():
-                result.append(i)
+    def fuzzy_search(self, query: str, limit: int = FUZZY_LIMIT) -> List[int]:
+        """Search for options containing the query as a subsequence, ranked.
 
-        return sorted(result)
+        Options lacking any query character are dropped using a character
+        index. The remaining candidates are matched with one compiled
+        regular expression, every match is scored (word-boundary and
+        consecutive-character bonuses, gap penalties), and the best
+        ``limit`` are kept with a bounded heap.
+
+        Args:
+            query: Search string; matching is case-insensitive.
+            limit: Maximum number of results.
 
-    def get_matches_summary(self, query: str) -> str:
+        Returns:
+            Indices of the best matches, best first; ties keep option order.
+        """
+        if limit <= 0:
+            return []
+        if not query:
+            return list(range(min(limit, len(self.options))))
+
+        query = query.casefold()
+        key = ('fuzzy', query, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+        ranked = self._fuzzy_rank(query, limit)
+        self._cache_put(key, ranked)
+        return list(ranked)
+
+    def _fuzzy_rank(self, query: str, limit: int) -> List[int]:
+        """Rank the fuzzy matches of a query.
+
+        Args:
+            query: Non-empty case-folded query.
+            limit: Maximum number of results (positive).
+
+        Returns:
+            Indices of the best matches, best first.
+        """
+        if self._char_index is None:
+            self._char_index_from(0)
+        char_index = self._char_index
+        assert char_index is not None
+        postings = []
+        for char in set(query):
+            char_postings = char_index.get(char)
+            if char_postings is None:
+                return []
+            postings.append(char_postings)
+        candidates = _intersect_all(postings)
+
+        search = re.compile('.*?'.join(map(re.escape, query)), re.DOTALL).search
+        folded = self._folded
+
+        def scored() -> Iterator[Tuple[int, int]]:
+            # The match window is no bound on the score (word-initial matches
+            # are wide), so every match is scored
+            for i in candidates:
+                match = search(folded[i])
+                if match is not None:
+                    yield _fuzzy_score(folded[i], query, match.start()), -i
+
+        return [-negated for _, negated in heapq.nlargest(limit, scored())]
+
+    def get_matches_summary(self, query: str, matches: Optional[List[int]] = None) -> str:
         """Get a human-readable summary of search results.
 
         Args:
             query: The search query.
+            matches: Matches already computed for the query (e.g. by
+                ``fuzzy_search()``); searched for when omitted.
 
         Returns:
             Summary string describing the matches.
         """
-        matches = self.search(query)
-        count = len(matches)
-
-        if count == 0:
-            return "No matches found"
-        elif count == 1:
-            return f"1 match: {self.options[matches[0]]}"
-        elif count <= 3:
-            matched_names = [self.options[i] for i in matches]
-            return f"{count} matches: {', '.join(matched_names)}"
-        else:
-            return f"{count} matches available"
+        if matches is None:
+            matches = self.search(query)
+        return _summarize(self.options, matches)
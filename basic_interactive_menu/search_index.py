@@ -0,0 +1,335 @@
+"""On-disk search indexes for SearchEngine.
+
+This module writes a SearchEngine's trigram index, together with the
+option names and their case-folded corpus, to a binary file, and maps
+such a file back into memory. A mapped engine reads names and postings
+straight from the page cache, so processes that start often skip the
+index build and share the same physical pages.
+
+File layout (native byte order, every section padded to 8 bytes)::
+
+    header                see HEADER
+    name offsets          int64[option_count + 1]
+    names                 UTF-8, each name followed by NUL
+    folded offsets        int64[option_count + 1]
+    folded names          UTF-8, each name followed by NUL
+    trigram offsets       int64[gram_count + 1]
+    trigrams              UTF-8, sorted bytewise
+    posting offsets       int64[gram_count + 1]
+    postings              int32 option indices
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+from basic_interactive_menu.search import QUERY_CACHE_SIZE, SearchEngine
+
+MAGIC = b"BIMINDEX"
+VERSION = 1
+
+# magic, version, byte order, option count, gram count, posting count, content digest
+HEADER = struct.Struct("=8sIIQQQ32s")
+
+_BYTE_ORDERS = {'little': 1, 'big': 2}
+
+
+def content_digest(options: Iterable[str]) -> bytes:
+    """Hash option names the way index files record them.
+
+    Args:
+        options: The option names, in order.
+
+    Returns:
+        The SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for option in options:
+        digest.update(option.encode('utf-8', 'surrogatepass'))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _pad(length: int) -> bytes:
+    return b"\0" * (-length % 8)
+
+
+def _pack_strings(strings: Iterable[str]) -> Tuple[array, bytes]:
+    """Encode strings into one NUL-terminated buffer with start offsets."""
+    encoded = [string.encode('utf-8', 'surrogatepass') + b"\0" for string in strings]
+    offsets = array('q', [0])
+    position = 0
+    for item in encoded:
+        position += len(item)
+        offsets.append(position)
+    return offsets, b"".join(encoded)
+
+
+class MappedFile:
+    """A read-only memory map and the views taken from it.
+
+    The map can only be closed once no view of it is alive, so every view
+    handed to ``MappedStrings`` and ``MappedPostings`` is recorded here and
+    released by ``close()``.
+    """
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self._mapped = mapped
+        self._views: List[memoryview] = []
+
+    def view(self) -> memoryview:
+        """Get a recorded view of the whole map."""
+        return self.track(memoryview(self._mapped))
+
+    def track(self, view: memoryview) -> memoryview:
+        """Record a view so that ``close()`` releases it.
+
+        Args:
+            view: A view of the map.
+
+        Returns:
+            The same view.
+        """
+        self._views.append(view)
+        return view
+
+    @property
+    def closed(self) -> bool:
+        return self._mapped.closed
+
+    def close(self) -> None:
+        """Release every recorded view and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        try:
+            self._mapped.close()
+        except BufferError:
+            # A caller still holds a postings slice; the map is closed when
+            # that slice is collected
+            pass
+
+
+class MappedStrings(Sequence[str]):
+    """Read-only sequence of strings decoded on access from a mapped buffer."""
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._decode_range(start, stop)
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("string index out of range")
+        offsets = self._offsets
+        # offsets[index + 1] raises IndexError past the end
+        return str(self._data[offsets[index]:offsets[index + 1] - 1], 'utf-8', 'surrogatepass')
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._decode_range(0, len(self)))
+
+    def _decode_range(self, start: int, stop: int) -> List[str]:
+        """Decode a run of strings with one decode and split.
+
+        Strings that contain NUL themselves are decoded one by one.
+        """
+        if start >= stop:
+            return []
+        data = bytes(self._data[self._offsets[start]:self._offsets[stop]])
+        strings = data.decode('utf-8', 'surrogatepass').split("\0")
+        if len(strings) == stop - start + 1:
+            return strings[:-1]
+        return [self[i] for i in range(start, stop)]
+
+
+class MappedPostings:
+    """Read-only trigram -> postings mapping backed by a mapped buffer.
+
+    Trigrams are located by binary search over the sorted key table and
+    postings are returned as ``memoryview`` slices, so nothing is decoded
+    up front.
+    """
+
+    def __init__(self, key_offsets: memoryview, keys: memoryview,
+                 posting_offsets: memoryview, postings: memoryview) -> None:
+        self._key_offsets = key_offsets
+        self._keys = keys
+        self._posting_offsets = posting_offsets
+        self._postings = postings
+
+    def _key(self, position: int) -> bytes:
+        return bytes(self._keys[self._key_offsets[position]:self._key_offsets[position + 1]])
+
+    def get(self, gram: str, default: Any = None) -> Any:
+        """Get the postings of a trigram.
+
+        Args:
+            gram: The trigram.
+            default: Value returned when the trigram is not indexed.
+
+        Returns:
+            Sorted option indices (a ``memoryview``) or ``default``.
+        """
+        key = gram.encode('utf-8', 'surrogatepass')
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(self) or self._key(low) != key:
+            return default
+        return self._postings[self._posting_offsets[low]:self._posting_offsets[low + 1]]
+
+    def items(self) -> Iterator[Tuple[str, memoryview]]:
+        for position in range(len(self)):
+            gram = self._key(position).decode('utf-8', 'surrogatepass')
+            yield gram, self._postings[self._posting_offsets[position]:self._posting_offsets[position + 1]]
+
+    def __len__(self) -> int:
+        return len(self._key_offsets) - 1
+
+
+def save_index(engine: SearchEngine, path: Union[str, Path]) -> None:
+    """Write an engine's options and trigram index to a file.
+
+    The file is written next to ``path`` and renamed into place, so
+    processes mapping the old file keep a consistent view.
+
+    Args:
+        engine: The engine to save.
+        path: Destination file.
+
+    Raises:
+        ValueError: If the engine has more options than int32 postings hold.
+    """
+    options = engine.options
+    if len(options) >= 2 ** 31:
+        raise ValueError(f"Too many options for a search index file: {len(options)}")
+    name_offsets, names = _pack_strings(options)
+    folded_offsets, folded = _pack_strings(engine._folded)
+
+    grams: Dict[bytes, Any] = {gram.encode('utf-8', 'surrogatepass'): postings
+                               for gram, postings in engine._trigram_postings().items()}
+    keys = sorted(grams)
+    key_offsets = array('q', [0])
+    position = 0
+    for key in keys:
+        position += len(key)
+        key_offsets.append(position)
+    key_data = b"".join(keys)
+    posting_offsets = array('q', [0])
+    postings = array('i')
+    for key in keys:
+        postings.extend(grams[key])
+        posting_offsets.append(len(postings))
+
+    header = HEADER.pack(MAGIC, VERSION, _BYTE_ORDERS[sys.byteorder], len(options),
+                         len(keys), len(postings), content_digest(options))
+    sections = [header, name_offsets.tobytes(), names, folded_offsets.tobytes(), folded,
+                key_offsets.tobytes(), key_data, posting_offsets.tobytes(), postings.tobytes()]
+
+    path = Path(path)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as f:
+        for section in sections:
+            f.write(section)
+            f.write(_pad(len(section)))
+    temporary.replace(path)
+
+
+def load_index(path: Union[str, Path], options: Optional[Sequence[str]] = None,
+               cache_size: int = QUERY_CACHE_SIZE) -> SearchEngine:
+    """Map an index file written by ``save_index()``.
+
+    Args:
+        path: The index file.
+        options: The options the index is expected to cover. When given,
+            their hash must match the one recorded in the file.
+        cache_size: Query cache size of the engine.
+
+    Returns:
+        A SearchEngine reading names and postings from the mapped file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file is not a valid index, was written on a
+            machine with another byte order, or does not match ``options``.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Invalid search index file: {path}")
+    mapping = MappedFile(mapped)
+    try:
+        return _map_engine(mapping, path, options, cache_size)
+    except BaseException:
+        # Unmap now so the caller can rewrite the file, even on Windows
+        mapping.close()
+        raise
+
+
+def _map_engine(mapping: MappedFile, path: Union[str, Path], options: Optional[Sequence[str]],
+                cache_size: int) -> SearchEngine:
+    """Validate a mapped index file and build an engine reading from it."""
+    view = mapping.view()
+    if len(view) < HEADER.size:
+        raise ValueError(f"Invalid search index file: {path}")
+    magic, version, byte_order, option_count, gram_count, posting_count, digest = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Invalid search index file: {path}")
+    if byte_order != _BYTE_ORDERS[sys.byteorder]:
+        raise ValueError(f"Search index {path} was written with a different byte order")
+    if options is not None and content_digest(options) != digest:
+        raise ValueError(f"Search index {path} does not match the options")
+
+    position = HEADER.size + len(_pad(HEADER.size))
+
+    def take(length: int) -> memoryview:
+        nonlocal position
+        if position + length > len(view):
+            raise ValueError(f"Truncated search index file: {path}")
+        section = mapping.track(view[position:position + length])
+        position += length + len(_pad(length))
+        return section
+
+    def take_offsets(count: int) -> memoryview:
+        return mapping.track(take(8 * (count + 1)).cast('q'))
+
+    def take_strings(count: int) -> Tuple[memoryview, memoryview]:
+        offsets = take_offsets(count)
+        return offsets, take(offsets[-1])
+
+    name_offsets, names = take_strings(option_count)
+    folded_offsets, folded = take_strings(option_count)
+    key_offsets, keys = take_strings(gram_count)
+    posting_offsets = take_offsets(gram_count)
+    postings = mapping.track(take(4 * posting_count).cast('i'))
+
+    engine = SearchEngine([], cache_size=cache_size, backend='python')
+    engine._attach(MappedStrings(name_offsets, names), MappedStrings(folded_offsets, folded),
+                   MappedPostings(key_offsets, keys, posting_offsets, postings), mapping)
+    return engine
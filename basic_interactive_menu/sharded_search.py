@@ -0,0 +1,228 @@
+"""Parallel sharded search for very large option lists.
+
+This module splits the options into contiguous shards, each with its own
+SearchEngine, and answers queries by searching the shards in worker
+processes and merging their sorted results.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import sys
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from basic_interactive_menu.search import QUERY_CACHE_SIZE, SearchEngine, _summarize
+
+# Shard engines by owner token, then shard number. Forked workers inherit
+# the parent's entries; spawned workers fill theirs in _init_worker().
+_SHARDS: Dict[int, Dict[int, Tuple[int, SearchEngine]]] = {}
+
+_tokens = itertools.count()
+
+
+def _start_method() -> str:
+    """Get the start method worker processes will use.
+
+    The global default is read without fixing it, so callers can still
+    choose one with ``multiprocessing.set_start_method()``.
+
+    Returns:
+        The configured start method, or the platform default.
+    """
+    method = multiprocessing.get_start_method(allow_none=True)
+    if method is not None:
+        return method
+    if sys.platform.startswith('linux') and sys.version_info < (3, 14):
+        return 'fork'
+    return 'spawn'
+
+
+def _init_worker(token: int, shard_options: List[Tuple[int, int, List[str]]], cache_size: int) -> None:
+    """Build a worker's own shard engines when it did not inherit them.
+
+    Args:
+        token: The owning ShardedSearchEngine's token.
+        shard_options: ``(shard number, first index, options)`` of each
+            shard searched by this worker.
+        cache_size: Query cache size of each shard engine.
+    """
+    _SHARDS[token] = {shard: (base, SearchEngine(options, cache_size=cache_size))
+                      for shard, base, options in shard_options}
+
+
+def _release(token: int, pools: List[ProcessPoolExecutor]) -> None:
+    """Stop an engine's workers and drop its shards.
+
+    Run by ``close()``, or when the engine is garbage collected unclosed.
+
+    Args:
+        token: The owning ShardedSearchEngine's token.
+        pools: The engine's started worker pools; emptied here.
+    """
+    for pool in pools:
+        pool.shutdown()
+    pools.clear()
+    _SHARDS.pop(token, None)
+
+
+def _search_shard(token: int, shard: int, query: str) -> array:
+    """Search one shard.
+
+    Args:
+        token: The owning ShardedSearchEngine's token.
+        shard: The shard number.
+        query: The search query.
+
+    Returns:
+        Sorted global option indices, packed so they pickle as raw bytes.
+    """
+    base, engine = _SHARDS[token][shard]
+    return array('q', [base + i for i in engine.search(query)])
+
+
+class ShardedSearchEngine:
+    """Substring search engine spread over several processes.
+
+    The options are split into ``shards`` contiguous ranges, each indexed
+    by its own SearchEngine, and shard ``s`` is always searched by worker
+    ``s % workers``. Where ``fork`` is the start method (as on Linux
+    before Python 3.14) the shards are built once in this process and
+    inherited by the workers, so the corpus is never pickled; elsewhere,
+    including macOS where forking is unsafe, each worker receives and
+    indexes only its own shards, once, when it starts. Per-shard results
+    come back sorted and are combined with a k-way merge.
+
+    Call ``close()`` (or use the engine as a context manager) to stop the
+    worker processes; an engine collected without being closed stops
+    them then.
+
+    Example:
+        >>> with ShardedSearchEngine(catalog, shards=4) as engine:
+        ...     matches = engine.search("widget")
+    """
+
+    def __init__(self, options: Iterable[str], shards: Optional[int] = None,
+                 workers: Optional[int] = None, cache_size: int = QUERY_CACHE_SIZE) -> None:
+        """Initialize the engine.
+
+        Args:
+            options: Option strings to search through.
+            shards: Number of shards; defaults to the CPU count. With one
+                shard queries run in this process and no worker is started.
+            workers: Number of worker processes; defaults to ``shards``
+                and is capped at the number of non-empty shards.
+            cache_size: Query cache size of each shard engine.
+
+        Raises:
+            ValueError: If shards or workers is smaller than 1.
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if workers is None:
+            workers = shards
+        if shards < 1:
+            raise ValueError(f"Shard count must be at least 1, got {shards}")
+        if workers < 1:
+            raise ValueError(f"Worker count must be at least 1, got {workers}")
+        self.options: List[str] = list(options)
+        self.shards = shards
+        self._cache_size = cache_size
+        self._shard_size = -(-len(self.options) // shards) or 1
+        self._shard_count = max(1, -(-len(self.options) // self._shard_size))
+        self.workers = min(workers, self._shard_count)
+        self._token = next(_tokens)
+        # One single-process pool per worker, started on first use and
+        # shared with the finalizer
+        self._pools: List[ProcessPoolExecutor] = []
+        self._closed = False
+        self._fork = shards > 1 and _start_method() == 'fork'
+        if shards == 1 or self._fork:
+            _SHARDS[self._token] = {shard: (base, SearchEngine(shard_options, cache_size=cache_size))
+                                    for shard, base, shard_options in self._split()}
+        self._finalizer = weakref.finalize(self, _release, self._token, self._pools)
+
+    def _split(self, worker: Optional[int] = None) -> List[Tuple[int, int, List[str]]]:
+        """Split the options into contiguous shards.
+
+        Args:
+            worker: Only return the shards searched by this worker.
+
+        Returns:
+            ``(shard number, first index, options)`` per shard.
+        """
+        size = self._shard_size
+        shards = range(self._shard_count)
+        if worker is not None:
+            shards = shards[worker::self.workers]
+        return [(shard, shard * size, self.options[shard * size:(shard + 1) * size])
+                for shard in shards]
+
+    def _executors(self) -> List[ProcessPoolExecutor]:
+        """Get the worker pools, starting them on first use."""
+        if not self._pools:
+            if self._fork:
+                forked = multiprocessing.get_context('fork')
+                self._pools.extend(ProcessPoolExecutor(1, forked) for _ in range(self.workers))
+            else:
+                context = multiprocessing.get_context(_start_method())
+                self._pools.extend(
+                    ProcessPoolExecutor(1, context, initializer=_init_worker,
+                                        initargs=(self._token, self._split(worker), self._cache_size))
+                    for worker in range(self.workers))
+        return self._pools
+
+    def search(self, query: str) -> List[int]:
+        """Search for options matching the query in every shard.
+
+        Args:
+            query: Search string to match against options.
+
+        Returns:
+            List of indices matching the search query, in option order.
+
+        Raises:
+            ValueError: If the engine has been closed.
+        """
+        if self._closed:
+            raise ValueError("Search engine is closed")
+        if not query:
+            return list(range(len(self.options)))
+        if self.shards == 1:
+            return list(_search_shard(self._token, 0, query))
+
+        pools = self._executors()
+        futures = [pools[shard % len(pools)].submit(_search_shard, self._token, shard, query)
+                   for shard in range(self._shard_count)]
+        return list(heapq.merge(*(future.result() for future in futures)))
+
+    def get_matches_summary(self, query: str, matches: Optional[List[int]] = None) -> str:
+        """Get a human-readable summary of search results.
+
+        Args:
+            query: The search query.
+            matches: Matches already computed for the query; searched for
+                when omitted.
+
+        Returns:
+            Summary string describing the matches.
+        """
+        if matches is None:
+            matches = self.search(query)
+        return _summarize(self.options, matches)
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shards."""
+        self._finalizer()
+        self._closed = True
+
+    def __enter__(self) -> 'ShardedSearchEngine':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,102 @@
+"""Shortcut bookkeeping for InteractiveMenu.
+
+This module provides a bidirectional mapping between shortcut characters
+and option indices so that both directions can be resolved in O(1).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, ItemsView, Iterator, KeysView, Optional, ValuesView
+
+
+class ShortcutMap:
+    """Bidirectional shortcut <-> option index mapping for one menu level.
+
+    Behaves like a read-only ``Dict[str, int]`` keyed by shortcut character,
+    while also keeping the reverse index -> shortcut direction in sync so
+    option rendering does not need to scan every shortcut.
+
+    Attributes:
+        scanned: Number of options already visited by auto-generation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty shortcut map."""
+        self._by_key: Dict[str, int] = {}
+        self._by_index: Dict[int, str] = {}
+        self.scanned: int = 0
+
+    def assign(self, shortcut: str, index: int) -> None:
+        """Bind a shortcut character to an option index.
+
+        Args:
+            shortcut: The (lowercase) shortcut character.
+            index: The option index the shortcut selects.
+
+        Raises:
+            ValueError: If the shortcut is already bound to another option.
+        """
+        existing = self._by_key.get(shortcut)
+        if existing is not None and existing != index:
+            raise ValueError(f"Shortcut '{shortcut}' conflicts with option at index {existing}")
+        self._by_key[shortcut] = index
+        self._by_index[index] = shortcut
+
+    def shortcut_for(self, index: int) -> Optional[str]:
+        """Get the shortcut bound to an option index.
+
+        Args:
+            index: The option index.
+
+        Returns:
+            The shortcut character or None if the option has no shortcut.
+        """
+        return self._by_index.get(index)
+
+    def has_index(self, index: int) -> bool:
+        """Check whether an option index already has a shortcut.
+
+        Args:
+            index: The option index.
+
+        Returns:
+            True if a shortcut is bound to the option.
+        """
+        return index in self._by_index
+
+    def get(self, shortcut: str, default: Optional[int] = None) -> Optional[int]:
+        return self._by_key.get(shortcut, default)
+
+    def keys(self) -> KeysView[str]:
+        return self._by_key.keys()
+
+    def values(self) -> ValuesView[int]:
+        return self._by_key.values()
+
+    def items(self) -> ItemsView[str, int]:
+        return self._by_key.items()
+
+    def copy(self) -> Dict[str, int]:
+        return dict(self._by_key)
+
+    def __getitem__(self, shortcut: str) -> int:
+        return self._by_key[shortcut]
+
+    def __contains__(self, shortcut: object) -> bool:
+        return shortcut in self._by_key
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_key)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ShortcutMap):
+            return self._by_key == other._by_key
+        if isinstance(other, dict):
+            return self._by_key == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ShortcutMap({self._by_key!r})"
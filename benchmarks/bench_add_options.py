@@ -0,0 +1,44 @@
+"""Benchmark: bulk option loading with add_options().
+
+Loads one million options from a materialized list and from a generator
+and reports the elapsed time and throughput of each.
+
+Usage:
+    python benchmarks/bench_add_options.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import InteractiveMenu
+
+COUNT = 1_000_000
+
+
+def load(items) -> float:
+    """Time add_options() for the given iterable."""
+    menu = InteractiveMenu()
+    start = time.perf_counter()
+    menu.add_options(items)
+    elapsed = time.perf_counter() - start
+    assert len(menu.levels[0].options) == COUNT
+    return elapsed
+
+
+def main() -> None:
+    names = [f"Item {i}" for i in range(COUNT)]
+    cases = [
+        ("list", lambda: names),
+        ("generator", lambda: (f"Item {i}" for i in range(COUNT))),
+    ]
+    print(f"{'source':>10} {'options':>10} {'total (ms)':>12} {'options/s':>14}")
+    for label, make_items in cases:
+        elapsed = load(make_items())
+        print(f"{label:>10} {COUNT:>10} {elapsed * 1e3:>12.1f} {COUNT / elapsed:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark: menu render time as the option count grows.
+
+Renders one frame of a single-level menu for increasing option counts and
+reports the time per option. With O(1) shortcut lookups the per-option
+cost should stay flat, i.e. total render time grows linearly.
+
+Usage:
+    python benchmarks/bench_render.py
+"""
+
+import io
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import InteractiveMenu
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def render_once(size: int) -> float:
+    """Build a menu with ``size`` options and time a single frame."""
+    menu = InteractiveMenu()
+    for i in range(size):
+        menu.add_option(f"Item {i}")
+
+    menu.set_output(io.StringIO())
+    with patch('builtins.input', side_effect=['q']):
+        start = time.perf_counter()
+        menu.ask()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'options':>10} {'total (ms)':>12} {'per option (us)':>16}")
+    for size in SIZES:
+        elapsed = render_once(size)
+        print(f"{size:>10} {elapsed * 1e3:>12.1f} {elapsed / size * 1e6:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
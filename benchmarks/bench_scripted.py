@@ -0,0 +1,58 @@
+"""Benchmark: headless scripted sessions per second.
+
+Runs complete two-level sessions (select, select, confirm) through
+use_script() with rendering disabled, first on one thread and then on
+several threads, each thread driving its own menus.
+
+Usage:
+    python benchmarks/bench_scripted.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import InteractiveMenu
+
+SESSIONS = 20_000
+THREADS = 4
+SCRIPT = ["b", "1", "y"]
+EXPECTED = {"fruit": "Banana", "size": "Large"}
+
+
+def session() -> None:
+    """Run one scripted session and check its result."""
+    menu = InteractiveMenu().use_script(SCRIPT)
+    menu.set_key("fruit").add_options(["Apple", "Banana", "Cherry"]).ask()
+    menu.set_key("size").add_options(["Small", "Large"]).ask()
+    assert menu.get_all_results() == EXPECTED
+
+
+def run(count: int) -> None:
+    for _ in range(count):
+        session()
+
+
+def main() -> None:
+    start = time.perf_counter()
+    run(SESSIONS)
+    elapsed = time.perf_counter() - start
+    print(f"1 thread:  {SESSIONS} sessions in {elapsed:.2f}s ({SESSIONS / elapsed:,.0f}/s)")
+
+    per_thread = SESSIONS // THREADS
+    threads = [threading.Thread(target=run, args=(per_thread,)) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = per_thread * THREADS
+    print(f"{THREADS} threads: {total} sessions in {elapsed:.2f}s ({total / elapsed:,.0f}/s)")
+
+
+if __name__ == '__main__':
+    main()
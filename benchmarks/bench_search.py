@@ -0,0 +1,113 @@
+"""Benchmark: SearchEngine index build and query latency.
+
+Builds a search index over a synthetic product catalog and reports the
+build time, the median latency of several substring and fuzzy queries
+(and of streaming the first page of substring matches with
+``iter_search()``), the per-keystroke latency of typing a query one
+character at a time, and the query cache statistics after replaying the
+typed prefixes.
+
+Usage:
+    python benchmarks/bench_search.py [option_count]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine
+
+DEFAULT_COUNT = 1_000_000
+QUERIES = ["margherita", "blue widget", "sku-424242", "zzzz", "de", "ultra"]
+REPEATS = 5
+PAGE_SIZE = 20
+TYPED_QUERY = "margherita sku-0"
+FUZZY_QUERIES = ["mgrta", "bluwdg", "sku42424", "kbd"]
+
+ADJECTIVES = ["Blue", "Red", "Large", "Small", "Ultra", "Classic", "Deluxe", "Organic",
+              "Spicy", "Vintage", "Modern", "Compact", "Heavy", "Light", "Smart", "Golden"]
+NOUNS = ["Widget", "Gadget", "Margherita", "Burger", "Lamp", "Chair", "Keyboard", "Monitor",
+         "Kettle", "Backpack", "Sneaker", "Notebook", "Speaker", "Blender", "Jacket", "Drone"]
+
+
+def make_catalog(count: int) -> list:
+    """Generate ``count`` reproducible product names."""
+    rng = random.Random(42)
+    return [f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.choice(NOUNS)} SKU-{i:06d}"
+            for i in range(count)]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    options = make_catalog(count)
+
+    start = time.perf_counter()
+    engine = SearchEngine(options, backend='python')
+    build = time.perf_counter() - start
+    print(f"build: {count} options in {build:.2f}s")
+
+    print(f"{'query':>14} {'matches':>9} {'median (ms)':>12} {'first page (ms)':>16}")
+    for query in QUERIES:
+        timings = []
+        page_timings = []
+        for _ in range(REPEATS):
+            engine.reset_refinements()
+            engine.cache_clear()
+            start = time.perf_counter()
+            matches = engine.search(query)
+            timings.append(time.perf_counter() - start)
+            engine.reset_refinements()
+            engine.cache_clear()
+            start = time.perf_counter()
+            list(engine.iter_search(query, limit=PAGE_SIZE))
+            page_timings.append(time.perf_counter() - start)
+        print(f"{query!r:>14} {len(matches):>9} {statistics.median(timings) * 1e3:>12.3f} "
+              f"{statistics.median(page_timings) * 1e3:>16.3f}")
+
+    start = time.perf_counter()
+    engine.fuzzy_search("x")
+    print(f"first fuzzy query (builds the character index): {time.perf_counter() - start:.2f}s")
+    print(f"{'fuzzy query':>14} {'results':>9} {'median (ms)':>12}")
+    for query in FUZZY_QUERIES:
+        timings = []
+        for _ in range(REPEATS):
+            engine.cache_clear()
+            start = time.perf_counter()
+            matches = engine.fuzzy_search(query)
+            timings.append(time.perf_counter() - start)
+        print(f"{query!r:>14} {len(matches):>9} {statistics.median(timings) * 1e3:>12.3f}")
+
+    # Without the refinement stack every prefix is answered from the index
+    prefixes = [TYPED_QUERY[:length] for length in range(1, len(TYPED_QUERY) + 1)]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        engine.reset_refinements()
+        engine.cache_clear()
+        engine.search(prefix)
+    from_index = time.perf_counter() - start
+    engine.reset_refinements()
+    engine.cache_clear()
+    start = time.perf_counter()
+    for prefix in prefixes:
+        engine.search(prefix)
+    refined = time.perf_counter() - start
+    print(f"typing {TYPED_QUERY!r}: {from_index / len(prefixes) * 1e3:.3f} ms/keystroke from the index, "
+          f"{refined / len(prefixes) * 1e3:.3f} ms/keystroke refined")
+
+    # Replaying the prefixes (as when the user retypes) is served by the cache
+    engine.reset_refinements()
+    start = time.perf_counter()
+    for prefix in prefixes:
+        engine.search(prefix)
+    replayed = time.perf_counter() - start
+    info = engine.cache_info()
+    print(f"replayed: {replayed / len(prefixes) * 1e3:.3f} ms/keystroke; cache hits={info.hits} "
+          f"misses={info.misses} size={info.currsize}/{info.maxsize}")
+
+
+if __name__ == '__main__':
+    main()
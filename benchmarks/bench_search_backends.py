@@ -0,0 +1,56 @@
+"""Benchmark: python versus NumPy substring search backends.
+
+Builds a SearchEngine over a synthetic catalog with each available
+backend and reports the build time and the median latency of one-shot
+queries (cache and refinement stack cleared before each run). The NumPy
+row is skipped when NumPy is not installed.
+
+Usage:
+    python benchmarks/bench_search_backends.py [option_count]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine
+from bench_search import make_catalog
+
+DEFAULT_COUNT = 1_000_000
+QUERIES = ["margherita", "blue widget", "sku-424242", "de"]
+REPEATS = 5
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    options = make_catalog(count)
+
+    print(f"{'backend':>8} {'build (s)':>10} " + " ".join(f"{query!r:>14}" for query in QUERIES))
+    for backend in ('python', 'numpy'):
+        try:
+            start = time.perf_counter()
+            engine = SearchEngine(options, backend=backend)
+            # The NumPy corpus is packed on the first query
+            engine.search("warm-up")
+            build = time.perf_counter() - start
+        except ValueError as e:
+            print(f"{backend:>8} skipped: {e}")
+            continue
+        cells = []
+        for query in QUERIES:
+            timings = []
+            for _ in range(REPEATS):
+                engine.reset_refinements()
+                engine.cache_clear()
+                start = time.perf_counter()
+                engine.search(query)
+                timings.append(time.perf_counter() - start)
+            cells.append(f"{statistics.median(timings) * 1e3:>12.1f}ms")
+        print(f"{backend:>8} {build:>10.2f} " + " ".join(cells))
+
+
+if __name__ == '__main__':
+    main()
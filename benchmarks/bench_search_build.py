@@ -0,0 +1,38 @@
+"""Benchmark: SearchEngine index build throughput.
+
+Builds search indexes over synthetic catalogs of growing size and reports
+the build time and throughput. Construction is linear, so options per
+second should stay roughly flat as the catalog grows; a falling
+throughput points at a quadratic step creeping back in.
+
+Usage:
+    python benchmarks/bench_search_build.py [max_count]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine
+from bench_search import make_catalog
+
+DEFAULT_MAX_COUNT = 1_000_000
+
+
+def main() -> None:
+    max_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_COUNT
+    counts = [count for count in (10_000, 100_000, 1_000_000) if count < max_count] + [max_count]
+
+    print(f"{'options':>10} {'build (s)':>10} {'options/s':>12} {'us/option':>10}")
+    for count in counts:
+        options = make_catalog(count)
+        start = time.perf_counter()
+        SearchEngine(options, backend='python')
+        elapsed = time.perf_counter() - start
+        print(f"{count:>10} {elapsed:>10.2f} {count / elapsed:>12,.0f} {elapsed / count * 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: building a search index versus mapping a saved one.
+
+Builds a SearchEngine over a synthetic catalog, saves it, and compares
+the build time with the time to memory-map the saved index (with and
+without the content check against the options), then reports one-shot
+query latency on both engines.
+
+Usage:
+    python benchmarks/bench_search_index.py [option_count]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine
+from bench_search import make_catalog
+
+DEFAULT_COUNT = 1_000_000
+QUERIES = ["margherita", "blue widget", "sku-424242", "de"]
+REPEATS = 5
+
+
+def time_query(engine: SearchEngine, query: str) -> float:
+    """Median latency of a query with the cache and refinement stack cleared."""
+    timings = []
+    for _ in range(REPEATS):
+        engine.reset_refinements()
+        engine.cache_clear()
+        start = time.perf_counter()
+        engine.search(query)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    options = make_catalog(count)
+
+    start = time.perf_counter()
+    built = SearchEngine(options, backend='python')
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.idx")
+        start = time.perf_counter()
+        built.save(path)
+        save = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = SearchEngine.load(path)
+        load = time.perf_counter() - start
+        start = time.perf_counter()
+        SearchEngine.load(path, options=options)
+        checked = time.perf_counter() - start
+
+        print(f"{count} options, index file {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        print(f"build {build:.2f}s, save {save:.2f}s, "
+              f"load {load * 1e3:.1f}ms, load + content check {checked * 1e3:.1f}ms")
+        print(f"{'query':>14} {'built':>10} {'mapped':>10}")
+        for query in QUERIES:
+            print(f"{query!r:>14} {time_query(built, query) * 1e3:>8.1f}ms "
+                  f"{time_query(loaded, query) * 1e3:>8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
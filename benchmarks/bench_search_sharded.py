@@ -0,0 +1,60 @@
+"""Benchmark: sharded search scaling with the number of shards.
+
+Searches a synthetic catalog with ShardedSearchEngine at growing shard
+counts (one worker process per shard) and reports the median latency of
+each query and the speedup over a single in-process shard.
+
+Usage:
+    python benchmarks/bench_search_sharded.py [option_count] [max_shards]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.sharded_search import ShardedSearchEngine
+from bench_search import make_catalog
+
+DEFAULT_COUNT = 2_000_000
+QUERIES = ["margherita", "blue widget", "sku-424242", "de"]
+REPEATS = 5
+
+
+def time_queries(engine: ShardedSearchEngine) -> dict:
+    """Median latency per query, after a warm-up that starts the workers."""
+    engine.search("warm-up")
+    timings: dict = {query: [] for query in QUERIES}
+    # Interleave the queries so none refines the previous one
+    for _ in range(REPEATS):
+        for query in QUERIES:
+            start = time.perf_counter()
+            engine.search(query)
+            timings[query].append(time.perf_counter() - start)
+    return {query: statistics.median(values) for query, values in timings.items()}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    max_shards = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    options = make_catalog(count)
+    print(f"{count} options, {os.cpu_count()} CPUs")
+
+    baseline = None
+    shard_counts = [1] + [n for n in (2, 4, 8, 16) if n <= max_shards]
+    print(f"{'shards':>6} {'build (s)':>10} " + " ".join(f"{query!r:>15}" for query in QUERIES))
+    for shards in shard_counts:
+        start = time.perf_counter()
+        with ShardedSearchEngine(options, shards=shards, cache_size=0) as engine:
+            build = time.perf_counter() - start
+            medians = time_queries(engine)
+        if baseline is None:
+            baseline = medians
+        cells = " ".join(f"{medians[q] * 1e3:>7.1f}ms x{baseline[q] / medians[q]:<4.1f}" for q in QUERIES)
+        print(f"{shards:>6} {build:>10.2f} {cells}".rstrip())
+
+
+if __name__ == '__main__':
+    main()
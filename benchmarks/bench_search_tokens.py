@@ -0,0 +1,56 @@
+"""Benchmark: word-prefix search with the sorted word index.
+
+Builds a SearchEngine over a synthetic catalog, times building its word
+index, and compares the median latency of multi-word prefix queries with
+``token_search()`` against checking every option word by word.
+
+Usage:
+    python benchmarks/bench_search_tokens.py [option_count]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine
+from bench_search import make_catalog
+
+DEFAULT_COUNT = 1_000_000
+QUERIES = ["blu marg", "marg blu sku-0001", "org kett", "sku-42424", "sm"]
+REPEATS = 5
+
+
+def median_ms(function, query: str) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(query)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    options = make_catalog(count)
+    engine = SearchEngine(options, cache_size=0)
+
+    start = time.perf_counter()
+    engine.token_search("warm-up")
+    print(f"word index: {count} options, {len(engine._vocabulary)} words "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    def scan(query: str) -> list:
+        return [i for i in range(count) if engine.is_token_match(i, query)]
+
+    print(f"{'query':>20} {'matches':>9} {'index (ms)':>11} {'scan (ms)':>10}")
+    for query in QUERIES:
+        matches = engine.token_search(query)
+        print(f"{query!r:>20} {len(matches):>9} {median_ms(engine.token_search, query):>11.3f} "
+              f"{median_ms(scan, query):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
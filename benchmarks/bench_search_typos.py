@@ -0,0 +1,66 @@
+"""Benchmark: typo-tolerant search with the BK-tree.
+
+Builds a SearchEngine over a synthetic catalog, times building the
+BK-tree over its word vocabulary, and compares the median latency of
+misspelled queries with ``approximate_search()`` against computing the
+edit distance to every word. The last column is the share of the
+vocabulary the BK-tree compared each query word with.
+
+Usage:
+    python benchmarks/bench_search_typos.py [option_count]
+"""
+
+import os
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import SearchEngine, bktree
+from basic_interactive_menu.bktree import levenshtein
+from bench_search import make_catalog
+
+DEFAULT_COUNT = 100_000
+MAX_DISTANCE = 2
+QUERIES = ["margherta", "blu margherta", "ketle", "orgnic kettel", "sku-01234"]
+REPEATS = 5
+
+
+def median_ms(function, query: str) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(query)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    options = make_catalog(count)
+    engine = SearchEngine(options, cache_size=0)
+
+    start = time.perf_counter()
+    engine.approximate_search("warm-up", MAX_DISTANCE)
+    vocabulary = engine._vocabulary
+    print(f"BK-tree: {count} options, {len(vocabulary)} words "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    def scan(query: str) -> list:
+        return [[word for word in vocabulary if levenshtein(token, word) <= MAX_DISTANCE]
+                for token in query.casefold().split()]
+
+    print(f"{'query':>18} {'matches':>9} {'tree (ms)':>10} {'scan (ms)':>10} {'visited':>8}")
+    for query in QUERIES:
+        with patch.object(bktree, 'levenshtein', wraps=levenshtein) as distance:
+            matches = engine.approximate_search(query, MAX_DISTANCE)
+        visited = distance.call_count / (len(query.split()) * len(vocabulary))
+        print(f"{query!r:>18} {len(matches):>9} "
+              f"{median_ms(lambda q: engine.approximate_search(q, MAX_DISTANCE), query):>10.2f} "
+              f"{median_ms(scan, query):>10.1f} {visited:>8.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,9 @@ setup(
     packages=find_packages(),
     install_requires=[],
     extras_require={
+        'numpy': [
+            'numpy',
+        ],
         'dev': [
             'mypy>=0.910',
             'pytest>=6.0',
@@ -0,0 +1,143 @@
+"""Tests for the asyncio API (ask_async / get_all_results_async)."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+try:
+    import pty
+except ImportError:
+    pty = None
+
+
+def make_reader(*lines):
+    """Create a StreamReader pre-fed with the given answer lines."""
+    reader = asyncio.StreamReader()
+    for line in lines:
+        reader.feed_data(line.encode() + b"\n")
+    reader.feed_eof()
+    return reader
+
+
+class TestAskAsync(unittest.IsolatedAsyncioTestCase):
+    """Test asynchronous menu sessions."""
+
+    def setUp(self):
+        self.stream = StringIO()
+
+    async def test_single_selection(self):
+        """Test selecting an option and confirming asynchronously."""
+        reader = make_reader("1", "y")
+        menu = InteractiveMenu().set_output(self.stream).set_key("fruit")
+        menu.add_options(["Apple", "Banana"])
+        await menu.ask_async(reader=reader)
+        result = await menu.get_all_results_async(reader=reader)
+        self.assertEqual(result, {"fruit": "Banana"})
+        self.assertIn("Choose an option: ", self.stream.getvalue())
+
+    async def test_navigation_semantics(self):
+        """Test shortcuts, return-to-parent and multi-select asynchronously."""
+        reader = make_reader("b", "r", "a", "0 1", "y")
+        menu = InteractiveMenu().set_output(self.stream)
+        await menu.set_key("fruit").add_options(["Apple", "Banana"]).ask_async(reader=reader)
+        await (menu.set_key("size").allow_multiple()
+               .add_options(["Small", "Large"]).ask_async(reader=reader))
+        result = await menu.get_all_results_async(reader=reader)
+        self.assertEqual(result, {"fruit": "Apple", "size": ["Small", "Large"]})
+
+    async def test_search(self):
+        """Test search mode asynchronously."""
+        reader = make_reader("/", "ban", "1", "y")
+        menu = InteractiveMenu().set_output(self.stream).set_key("fruit").enable_search()
+        await menu.add_options(["Apple", "Banana"]).ask_async(reader=reader)
+        result = await menu.get_all_results_async(reader=reader)
+        self.assertEqual(result, {"fruit": "Banana"})
+
+    async def test_quit(self):
+        """Test quitting asynchronously."""
+        menu = InteractiveMenu().set_output(self.stream).add_option("Apple")
+        await menu.ask_async(reader=make_reader("q"))
+        self.assertTrue(menu.has_quit())
+        self.assertIsNone(await menu.get_all_results_async(reader=make_reader()))
+
+    async def test_eof_raises(self):
+        """Test that running out of input raises EOFError like input()."""
+        menu = InteractiveMenu().set_output(self.stream).add_option("Apple")
+        with self.assertRaises(EOFError):
+            await menu.ask_async(reader=make_reader())
+
+    async def test_does_not_block_event_loop(self):
+        """Test that other coroutines keep running while waiting for input."""
+        reader = asyncio.StreamReader()
+        ticks = []
+
+        async def background():
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0)
+            reader.feed_data(b"0\n")
+
+        menu = InteractiveMenu().set_output(self.stream).set_key("fruit").add_option("Apple")
+        task = asyncio.ensure_future(background())
+        await menu.ask_async(reader=reader)
+        await task
+        self.assertEqual(ticks, [0, 1, 2, 3, 4])
+        self.assertEqual(menu.levels[0].result, "Apple")
+
+
+class TestAskAsyncPipedStdin(unittest.IsolatedAsyncioTestCase):
+    """Test the default stdin reader on a pipe."""
+
+    async def test_answers_span_sessions(self):
+        """Test that answers piped at once are shared by consecutive sessions."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"1\ny\n")
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'r') as piped:
+            menu = InteractiveMenu().set_output(StringIO()).set_key("fruit")
+            menu.add_options(["Apple", "Banana"])
+            with patch.object(sys, 'stdin', piped):
+                await menu.ask_async()
+                result = await menu.get_all_results_async()
+        self.assertEqual(result, {"fruit": "Banana"})
+
+
+@unittest.skipIf(pty is None, "pseudo-terminals are not available")
+class TestAskAsyncStdin(unittest.IsolatedAsyncioTestCase):
+    """Test the default stdin reader on a terminal."""
+
+    def setUp(self):
+        self.master, slave = pty.openpty()
+        self.terminal = os.fdopen(slave, 'r')
+        self.stream = StringIO()
+
+    def tearDown(self):
+        self.terminal.close()
+        os.close(self.master)
+
+    async def test_terminal_restored_after_session(self):
+        """Test that stdin and the terminal stay blocking after each session."""
+        os.write(self.master, b"1\ny\n")
+        fd = self.terminal.fileno()
+        menu = InteractiveMenu().set_output(self.stream).set_key("fruit")
+        menu.add_options(["Apple", "Banana"])
+        with patch.object(sys, 'stdin', self.terminal):
+            await menu.ask_async()
+            self.assertTrue(os.get_blocking(fd))
+            result = await menu.get_all_results_async()
+        self.assertEqual(result, {"fruit": "Banana"})
+        self.assertTrue(os.get_blocking(fd))
+        self.assertFalse(self.terminal.closed)
+        os.write(self.master, b"again\n")
+        self.assertEqual(self.terminal.readline(), "again\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
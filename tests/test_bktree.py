@@ -0,0 +1,81 @@
+"""Tests for the BK-tree used by typo-tolerant search."""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu import bktree
+from basic_interactive_menu.bktree import BKTree, levenshtein
+
+
+class TestLevenshtein(unittest.TestCase):
+    """Test the edit distance."""
+
+    def test_distances(self):
+        """Test insertions, deletions and substitutions."""
+        self.assertEqual(levenshtein("", ""), 0)
+        self.assertEqual(levenshtein("abc", ""), 3)
+        self.assertEqual(levenshtein("", "abc"), 3)
+        self.assertEqual(levenshtein("pizza", "pizza"), 0)
+        self.assertEqual(levenshtein("piza", "pizza"), 1)
+        self.assertEqual(levenshtein("pizza", "pitza"), 1)
+        self.assertEqual(levenshtein("kitten", "sitting"), 3)
+        self.assertEqual(levenshtein("margherita", "magherita"), 1)
+
+    def test_symmetric(self):
+        """Test that the distance does not depend on argument order."""
+        self.assertEqual(levenshtein("flaw", "lawn"), levenshtein("lawn", "flaw"))
+
+
+class TestBKTree(unittest.TestCase):
+    """Test BKTree insertion and lookup."""
+
+    WORDS = ["margherita", "marinara", "pepperoni", "pizza", "pasta", "salad", "salsa", "bread"]
+
+    def test_search_ranked_by_distance(self):
+        """Test that words within the distance are found, closest first."""
+        tree = BKTree(self.WORDS)
+        self.assertEqual(tree.search("pizza", 0), [(0, "pizza")])
+        self.assertEqual(tree.search("salsd", 1), [(1, "salad"), (1, "salsa")])
+        self.assertEqual(tree.search("salsa", 2), [(0, "salsa"), (2, "salad")])
+        self.assertEqual(tree.search("xyz", 1), [])
+
+    def test_matches_linear_scan(self):
+        """Test that pruning never loses a word within the distance."""
+        rng = random.Random(7)
+        words = ["".join(rng.choice("abcde") for _ in range(rng.randint(1, 7))) for _ in range(300)]
+        tree = BKTree(words)
+        for query in words[:30] + ["abc", "eeeee", "a"]:
+            for max_distance in range(3):
+                expected = sorted({(levenshtein(query, word), word) for word in words
+                                   if levenshtein(query, word) <= max_distance})
+                self.assertEqual(tree.search(query, max_distance), expected)
+
+    def test_lookup_visits_part_of_vocabulary(self):
+        """Test that a small distance compares the query with few words."""
+        rng = random.Random(3)
+        words = {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8)) for _ in range(2000)}
+        tree = BKTree(words)
+        with patch.object(bktree, 'levenshtein', wraps=levenshtein) as distance:
+            tree.search(next(iter(words)), 1)
+        self.assertLess(distance.call_count, len(words) // 2)
+
+    def test_duplicates_and_add(self):
+        """Test that duplicate words are stored once and add() extends the tree."""
+        tree = BKTree(["pizza", "pizza", "pasta"])
+        self.assertEqual(len(tree), 2)
+        tree.add(["pitza", "pasta"])
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.search("pizza", 1), [(0, "pizza"), (1, "pitza")])
+
+    def test_empty_tree(self):
+        """Test searching a tree without words."""
+        self.assertEqual(BKTree().search("pizza", 2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -123,6 +123,27 @@ class TestMenuConfig(unittest.TestCase):
             MenuConfig.validate_config(config)
         self.assertIn("boolean", str(context.exception))
 
+    def test_validate_config_invalid_search_fields(self):
+        """Test that search_fields must map fields to numeric weights."""
+        for search_fields in (["sku"], {"sku": "high"}, {"sku": True}):
+            config = {
+                "options": ["A", "B"],
+                "search_fields": search_fields
+            }
+            with self.assertRaises(ValueError) as context:
+                MenuConfig.validate_config(config)
+            self.assertIn("search_fields", str(context.exception))
+
+    def test_validate_config_invalid_search_index_type(self):
+        """Test that a non-string search_index raises ValueError."""
+        config = {
+            "options": ["A", "B"],
+            "search_index": 1
+        }
+        with self.assertRaises(ValueError) as context:
+            MenuConfig.validate_config(config)
+        self.assertIn("search_index", str(context.exception))
+
 
 class TestInteractiveMenuFromFile(unittest.TestCase):
     """Test InteractiveMenu.from_file() method."""
@@ -150,7 +171,7 @@ class TestInteractiveMenuFromFile(unittest.TestCase):
             self.assertEqual(menu.menu_title[0], "Select Fruit")
             self.assertEqual(menu.keys[0], "fruit")
             self.assertEqual(len(menu.options[0]), 3)
-            self.assertEqual(menu.options[0][0]["name"], "Apple")
+            self.assertEqual(menu.options[0].name_at(0), "Apple")
         finally:
             os.unlink(temp_path)
 
@@ -0,0 +1,192 @@
+"""Tests for weighted multi-field search."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.field_search import FieldSearchEngine, field_text
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+PRODUCTS = [
+    {'name': "Blue Widget", 'sku': "BW-100", 'tags': ["sale", "blue"]},
+    {'name': "Red Gadget", 'sku': "RG-200", 'description': "A red widget holder"},
+    {'name': "Widget", 'sku': "W-1"},
+    {'name': "Lamp"},
+]
+
+
+class TestFieldSearchEngine(unittest.TestCase):
+    """Test FieldSearchEngine ranking and maintenance."""
+
+    def make_engine(self, **weights):
+        weights = weights or {'name': 1.0, 'sku': 2.0, 'tags': 1.0, 'description': 0.5}
+        return FieldSearchEngine(PRODUCTS, weights)
+
+    def test_matches_any_field(self):
+        """Test that non-name fields are searched."""
+        engine = self.make_engine()
+        self.assertEqual(engine.search("rg-2"), [1])
+        self.assertEqual(engine.search("SALE"), [0])
+        self.assertEqual(engine.search("holder"), [1])
+        self.assertEqual(engine.search("nothing"), [])
+
+    def test_ranked_by_weight_and_match_quality(self):
+        """Test exact and prefix matches and field weights in the ranking."""
+        engine = self.make_engine()
+        # Exact name > name prefix + tag > name substring > description
+        self.assertEqual(engine.search("widget"), [2, 0, 1])
+        self.assertEqual(engine.search("widget", limit=2), [2, 0])
+
+    def test_unweighted_fields_ignored(self):
+        """Test that only fields with a weight are searched."""
+        engine = self.make_engine(name=1.0)
+        self.assertEqual(engine.search("bw-100"), [])
+        self.assertEqual(engine.search("lamp"), [3])
+
+    def test_ties_keep_option_order(self):
+        """Test that equal scores are listed in option order."""
+        engine = FieldSearchEngine([{'name': "xa"}, {'name': "ya"}, {'name': "za"}], {'name': 1.0})
+        self.assertEqual(engine.search("a"), [0, 1, 2])
+
+    def test_empty_query(self):
+        """Test that an empty query lists options in order."""
+        engine = self.make_engine()
+        self.assertEqual(engine.search(""), [0, 1, 2, 3])
+        self.assertEqual(engine.search("", limit=2), [0, 1])
+
+    def test_add(self):
+        """Test that added records are searchable."""
+        engine = self.make_engine()
+        engine.search("zz-9")
+        engine.add([{'name': "Kettle", 'sku': "ZZ-9"}])
+        self.assertEqual(len(engine), 5)
+        self.assertEqual(engine.search("zz-9"), [4])
+
+    def test_is_match(self):
+        """Test checking one option against every field."""
+        engine = self.make_engine()
+        self.assertTrue(engine.is_match(0, "sale"))
+        self.assertTrue(engine.is_match(0, "blue w"))
+        self.assertFalse(engine.is_match(3, "sale"))
+        self.assertFalse(engine.is_match(10, "a"))
+
+    def test_invalid_weights(self):
+        """Test that missing fields and non-positive weights are rejected."""
+        with self.assertRaises(ValueError):
+            FieldSearchEngine(PRODUCTS, {})
+        with self.assertRaises(ValueError):
+            FieldSearchEngine(PRODUCTS, {'name': 1.0, 'sku': 0})
+
+    def test_field_text(self):
+        """Test how field values are converted to text."""
+        self.assertEqual(field_text(None), "")
+        self.assertEqual(field_text(["a", "b"]), "a b")
+        self.assertEqual(field_text(42), "42")
+
+
+class TestFieldSearchInMenu(unittest.TestCase):
+    """Test searching option fields from InteractiveMenu."""
+
+    def setUp(self):
+        self.held_output = StringIO()
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def make_menu(self, **search):
+        menu = InteractiveMenu().set_key("product").enable_search(**search)
+        for product in PRODUCTS:
+            fields = {field: value for field, value in product.items() if field != 'name'}
+            menu.add_option(product['name'], **fields)
+        return menu
+
+    @patch('builtins.input', side_effect=['/', 'rg-200', '1', 'y'])
+    def test_search_by_field(self, mock_input):
+        """Test that a SKU finds its option and is not displayed."""
+        menu = self.make_menu(fields={'sku': 2.0})
+        menu.ask()
+        output = self.held_output.getvalue()
+        self.assertIn("1 match: Red Gadget", output)
+        self.assertNotIn("RG-200", output.replace("Filter", ""))
+        self.assertEqual(menu.get_all_results(), {"product": "Red Gadget"})
+
+    @patch('builtins.input', side_effect=['/', 'widget', '1', 'y'])
+    def test_results_ranked(self, mock_input):
+        """Test that matches are listed best first."""
+        menu = self.make_menu(fields={'description': 0.5})
+        menu.ask()
+        output = self.held_output.getvalue()
+        self.assertIn("3 matches: Widget, Blue Widget, Red Gadget", output)
+        listed = output[output.index("3 matches"):]
+        listed = listed[listed.index("\n["):]
+        self.assertLess(listed.index("]: Widget\n"), listed.index("Blue Widget"))
+        self.assertLess(listed.index("Blue Widget"), listed.index("Red Gadget"))
+        self.assertEqual(menu.get_all_results(), {"product": "Red Gadget"})
+
+    @patch('builtins.input', side_effect=['/', 'zz-9', '4', 'y'])
+    def test_options_added_after_first_search(self, mock_input):
+        """Test that the field index is extended as options are added."""
+        menu = self.make_menu(fields={'sku': 2.0})
+        engine = menu._field_search_engine()
+        menu.add_option("Kettle", sku="ZZ-9")
+        self.assertIs(menu._field_search_engine(), engine)
+        menu.ask()
+        self.assertEqual(menu.get_all_results(), {"product": "Kettle"})
+
+    def test_names_only_without_fields(self):
+        """Test that fields are stored but not searched unless enabled."""
+        menu = self.make_menu()
+        self.assertEqual(menu.levels[0].options.metadata_at(1, 'sku'), "RG-200")
+        self.assertEqual(menu._search_engine().search("rg-200"), [])
+
+    def test_fields_rejected_with_fuzzy_mode(self):
+        """Test that fields require substring mode and positive weights."""
+        with self.assertRaises(ValueError):
+            InteractiveMenu().enable_search(mode='fuzzy', fields={'sku': 1.0})
+        with self.assertRaises(ValueError):
+            InteractiveMenu().enable_search(fields={'sku': -1.0})
+
+    @patch('builtins.input', side_effect=['/', 'w-1', '1', 'y'])
+    def test_from_file(self, mock_input):
+        """Test search fields and extra option keys from a config file."""
+        config = {
+            "key": "product",
+            "search_fields": {"sku": 2},
+            "options": [{"name": "Widget", "sku": "W-1"}, {"name": "Gadget", "sku": "W-100", "shortcut": "g"}],
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config, f)
+            temp_path = f.name
+        try:
+            menu = InteractiveMenu.from_file(temp_path)
+            menu.ask()
+            self.assertIn("2 matches: Widget, Gadget", self.held_output.getvalue())
+            self.assertEqual(menu.get_all_results(), {"product": "Gadget"})
+        finally:
+            os.unlink(temp_path)
+
+    @patch('builtins.input', side_effect=['/', 'w-100', '1', 'y'])
+    def test_from_file_with_search_index(self, mock_input):
+        """Test that a search index does not turn field search off."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = os.path.join(directory, "menu.json")
+            with open(config_path, 'w') as f:
+                json.dump({
+                    "key": "product", "search_fields": {"sku": 2}, "search_index": "menu.idx",
+                    "options": [{"name": "Widget", "sku": "W-1"}, {"name": "Gadget", "sku": "W-100"}],
+                }, f)
+            menu = InteractiveMenu.from_file(config_path)
+            menu.ask()
+            self.assertEqual(menu.levels[0].search_fields, {'name': 1.0, 'sku': 2})
+            self.assertEqual(menu.get_all_results(), {"product": "Gadget"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for per-depth MenuLevel records."""
+
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.level import MenuLevel
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+
+class TestMenuLevel(unittest.TestCase):
+    """Test the MenuLevel record."""
+
+    def test_defaults(self):
+        """Test that a new level starts empty."""
+        level = MenuLevel("Title")
+        self.assertEqual(level.title, "Title")
+        self.assertEqual(len(level.options), 0)
+        self.assertIsNone(level.key)
+        self.assertIsNone(level.result)
+        self.assertFalse(level.multiple_allowed)
+        self.assertFalse(level.search_enabled)
+
+    def test_slots(self):
+        """Test that levels do not carry a per-instance __dict__."""
+        level = MenuLevel("Title")
+        with self.assertRaises(AttributeError):
+            level.unknown = 1
+
+    def test_reset(self):
+        """Test that reset clears a level for reuse."""
+        level = MenuLevel("Title")
+        level.options.append("Apple")
+        level.key = "fruit"
+        level.reset("Other", True)
+        self.assertEqual(len(level.options), 0)
+        self.assertIsNone(level.key)
+        self.assertEqual(level.title, "Other")
+        self.assertTrue(level.multiple_allowed)
+
+
+class TestMenuLevels(unittest.TestCase):
+    """Test how InteractiveMenu pushes and pops levels."""
+
+    def setUp(self):
+        self.menu = InteractiveMenu().set_output(StringIO())
+
+    @patch('builtins.input', side_effect=['0'])
+    def test_selection_pushes_level(self, mock_input):
+        """Test that a selection creates the next level lazily."""
+        self.assertEqual(len(self.menu.levels), 1)
+        self.menu.set_key("fruit").add_option("Apple").ask()
+        self.assertEqual(len(self.menu.levels), 2)
+        self.assertEqual(self.menu.levels[0].result, "Apple")
+        self.assertIs(self.menu._level, self.menu.levels[1])
+
+    @patch('builtins.input', side_effect=['0', 'n'])
+    def test_popped_level_is_reused(self, mock_input):
+        """Test that the trailing empty level is recycled on the next push."""
+        self.menu.set_key("fruit").add_option("Apple").ask()
+        popped = self.menu.levels[1]
+        self.menu.get_all_results()
+        self.assertEqual(len(self.menu.levels), 1)
+        self.menu._to_next()
+        self.assertIs(self.menu.levels[1], popped)
+        self.assertIsNone(self.menu.levels[1].key)
+
+    @patch('builtins.input', side_effect=['0'])
+    def test_compatibility_views(self, mock_input):
+        """Test the list views over all levels."""
+        self.menu.set_title("Fruit").set_key("fruit").add_option("Apple").ask()
+        self.assertEqual(self.menu.keys, ["fruit", None])
+        self.assertEqual(self.menu.results, ["Apple", None])
+        self.assertEqual(self.menu.menu_title[0], "Fruit")
+        self.assertEqual(len(self.menu.options), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
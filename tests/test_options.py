@@ -0,0 +1,193 @@
+"""Tests for the compact option table."""
+
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.options import LazyOptionTable, OptionTable
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+
+class TestOptionTable(unittest.TestCase):
+    """Test OptionTable storage and access."""
+
+    def test_append_and_name_at(self):
+        """Test appending options and reading names back."""
+        table = OptionTable()
+        self.assertEqual(table.append("Apple"), 0)
+        self.assertEqual(table.append("Banana"), 1)
+        self.assertEqual(table.name_at(1), "Banana")
+        self.assertEqual(len(table), 2)
+
+    def test_slicing_and_iteration(self):
+        """Test slices return name lists and iteration yields names."""
+        table = OptionTable(["Apple", "Banana", "Cherry"])
+        self.assertEqual(table[1:], ["Banana", "Cherry"])
+        self.assertEqual(table[-1], "Cherry")
+        self.assertEqual(list(table), ["Apple", "Banana", "Cherry"])
+
+    def test_metadata_columns(self):
+        """Test sparse metadata columns."""
+        table = OptionTable(["Apple", "Banana"])
+        table.set_metadata(1, "sku", "B-01")
+        table.append("Cherry", sku="C-01", color="red")
+        self.assertIsNone(table.metadata_at(0, "sku"))
+        self.assertEqual(table.metadata_at(1, "sku"), "B-01")
+        self.assertEqual(table.metadata_at(2, "color"), "red")
+        self.assertEqual(table.metadata_at(0, "missing", "n/a"), "n/a")
+        self.assertEqual(sorted(table.columns()), ["color", "sku"])
+
+    def test_metadata_index_out_of_range(self):
+        """Test that metadata cannot be attached to a missing option."""
+        table = OptionTable(["Apple"])
+        with self.assertRaises(IndexError):
+            table.set_metadata(5, "sku", "X")
+
+    def test_menu_uses_option_table(self):
+        """Test that menu levels store their options in an OptionTable."""
+        menu = InteractiveMenu().add_options(["Apple", "Banana"])
+        self.assertIsInstance(menu.options[0], OptionTable)
+        self.assertEqual(menu.options[0].name_at(1), "Banana")
+
+    def test_add_options_accepts_generator(self):
+        """Test bulk loading from a generator."""
+        menu = InteractiveMenu().add_options(f"Item {i}" for i in range(1000))
+        self.assertEqual(len(menu.levels[0].options), 1000)
+        self.assertEqual(menu.levels[0].options.name_at(999), "Item 999")
+
+    def test_add_options_keeps_existing_options(self):
+        """Test that bulk loading appends after existing options."""
+        menu = InteractiveMenu().add_option("First", shortcut="f")
+        menu.add_options(iter(["Second", "Third"]))
+        self.assertEqual(list(menu.levels[0].options), ["First", "Second", "Third"])
+        self.assertEqual(menu.levels[0].shortcuts["f"], 0)
+        self.assertIn("[2]: Third", menu.render())
+
+
+def counting_generator(count, pulled):
+    """Yield option names, recording how many were pulled."""
+    for i in range(count):
+        pulled.append(i)
+        yield f"Item {i}"
+
+
+class TestLazyOptionTable(unittest.TestCase):
+    """Test option tables backed by lazy providers."""
+
+    def test_sequence_provider(self):
+        """Test index access into a sequence provider."""
+        table = LazyOptionTable(range(10 ** 9))
+        self.assertEqual(len(table), 10 ** 9)
+        self.assertEqual(table.name_at(123456789), "123456789")
+        self.assertTrue(table.length_known())
+
+    def test_sequence_cache_is_bounded(self):
+        """Test that at most cache_size sequence entries are kept."""
+        table = LazyOptionTable(range(1000), cache_size=10)
+        for i in range(100):
+            table.name_at(i)
+        self.assertEqual(table.materialized_count(), 10)
+
+    def test_iterator_pulled_on_demand(self):
+        """Test that iterator entries are only pulled as far as needed."""
+        pulled = []
+        table = LazyOptionTable(counting_generator(1000, pulled))
+        self.assertEqual(table.name_at(4), "Item 4")
+        self.assertEqual(len(pulled), 5)
+        self.assertFalse(table.length_known())
+        self.assertEqual(table[2:4], ["Item 2", "Item 3"])
+        self.assertEqual(len(pulled), 5)
+        self.assertFalse(table.has_index(5000))
+        self.assertEqual(len(table), 1000)
+        self.assertTrue(table.length_known())
+
+    def test_callable_provider_called_lazily(self):
+        """Test that a callable provider is only invoked on first access."""
+        calls = []
+
+        def provider():
+            calls.append(1)
+            return ["Apple", "Banana"]
+
+        table = LazyOptionTable(provider)
+        self.assertEqual(calls, [])
+        self.assertEqual(table.name_at(1), "Banana")
+        self.assertEqual(table.name_at(0), "Apple")
+        self.assertEqual(calls, [1])
+
+    def test_prefix_and_metadata(self):
+        """Test that existing options stay in front of the provider."""
+        prefix = OptionTable(["All"])
+        prefix.set_metadata(0, "sku", "ALL")
+        table = LazyOptionTable(["Apple"], prefix=prefix)
+        self.assertEqual(list(table), ["All", "Apple"])
+        self.assertEqual(table.metadata_at(0, "sku"), "ALL")
+
+    def test_cannot_append(self):
+        """Test that options cannot be appended after a provider."""
+        table = LazyOptionTable(["Apple"])
+        with self.assertRaises(ValueError):
+            table.append("Banana")
+
+
+class TestOptionSourceInMenu(unittest.TestCase):
+    """Test add_option_source() on InteractiveMenu."""
+
+    def setUp(self):
+        self.stream = StringIO()
+
+    @patch('builtins.input', side_effect=['3', 'y'])
+    def test_paged_source_pulls_only_visible_options(self, mock_input):
+        """Test that a paged frame only materializes the visible window."""
+        pulled = []
+        result = (InteractiveMenu()
+                  .set_output(self.stream)
+                  .set_key("item")
+                  .add_option_source(counting_generator(10 ** 6, pulled))
+                  .set_page_size(5)
+                  .ask()
+                  .get_all_results())
+        self.assertEqual(result, {"item": "Item 3"})
+        self.assertLess(len(pulled), 10)
+        self.assertIn("Page 1/? (options 0-4 of ?)", self.stream.getvalue())
+
+    @patch('builtins.input', side_effect=['>', '@12', '12', 'y'])
+    def test_paging_through_source(self, mock_input):
+        """Test page navigation over a sequence provider."""
+        result = (InteractiveMenu()
+                  .set_output(self.stream)
+                  .set_key("item")
+                  .add_option_source(lambda: [f"Item {i}" for i in range(20)])
+                  .set_page_size(5)
+                  .ask()
+                  .get_all_results())
+        self.assertEqual(result, {"item": "Item 12"})
+        self.assertIn("Page 3/4 (options 10-14 of 20)", self.stream.getvalue())
+
+    @patch('builtins.input', side_effect=['/', 'ana', '1', 'y'])
+    def test_search_over_source(self, mock_input):
+        """Test that search mode works over a lazy level."""
+        result = (InteractiveMenu()
+                  .set_output(self.stream)
+                  .set_key("fruit")
+                  .enable_search()
+                  .add_option_source(iter(["Apple", "Banana"]))
+                  .ask()
+                  .get_all_results())
+        self.assertEqual(result, {"fruit": "Banana"})
+
+    def test_add_option_after_source_raises(self):
+        """Test that eager options cannot follow a source."""
+        menu = InteractiveMenu().add_option_source(["Apple"])
+        with self.assertRaises(ValueError):
+            menu.add_option("Banana")
+        with self.assertRaises(ValueError):
+            menu.add_option_source(["Cherry"])
+
+
+if __name__ == '__main__':
+    unittest.main()
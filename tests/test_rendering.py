@@ -0,0 +1,225 @@
+"""Tests for frame rendering and output streams."""
+
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+
+class CountingStream(StringIO):
+    """StringIO that counts write and flush calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestRender(unittest.TestCase):
+    """Test rendering a frame to a string."""
+
+    def test_render_returns_frame(self):
+        """Test that render() returns the complete frame text."""
+        menu = InteractiveMenu().set_title("Fruit").add_options(["Apple", "Banana"])
+        frame = menu.render()
+        self.assertIn("Step 1:  Fruit", frame)
+        self.assertIn("[0]: Apple", frame)
+        self.assertIn("[1]: Banana", frame)
+        self.assertIn("[q]: Quit", frame)
+        self.assertTrue(frame.endswith("\n"))
+
+    def test_render_does_not_write(self):
+        """Test that render() produces no output on its own."""
+        stream = StringIO()
+        menu = InteractiveMenu().set_output(stream).add_option("Apple")
+        menu.render()
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_render_includes_history(self):
+        """Test that nested levels render the selection history."""
+        menu = InteractiveMenu().set_output(StringIO())
+        with patch('builtins.input', side_effect=['0']):
+            menu.set_key("fruit").add_option("Apple").ask()
+        menu.set_key("size").add_option("Large")
+        frame = menu.render()
+        self.assertIn("History: fruit=Apple \n", frame)
+        self.assertIn("[r]: Return to parent", frame)
+
+
+class TestOutputStream(unittest.TestCase):
+    """Test writing frames to a configurable stream."""
+
+    @patch('builtins.input', side_effect=['q'])
+    def test_frame_written_once(self, mock_input):
+        """Test that a frame costs one write and one flush."""
+        stream = CountingStream()
+        menu = InteractiveMenu().set_output(stream)
+        menu.add_options([f"Item {i}" for i in range(50)])
+        menu.ask()
+        # One frame plus the "Exiting..." message
+        self.assertEqual(stream.writes, 2)
+        self.assertEqual(stream.flushes, 2)
+        self.assertIn("[49]: Item 49", stream.getvalue())
+
+    @patch('builtins.input', side_effect=['0', 'y'])
+    def test_messages_use_stream(self, mock_input):
+        """Test that menu messages go to the configured stream."""
+        stream = StringIO()
+        held_output = StringIO()
+        sys.stdout = held_output
+        try:
+            result = (InteractiveMenu()
+                      .set_output(stream)
+                      .set_key("choice")
+                      .add_option("Apple")
+                      .ask()
+                      .get_all_results())
+        finally:
+            sys.stdout = sys.__stdout__
+        self.assertEqual(result, {"choice": "Apple"})
+        self.assertIn("Current selections:", stream.getvalue())
+        self.assertEqual(held_output.getvalue(), "")
+
+
+class TestRenderCache(unittest.TestCase):
+    """Test memoization of the rendered option rows."""
+
+    def test_reprompt_reuses_option_rows(self):
+        """Test that re-rendering does not format option rows again."""
+        menu = InteractiveMenu().set_theme("colorful").add_options(["Apple", "Banana"])
+        menu.render()
+        with patch.object(menu.theme, 'apply_option') as apply_option:
+            menu.render()
+        apply_option.assert_not_called()
+
+    @patch('builtins.input', side_effect=['x', 'x', 'q'])
+    def test_invalid_input_renders_rows_once(self, mock_input):
+        """Test that invalid input re-prompts without re-formatting rows."""
+        menu = InteractiveMenu().set_output(StringIO()).set_theme("bold")
+        menu.add_options(["Apple", "Banana"])
+        with patch.object(menu.theme, 'apply_option', side_effect=lambda text: text) as apply_option:
+            menu.ask()
+        self.assertEqual(apply_option.call_count, 2)
+
+    def test_add_option_invalidates(self):
+        """Test that adding an option shows up in the next frame."""
+        menu = InteractiveMenu().add_option("Apple")
+        menu.render()
+        menu.add_option("Banana")
+        self.assertIn("[1]: Banana", menu.render())
+
+    def test_add_group_invalidates(self):
+        """Test that adding a group shows up in the next frame."""
+        menu = InteractiveMenu().add_option("Apple")
+        menu.render()
+        menu.add_group("Fruit", ["Cherry"])
+        self.assertIn("Fruit:", menu.render())
+
+    def test_set_theme_invalidates(self):
+        """Test that changing the theme re-renders the option rows."""
+        menu = InteractiveMenu().add_option("Apple")
+        self.assertIn("[0]: Apple\n", menu.render())
+        menu.set_theme("hacker")
+        self.assertIn(menu.theme.apply_option("Apple"), menu.render())
+
+    def test_shortcut_generation_invalidates(self):
+        """Test that generated shortcuts appear in the next frame."""
+        menu = InteractiveMenu().add_option("Apple")
+        self.assertIn("[0]: Apple", menu.render())
+        menu._auto_generate_shortcuts()
+        self.assertIn("[0/A]: Apple", menu.render())
+
+
+class TestPagedMode(unittest.TestCase):
+    """Test the paged viewport for large option lists."""
+
+    def setUp(self):
+        self.stream = StringIO()
+        self.menu = (InteractiveMenu()
+                     .set_output(self.stream)
+                     .set_key("item")
+                     .add_options([f"{i:03d}" for i in range(25)])
+                     .set_page_size(10))
+
+    def test_renders_only_current_page(self):
+        """Test that only the current window of options is rendered."""
+        frame = self.menu.render()
+        self.assertIn("[9]: 009", frame)
+        self.assertNotIn("[10]: 010", frame)
+        self.assertIn("Page 1/3 (options 0-9 of 25)", frame)
+        self.assertIn("[</>]: Previous/next page", frame)
+
+    def test_invalid_page_size(self):
+        """Test that a page size below one is rejected."""
+        with self.assertRaises(ValueError):
+            self.menu.set_page_size(0)
+
+    @patch('builtins.input', side_effect=['>', '>', '>', '<', 'q'])
+    def test_next_and_previous(self, mock_input):
+        """Test moving between pages, clamped at the ends."""
+        self.menu.ask()
+        output = self.stream.getvalue()
+        self.assertIn("Page 3/3 (options 20-24 of 25)", output)
+        self.assertIn("Already on the last page.", output)
+        self.assertIn("[20]: 020", output)
+        self.assertIn("Page 2/3", self.menu.render())
+
+    @patch('builtins.input', side_effect=[':3', '@12', ':9', 'q'])
+    def test_jump_to_page_and_index(self, mock_input):
+        """Test jumping to a page number and to the page of an option."""
+        self.menu.ask()
+        output = self.stream.getvalue()
+        self.assertIn("Page 3/3", output)
+        self.assertIn("Page must be between 1 and 3.", output)
+        self.assertIn("[12]: 012", self.menu.render())
+
+    @patch('builtins.input', side_effect=['24', 'y'])
+    def test_selection_uses_full_list(self, mock_input):
+        """Test that an index outside the current page can be selected."""
+        result = self.menu.ask().get_all_results()
+        self.assertEqual(result, {"item": "024"})
+
+    def test_groups_are_paged(self):
+        """Test that grouped menus render only the current window."""
+        menu = (InteractiveMenu()
+                .add_group("Fruit", ["Apple", "Banana"])
+                .add_group("Veg", ["Carrot", "Daikon"])
+                .set_page_size(3))
+        frame = menu.render()
+        self.assertIn("Fruit:", frame)
+        self.assertIn("[2]: Carrot", frame)
+        self.assertNotIn("Daikon", frame)
+
+    @patch('builtins.input', side_effect=['>', 'q'])
+    def test_group_index_built_once(self, mock_input):
+        """Test that grouped frames reuse the level's name index and extend it."""
+        menu = (InteractiveMenu()
+                .set_output(self.stream)
+                .add_group("Fruit", ["Apple", "Banana"])
+                .add_group("Veg", ["Carrot", "Apple"])
+                .set_page_size(3))
+        menu.render()
+        first_index = menu.levels[0].first_index
+        self.assertEqual(first_index, {"Apple": 0, "Banana": 1, "Carrot": 2})
+        menu.add_group("Nuts", ["Cashew"])
+        self.assertEqual(first_index["Cashew"], 4)
+        menu.ask()
+        self.assertIs(menu.levels[0].first_index, first_index)
+        self.assertIn("]: Cashew", self.stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for injectable input and headless scripted runs."""
+
+import threading
+import unittest
+from io import StringIO
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+
+class TestSetInput(unittest.TestCase):
+    """Test injecting an input function."""
+
+    def test_reader_receives_prompts(self):
+        """Test that the injected reader is used instead of input()."""
+        prompts = []
+        answers = iter(["0", "y"])
+
+        def reader(prompt):
+            prompts.append(prompt)
+            return next(answers)
+
+        result = (InteractiveMenu()
+                  .set_output(StringIO())
+                  .set_input(reader)
+                  .set_key("fruit")
+                  .add_option("Apple")
+                  .ask()
+                  .get_all_results())
+        self.assertEqual(result, {"fruit": "Apple"})
+        self.assertEqual(prompts[0], "Choose an option: ")
+
+
+class TestScripts(unittest.TestCase):
+    """Test scripted sessions."""
+
+    def setUp(self):
+        self.held_output = StringIO()
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_run_script(self):
+        """Test running a single-level session from a script."""
+        menu = InteractiveMenu().set_key("fruit").add_options(["Apple", "Banana"])
+        self.assertEqual(menu.run_script(["b", "y"]), {"fruit": "Banana"})
+        self.assertEqual(self.held_output.getvalue(), "")
+
+    def test_headless_does_not_render(self):
+        """Test that frames are never built without rendering."""
+        menu = InteractiveMenu().set_key("fruit").add_option("Apple")
+        menu.render = None  # Any call to render() would fail
+        self.assertEqual(menu.run_script(["x", "0", "y"]), {"fruit": "Apple"})
+
+    def test_run_script_with_render(self):
+        """Test that render=True keeps the normal output."""
+        stream = StringIO()
+        menu = InteractiveMenu().set_output(stream).add_option("Apple")
+        menu.run_script(["q"], render=True)
+        self.assertIn("[0/A]: Apple", stream.getvalue())
+        self.assertIn("Exiting...", stream.getvalue())
+
+    def test_multi_level_script(self):
+        """Test chaining several levels on one script."""
+        menu = InteractiveMenu().use_script(iter(["a", "r", "b", "0 1", "y"]))
+        menu.set_key("fruit").add_options(["Apple", "Banana"]).ask()
+        menu.set_key("size").allow_multiple().add_options(["Small", "Large"]).ask()
+        self.assertEqual(menu.get_all_results(),
+                         {"fruit": "Banana", "size": ["Small", "Large"]})
+
+    def test_exhausted_script_raises(self):
+        """Test that running out of answers raises EOFError."""
+        menu = InteractiveMenu().add_option("Apple")
+        with self.assertRaises(EOFError):
+            menu.run_script(["x"])
+
+    def test_run_script_restores_input(self):
+        """Test that run_script() leaves the menu's input settings unchanged."""
+        menu = InteractiveMenu().add_option("Apple")
+        menu.run_script(["q"])
+        self.assertIsNone(menu.input_reader)
+        self.assertFalse(menu.headless)
+
+    def test_parallel_scripts(self):
+        """Test that scripted menus can run concurrently on threads."""
+        results = []
+
+        def worker(answer, expected):
+            for _ in range(200):
+                menu = InteractiveMenu().set_key("fruit").add_options(["Apple", "Banana"])
+                results.append(menu.run_script([answer, "y"]) == {"fruit": expected})
+
+        threads = [threading.Thread(target=worker, args=args)
+                   for args in [("0", "Apple"), ("1", "Banana")] * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 800)
+        self.assertTrue(all(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
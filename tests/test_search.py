@@ -8,52 +8,555 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from basic_interactive_menu.search import SearchEngine
+from basic_interactive_menu.search import (
+    INSORT_MAX_WORDS, NUMPY_MIN_OPTIONS, QUERY_CACHE_SIZE, REFINEMENT_DEPTH, CacheInfo, SearchEngine,
+)
 from basic_interactive_menu.interactive_menu import InteractiveMenu
+from basic_interactive_menu.level import SearchHit
 
+try:
+    import numpy  # noqa: F401
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
 
-class TestSearchEngine(unittest.TestCase):
+
+class BackendTestCase(unittest.TestCase):
+    """Base for SearchEngine tests that every substring backend must pass."""
+
+    BACKEND = 'python'
+
+    def make_engine(self, options, **kwargs):
+        engine = SearchEngine(options, backend=self.BACKEND, **kwargs)
+        self.assertEqual(engine.backend, self.BACKEND)
+        return engine
+
+
+class TestSearchEngine(BackendTestCase):
     """Test SearchEngine functionality."""
 
     def test_search_empty_query(self):
         """Test that empty query returns all indices."""
-        engine = SearchEngine(["Apple", "Banana", "Cherry"])
+        engine = self.make_engine(["Apple", "Banana", "Cherry"])
         result = engine.search("")
         self.assertEqual(result, [0, 1, 2])
 
     def test_search_exact_match(self):
         """Test exact substring matching."""
-        engine = SearchEngine(["Apple", "Banana", "Cherry"])
+        engine = self.make_engine(["Apple", "Banana", "Cherry"])
         result = engine.search("app")
         self.assertEqual(result, [0])
 
     def test_search_case_insensitive(self):
         """Test case-insensitive search."""
-        engine = SearchEngine(["Apple", "BANANA", "Cherry"])
+        engine = self.make_engine(["Apple", "BANANA", "Cherry"])
         result = engine.search("banana")
         self.assertEqual(result, [1])
 
     def test_search_multiple_matches(self):
         """Test multiple matches."""
-        engine = SearchEngine(["Python", "Cython", "PyPy", "Pyjama", "Java"])
+        engine = self.make_engine(["Python", "Cython", "PyPy", "Pyjama", "Java"])
         result = engine.search("py")
         # Python, PyPy, Pyjama contain "py" substring
         self.assertEqual(set(result), {0, 2, 3})
 
     def test_search_no_matches(self):
         """Test search with no matches."""
-        engine = SearchEngine(["Apple", "Banana", "Orange"])
+        engine = self.make_engine(["Apple", "Banana", "Orange"])
         result = engine.search("xyz")
         self.assertEqual(result, [])
 
+    def test_trigrams_present_but_not_contiguous(self):
+        """Test that candidates from the trigram index are verified."""
+        engine = self.make_engine(["abcxbcd", "xabcdx"])
+        self.assertEqual(engine.search("abcd"), [1])
+
+    def test_short_queries(self):
+        """Test queries shorter than a trigram."""
+        engine = self.make_engine(["Apple", "Banana", "Cherry"])
+        self.assertEqual(engine.search("a"), [0, 1])
+        self.assertEqual(engine.search("rr"), [2])
+
+    def test_matches_brute_force(self):
+        """Test the indexed search against a plain substring scan."""
+        import random
+        rng = random.Random(7)
+        alphabet = "abc d"
+        options = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                   for _ in range(300)]
+        engine = self.make_engine(options)
+        for _ in range(200):
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+            expected = [i for i, option in enumerate(options) if query in option]
+            self.assertEqual(engine.search(query), expected, query)
+
+    def test_index_postings_sorted_and_unique(self):
+        """Test that repeated trigrams are posted once per option, in order."""
+        if self.BACKEND != 'python':
+            self.skipTest("only the python backend keeps a trigram index")
+        engine = self.make_engine(["Banana", "ANAna", "bandana"])
+        self.assertEqual(engine._index["ana"], [0, 1, 2])
+        self.assertEqual(engine._index["nan"], [0, 1])
+        for postings in engine._index.values():
+            self.assertEqual(postings, sorted(set(postings)))
+
+    def test_search_casefolds(self):
+        """Test that matching uses full case folding, not just lowercasing."""
+        engine = self.make_engine(["Straße", "STRASSE", "Road"])
+        self.assertEqual(engine.search("strasse"), [0, 1])
+        self.assertEqual(engine.search("STRAẞE"), [0, 1])
+        self.assertEqual(engine.search("ss"), [0, 1])
+
     def test_get_matches_summary(self):
         """Test match summary generation."""
-        engine = SearchEngine(["Apple", "Banana", "Cherry"])
+        engine = self.make_engine(["Apple", "Banana", "Cherry"])
         summary = engine.get_matches_summary("app")
         self.assertIn("1 match", summary)
         self.assertIn("Apple", summary)
 
 
+class TestRefinement(BackendTestCase):
+    """Test refinement of previous result sets while typing."""
+
+    def test_extension_filters_previous_matches(self):
+        """Test that extending a query does not consult the index again."""
+        engine = self.make_engine(["Apple", "Application", "Grape", "Maple"])
+        self.assertEqual(engine.search("a"), [0, 1, 2, 3])
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(engine.search("ap"), [0, 1, 2, 3])
+        self.assertEqual(engine.search("app"), [0, 1])
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(engine.search("APPL"), [0, 1])
+            self.assertEqual(engine.search("apple"), [0])
+
+    def test_backspace_pops_stack(self):
+        """Test that shortening a query reuses the stacked state."""
+        engine = self.make_engine(["Apple", "Application", "Grape"])
+        engine.search("ap")
+        engine.search("app")
+        engine.search("appl")
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(engine.search("app"), [0, 1])
+        self.assertEqual([query for query, _ in engine._refinements], ["ap", "app"])
+
+    def test_unrelated_query_resets_stack(self):
+        """Test that a query not extending the stack is answered afresh."""
+        engine = self.make_engine(["Apple", "Banana"])
+        engine.search("app")
+        self.assertEqual(engine.search("nan"), [1])
+        self.assertEqual([query for query, _ in engine._refinements], ["nan"])
+        engine.reset_refinements()
+        self.assertEqual(engine._refinements, [])
+
+    def test_stack_is_bounded(self):
+        """Test that the stack keeps at most REFINEMENT_DEPTH states."""
+        engine = self.make_engine(["a" * 100])
+        for length in range(1, 60):
+            engine.search("a" * length)
+        self.assertEqual(len(engine._refinements), REFINEMENT_DEPTH)
+
+    def test_results_are_copies(self):
+        """Test that mutating a result does not corrupt the stack."""
+        engine = self.make_engine(["Apple", "Grape"])
+        engine.search("ap").clear()
+        self.assertEqual(engine.search("ap"), [0, 1])
+
+    def test_typing_matches_brute_force(self):
+        """Test random typing and deleting against a plain substring scan."""
+        import random
+        rng = random.Random(11)
+        alphabet = "abc "
+        options = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+                   for _ in range(200)]
+        engine = self.make_engine(options)
+        query = ""
+        for _ in range(500):
+            if query and rng.random() < 0.4:
+                query = query[:-1]
+            else:
+                query += rng.choice(alphabet)
+            expected = [i for i, option in enumerate(options) if query in option]
+            self.assertEqual(engine.search(query), expected, query)
+
+
+class TestIterSearch(BackendTestCase):
+    """Test lazy streaming search."""
+
+    OPTIONS = ["Apple", "Banana", "Application", "Grape", "Pineapple", "STRASSE", "Straße"]
+
+    def test_matches_search(self):
+        """Test that iteration yields exactly what search() returns."""
+        for query in ["", "a", "ap", "app", "APPLE", "ss", "xyz", "e"]:
+            engine = self.make_engine(self.OPTIONS)
+            self.assertEqual(list(engine.iter_search(query)), self.make_engine(self.OPTIONS).search(query))
+
+    def test_limit(self):
+        """Test that the limit stops the iteration early."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(list(engine.iter_search("a", limit=2)), [0, 1])
+        self.assertEqual(list(engine.iter_search("", limit=3)), [0, 1, 2])
+        self.assertEqual(list(engine.iter_search("a", limit=0)), [])
+        with self.assertRaises(ValueError):
+            engine.iter_search("a", limit=-1)
+
+    def test_lazy(self):
+        """Test that matches are verified only as they are consumed."""
+        engine = self.make_engine(["x"] * 5 + ["a"] * 1000)
+        results = engine.iter_search("a")
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(next(results), 5)
+
+    def test_exhausted_iteration_cached(self):
+        """Test that a complete iteration is cached and refinable."""
+        engine = self.make_engine(self.OPTIONS)
+        list(engine.iter_search("app"))
+        self.assertEqual(engine.cache_info().currsize, 1)
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(engine.search("appl"), [0, 2, 4])
+            self.assertEqual(list(engine.iter_search("app")), [0, 2, 4])
+
+    def test_partial_iteration_not_cached(self):
+        """Test that an unfinished iteration leaves no cached result."""
+        engine = self.make_engine(self.OPTIONS)
+        next(engine.iter_search("app"))
+        self.assertEqual(engine.cache_info().currsize, 0)
+
+    def test_is_match(self):
+        """Test checking a single option against a query."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertTrue(engine.is_match(0, "APP"))
+        self.assertTrue(engine.is_match(6, "ss"))
+        self.assertFalse(engine.is_match(1, "app"))
+        self.assertFalse(engine.is_match(len(self.OPTIONS), "a"))
+        self.assertFalse(engine.is_match(-1, "a"))
+
+
+class TestTokenSearch(BackendTestCase):
+    """Test word-prefix search."""
+
+    OPTIONS = ["Veggie Burger", "Cheeseburger", "Double Burger", "Veg Wrap", "burger, VEGGIE", "Straße Café"]
+
+    def test_multi_word_prefixes(self):
+        """Test that every query word must start a word of the option."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(engine.token_search("veg bur"), [0, 4])
+        self.assertEqual(engine.token_search("BUR VEG"), [0, 4])
+        self.assertEqual(engine.token_search("bur"), [0, 2, 4])
+        self.assertEqual(engine.token_search("veg"), [0, 3, 4])
+        self.assertEqual(engine.token_search("veg xyz"), [])
+        self.assertEqual(engine.token_search("eggie"), [])
+
+    def test_query_without_words(self):
+        """Test that a query with no words matches every option."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(engine.token_search(""), list(range(len(self.OPTIONS))))
+        self.assertEqual(engine.token_search(" - "), list(range(len(self.OPTIONS))))
+
+    def test_case_folding(self):
+        """Test that words are case-folded like substring search."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(engine.token_search("strasse caf"), [5])
+
+    def test_index_built_once_and_extended(self):
+        """Test that the word index is built lazily and extended by add()."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertIsNone(engine._token_index)
+        engine.token_search("veg")
+        vocabulary = engine._vocabulary
+        self.assertEqual(vocabulary, sorted(vocabulary))
+        engine.add(["Vegan Burrito", "Double Veggie"])
+        self.assertEqual(engine.token_search("veg bur"), [0, 4, 6])
+        self.assertEqual(engine.token_search("double veg"), [7])
+        # New words are merged into the existing vocabulary, not re-sorted into a new one
+        self.assertIs(engine._vocabulary, vocabulary)
+        self.assertEqual(engine._vocabulary, sorted(engine._token_index))
+        engine.add(f"Item{i:03d} Extra{i}" for i in range(INSORT_MAX_WORDS))
+        self.assertEqual(engine._vocabulary, sorted(engine._token_index))
+        self.assertEqual(engine.token_search("item007"), [15])
+
+    def test_results_cached(self):
+        """Test that word queries share the query cache, in any word order."""
+        engine = self.make_engine(self.OPTIONS)
+        engine.token_search("veg bur")
+        result = engine.token_search("bur  VEG")
+        self.assertEqual(result, [0, 4])
+        self.assertEqual(engine.cache_info().hits, 1)
+        result.append(99)
+        self.assertEqual(engine.token_search("veg bur"), [0, 4])
+
+    def test_is_token_match(self):
+        """Test checking a single option word by word."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertTrue(engine.is_token_match(0, "bur veg"))
+        self.assertFalse(engine.is_token_match(1, "bur"))
+        self.assertFalse(engine.is_token_match(len(self.OPTIONS), "veg"))
+
+
+class TestApproximateSearch(BackendTestCase):
+    """Test typo-tolerant search."""
+
+    OPTIONS = ["Margherita Pizza", "Pepperoni Pizza", "Caesar Salad", "Greek Salad", "Pasta Salsa"]
+
+    def test_ranked_by_distance(self):
+        """Test that options are ranked by the summed edits of the query words."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(engine.approximate_search("magherita"), [0])
+        self.assertEqual(engine.approximate_search("grek salsd"), [3])
+        self.assertEqual(engine.approximate_search("salsa"), [4, 2, 3])
+        self.assertEqual(engine.approximate_search("salsa", limit=2), [4, 2])
+        self.assertEqual(engine.approximate_search("salsa", max_distance=1), [4])
+        self.assertEqual(engine.approximate_search("piza margarita", max_distance=1), [])
+
+    def test_query_without_words(self):
+        """Test that a query with no words matches every option."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertEqual(engine.approximate_search(" "), list(range(len(self.OPTIONS))))
+
+    def test_tree_built_once_and_extended(self):
+        """Test that the BK-tree is built lazily and extended by add()."""
+        engine = self.make_engine(self.OPTIONS)
+        self.assertIsNone(engine._bktree)
+        engine.approximate_search("piza")
+        tree = engine._bktree
+        self.assertEqual(len(tree), len(engine._vocabulary))
+        engine.add(["Pizza Bianca"])
+        self.assertIs(engine._bktree, tree)
+        self.assertEqual(engine.approximate_search("bianka"), [5])
+        self.assertEqual(len(tree), len(engine._vocabulary))
+
+    def test_results_cached(self):
+        """Test that approximate queries share the query cache."""
+        engine = self.make_engine(self.OPTIONS)
+        engine.approximate_search("salsd grek")
+        self.assertEqual(engine.approximate_search("grek  salsd"), [3])
+        self.assertEqual(engine.cache_info().hits, 1)
+
+    def test_invalid_arguments(self):
+        """Test that negative distances and limits are rejected."""
+        engine = self.make_engine(self.OPTIONS)
+        with self.assertRaises(ValueError):
+            engine.approximate_search("piza", max_distance=-1)
+        with self.assertRaises(ValueError):
+            engine.approximate_search("piza", limit=-1)
+
+
+class TestFuzzySearch(unittest.TestCase):
+    """Test ranked subsequence search."""
+
+    def setUp(self):
+        self.engine = SearchEngine(["Marinara", "Margherita", "Garlic Bread",
+                                    "Mega Gratin", "grt", "Four Cheese"])
+
+    def test_abbreviation_matches(self):
+        """Test that an abbreviation finds options containing it as a subsequence."""
+        self.assertEqual(self.engine.fuzzy_search("mgrta"), [1])
+        self.assertEqual(self.engine.fuzzy_search("GB"), [2])
+
+    def test_no_match(self):
+        """Test queries whose characters are missing or out of order."""
+        self.assertEqual(self.engine.fuzzy_search("xyz"), [])
+        self.assertEqual(self.engine.fuzzy_search("ehc"), [])
+
+    def test_ranking(self):
+        """Test that tight and word-boundary matches rank first."""
+        self.assertEqual(self.engine.fuzzy_search("gr"), [3, 4, 2, 1])
+        self.assertEqual(self.engine.fuzzy_search("mar")[:2], [0, 1])
+
+    def test_word_initials_outrank_narrow_windows(self):
+        """Test that wide word-initial matches are scored, not cut by window width."""
+        options = [f"Zvxbiq {i}" for i in range(10)] + ["Vcc Xtphoujw Iyvl Qiwstmm"]
+        engine = SearchEngine(options)
+        self.assertEqual(engine.fuzzy_search("vxiq", limit=1), [10])
+        self.assertEqual(engine.fuzzy_search("vxiq", limit=3), [10, 0, 1])
+
+    def test_limit(self):
+        """Test that at most ``limit`` results are returned."""
+        self.assertEqual(self.engine.fuzzy_search("a", limit=2), [0, 1])
+        self.assertEqual(self.engine.fuzzy_search("a", limit=0), [])
+        self.assertEqual(self.engine.fuzzy_search("", limit=3), [0, 1, 2])
+
+    def test_matches_brute_force(self):
+        """Test that fuzzy results are exactly the subsequence matches."""
+        import random
+        rng = random.Random(3)
+        alphabet = "abcd "
+        options = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+                   for _ in range(200)]
+        engine = SearchEngine(options)
+
+        def is_subsequence(query, text):
+            chars = iter(text)
+            return all(char in chars for char in query)
+
+        for _ in range(100):
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            expected = {i for i, option in enumerate(options) if is_subsequence(query, option)}
+            self.assertEqual(set(engine.fuzzy_search(query, limit=len(options))), expected, query)
+
+    def test_added_options_are_searched(self):
+        """Test that the character index follows add()."""
+        self.assertEqual(self.engine.fuzzy_search("qz"), [])
+        self.engine.add(["Quiz"])
+        self.assertEqual(self.engine.fuzzy_search("qz"), [6])
+
+
+class TestQueryCache(BackendTestCase):
+    """Test the LRU query cache."""
+
+    def test_hits_and_misses(self):
+        """Test that repeated queries are counted as cache hits."""
+        engine = self.make_engine(["Apple", "Banana"])
+        engine.search("app")
+        engine.search("nan")
+        self.assertEqual(engine.search("APP"), [0])
+        info = engine.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+        self.assertEqual(info.maxsize, QUERY_CACHE_SIZE)
+
+    def test_cached_result_not_recomputed(self):
+        """Test that a cache hit skips the index."""
+        engine = self.make_engine(["Apple", "Banana"])
+        engine.search("app")
+        engine.search("nan")
+        with patch.object(engine, '_lookup', side_effect=AssertionError):
+            self.assertEqual(engine.search("app"), [0])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used result is evicted."""
+        engine = self.make_engine(["Apple", "Banana", "Cherry"], cache_size=2)
+        engine.search("app")
+        engine.search("ban")
+        engine.search("app")
+        engine.search("che")
+        self.assertEqual(list(engine._cache), [('substring', 'app'), ('substring', 'che')])
+
+    def test_fuzzy_results_cached_per_limit(self):
+        """Test that fuzzy results are cached by query and limit."""
+        engine = self.make_engine(["Apple", "Maple"])
+        engine.fuzzy_search("ple")
+        engine.fuzzy_search("ple", limit=1)
+        self.assertEqual(engine.fuzzy_search("ple"), [0, 1])
+        self.assertEqual(engine.cache_info().hits, 1)
+
+    def test_add_invalidates(self):
+        """Test that adding options clears cached results."""
+        engine = self.make_engine(["Apple"])
+        self.assertEqual(engine.search("app"), [0])
+        engine.add(["Applet"])
+        self.assertEqual(engine.cache_info().currsize, 0)
+        self.assertEqual(engine.search("app"), [0, 1])
+
+    def test_cache_disabled_and_cleared(self):
+        """Test cache_size=0 and cache_clear()."""
+        engine = self.make_engine(["Apple"], cache_size=0)
+        engine.search("app")
+        engine.search("pp")
+        self.assertEqual(engine.cache_info().currsize, 0)
+        engine.cache_clear()
+        self.assertEqual(engine.cache_info(), CacheInfo(0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            self.make_engine([], cache_size=-1)
+
+    def test_summary_uses_given_matches(self):
+        """Test that a summary of known matches does not search again."""
+        engine = self.make_engine(["Apple", "Banana"])
+        with patch.object(engine, 'search', side_effect=AssertionError):
+            self.assertEqual(engine.get_matches_summary("x", [1]), "1 match: Banana")
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test choosing the substring search backend."""
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with self.assertRaises(ValueError):
+            SearchEngine([], backend='rust')
+
+    def test_numpy_required(self):
+        """Test that the numpy backend needs NumPy and 'auto' falls back."""
+        with patch.dict(sys.modules, {'numpy': None, 'basic_interactive_menu.numpy_backend': None}):
+            with self.assertRaises(ValueError):
+                SearchEngine(["Apple"], backend='numpy')
+            engine = SearchEngine(["Apple"] * NUMPY_MIN_OPTIONS, backend='auto')
+        self.assertEqual(engine.backend, 'python')
+
+    def test_default_is_python(self):
+        """Test that large corpora stay on the trigram index unless NumPy is requested."""
+        self.assertEqual(SearchEngine(["Apple"] * NUMPY_MIN_OPTIONS).backend, 'python')
+
+    def test_auto_small_corpus_uses_python(self):
+        """Test that 'auto' keeps small menus on the trigram index."""
+        self.assertEqual(SearchEngine(["Apple"], backend='auto').backend, 'python')
+
+    @unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+    def test_auto_large_corpus_uses_numpy(self):
+        """Test that 'auto' picks NumPy for large corpora."""
+        self.assertEqual(SearchEngine(["Apple"] * NUMPY_MIN_OPTIONS, backend='auto').backend, 'numpy')
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestSearchEngineNumpy(TestSearchEngine):
+    """Run the SearchEngine tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+    def test_separator_in_query(self):
+        """Test that a query cannot match across packed options."""
+        engine = self.make_engine(["ab", "cd", "b\x00c"])
+        self.assertEqual(engine.search("b\x00c"), [2])
+
+    def test_multibyte_text(self):
+        """Test matching of non-ASCII text in the UTF-8 buffer."""
+        engine = self.make_engine(["Crème brûlée", "Café", "Cafe"])
+        self.assertEqual(engine.search("CAFÉ"), [1])
+        self.assertEqual(engine.search("é"), [0, 1])
+
+    def test_added_options_repacked(self):
+        """Test that options added after a query are searched."""
+        engine = self.make_engine(["Apple"])
+        self.assertEqual(engine.search("pl"), [0])
+        engine.add(["Maple"])
+        self.assertEqual(engine.search("pl"), [0, 1])
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestRefinementNumpy(TestRefinement):
+    """Run the refinement tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestQueryCacheNumpy(TestQueryCache):
+    """Run the query cache tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestIterSearchNumpy(TestIterSearch):
+    """Run the streaming tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+    def test_lazy(self):
+        self.skipTest("The NumPy backend finds all matches in one vectorized pass")
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestTokenSearchNumpy(TestTokenSearch):
+    """Run the word-prefix tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestApproximateSearchNumpy(TestApproximateSearch):
+    """Run the typo-tolerant search tests against the NumPy backend."""
+
+    BACKEND = 'numpy'
+
+
 class TestSearchInMenu(unittest.TestCase):
     """Test search functionality within InteractiveMenu."""
 
@@ -72,6 +575,212 @@ class TestSearchInMenu(unittest.TestCase):
         output = self.held_output.getvalue()
         self.assertIn("[/]: Search", output)
 
+    @patch('builtins.input', side_effect=['/', 'BAN', '1', 'y'])
+    def test_search_query_not_lowercased_by_menu(self, mock_input):
+        """Test that mixed-case queries match through the engine's folding."""
+        menu = InteractiveMenu()
+        menu.set_key("fruit").enable_search().add_options(["Apple", "Banana"]).ask()
+        self.assertEqual(menu.get_all_results(), {"fruit": "Banana"})
+
+    @patch('builtins.input', side_effect=['/', 'app', '/', '/', '/', 'ban', '1', 'y'])
+    def test_engine_built_once_per_level(self, mock_input):
+        """Test that the level's index is reused across search sessions."""
+        menu = InteractiveMenu()
+        menu.set_key("fruit").enable_search().add_options(["Apple", "Banana"])
+        with patch('basic_interactive_menu.interactive_menu.SearchEngine',
+                   wraps=SearchEngine) as engine_class:
+            menu.ask()
+        self.assertEqual(engine_class.call_count, 1)
+        self.assertIsNotNone(menu.levels[0].search_engine)
+        self.assertEqual(menu.get_all_results(), {"fruit": "Banana"})
+
+    @patch('builtins.input', side_effect=['/', 'mgrta', '1', 'y'])
+    def test_fuzzy_mode(self, mock_input):
+        """Test that fuzzy mode lists ranked subsequence matches."""
+        menu = InteractiveMenu()
+        menu.set_key("pizza").enable_search(mode='fuzzy')
+        menu.add_options(["Marinara", "Margherita"]).ask()
+        self.assertIn("1 match: Margherita", self.held_output.getvalue())
+        self.assertEqual(menu.get_all_results(), {"pizza": "Margherita"})
+
+    @patch('builtins.input', side_effect=['/', 'item', '24', 'y'])
+    def test_first_page_then_total(self, mock_input):
+        """Test that large result sets list one page and report the total after it."""
+        menu = InteractiveMenu()
+        menu.set_key("item").enable_search().add_options(f"Item {i}" for i in range(50)).ask()
+        output = self.held_output.getvalue()
+        search_output = output[output.index("First 20 matches"):]
+        self.assertIn("[19]: Item 19", search_output)
+        self.assertNotIn("[20]: Item 20", search_output)
+        self.assertLess(search_output.index("[19]: Item 19"),
+                        search_output.index("50 matches available"))
+        # Matches beyond the first page can still be selected
+        self.assertEqual(menu.get_all_results(), {"item": "Item 24"})
+
+    @patch('builtins.input', side_effect=['/', 'item', '3', 'y'])
+    def test_search_page_follows_level_page_size(self, mock_input):
+        """Test that a level's page size bounds the listed matches."""
+        menu = InteractiveMenu()
+        menu.set_key("item").enable_search().set_page_size(5)
+        menu.add_options(f"Item {i}" for i in range(8)).ask()
+        output = self.held_output.getvalue()
+        self.assertIn("First 5 matches", output)
+        self.assertIn("8 matches available", output)
+        self.assertEqual(menu.get_all_results(), {"item": "Item 3"})
+
+    @patch('builtins.input', side_effect=['/', 'apple', '1', 'apple', '0', 'y'])
+    def test_non_matching_index_rejected(self, mock_input):
+        """Test that only options matching the query can be selected."""
+        menu = InteractiveMenu()
+        menu.set_key("fruit").enable_search().add_options(["Apple", "Banana"]).ask()
+        self.assertIn("Invalid selection", self.held_output.getvalue())
+        self.assertEqual(menu.get_all_results(), {"fruit": "Apple"})
+
+    @patch('builtins.input', side_effect=['/', 'veg bur', '1', '/', 'veg bur', '2', 'y'])
+    def test_words_mode(self, mock_input):
+        """Test that words mode matches word prefixes in any order."""
+        menu = InteractiveMenu()
+        menu.set_key("food").enable_search(mode='words')
+        menu.add_options(["Veggie Burger", "Cheeseburger", "Burger, veggie"]).ask()
+        output = self.held_output.getvalue()
+        self.assertIn("2 matches: Veggie Burger, Burger, veggie", output)
+        self.assertIn("Invalid selection", output)
+        self.assertEqual(menu.get_all_results(), {"food": "Burger, veggie"})
+
+    @patch('builtins.input', side_effect=['/', 'salda', '0', 'salda', '1', 'y'])
+    def test_typo_fallback(self, mock_input):
+        """Test that a query without matches lists the closest options."""
+        menu = InteractiveMenu()
+        menu.set_key("dish").enable_search(typos=2)
+        menu.add_options(["Margherita Pizza", "Greek Salad", "Pasta Salsa"]).ask()
+        output = self.held_output.getvalue()
+        self.assertIn("No exact matches; did you mean:", output)
+        listed = output[output.index("did you mean"):]
+        self.assertLess(listed.index("Pasta Salsa"), listed.index("Greek Salad"))
+        self.assertNotIn("Margherita", listed)
+        self.assertIn("Invalid selection", output)
+        self.assertEqual(menu.get_all_results(), {"dish": "Greek Salad"})
+
+    @patch('builtins.input', side_effect=['/', 'grek', 'greek', '0', 'y'])
+    def test_no_typo_fallback_by_default(self, mock_input):
+        """Test that typo tolerance is opt-in."""
+        menu = InteractiveMenu()
+        menu.set_key("dish").enable_search().add_options(["Greek Salad"]).ask()
+        output = self.held_output.getvalue()
+        self.assertIn("No matches found", output)
+        self.assertNotIn("did you mean", output)
+        self.assertEqual(menu.get_all_results(), {"dish": "Greek Salad"})
+
+    def test_negative_typos_rejected(self):
+        """Test that a negative typo distance is rejected."""
+        with self.assertRaises(ValueError):
+            InteractiveMenu().enable_search(typos=-1)
+
+    def test_unknown_search_mode(self):
+        """Test that an unknown search mode is rejected."""
+        with self.assertRaises(ValueError):
+            InteractiveMenu().enable_search(mode='regex')
+
+    def test_engine_updated_incrementally(self):
+        """Test that options added after the first search are indexed."""
+        menu = InteractiveMenu()
+        menu.enable_search().add_options(["Apple", "Banana"])
+        engine = menu._search_engine()
+        self.assertEqual(engine.search("an"), [1])
+        menu.add_option("Mango").add_options(iter(["Cantaloupe"]))
+        menu.add_group("Citrus", ["Orange"])
+        self.assertIs(menu._search_engine(), engine)
+        self.assertEqual(engine.search("an"), [1, 2, 3, 4])
+        self.assertEqual(engine.options[4], "Orange")
+
+    def test_option_source_drops_engine(self):
+        """Test that switching to a lazy option source rebuilds the index."""
+        menu = InteractiveMenu()
+        menu.enable_search().add_option("Apple")
+        menu._search_engine()
+        menu.add_option_source(["Apricot"])
+        self.assertIsNone(menu.levels[0].search_engine)
+        self.assertEqual(menu._search_engine().search("ap"), [0, 1])
+
+
+class TestGlobalSearch(unittest.TestCase):
+    """Test '//' search across every menu level."""
+
+    def setUp(self):
+        self.held_output = StringIO()
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def build_three_levels(self):
+        """Answer levels 0 and 1 and fill level 2."""
+        menu = InteractiveMenu().enable_global_search()
+        menu.use_script(['0']).add_options(["data1.csv", "data2.json"]).ask("File", "file")
+        menu.use_script(['1']).add_options(["A", "B"]).ask("Class", "class_name")
+        return menu.add_options(["Line Chart", "Bar Chart", "Bar Code"])
+
+    def test_hits_carry_paths(self):
+        """Test that hits list every level in order with their paths."""
+        menu = self.build_three_levels()
+        hits = list(menu.iter_search_all("a"))
+        self.assertEqual(hits[0], SearchHit(0, 0, "data1.csv", ("data1.csv",)))
+        self.assertEqual(hits[2], SearchHit(1, 0, "A", ("data1.csv", "A")))
+        self.assertEqual([str(hit) for hit in hits[3:]], [
+            "data1.csv > B > Line Chart", "data1.csv > B > Bar Chart", "data1.csv > B > Bar Code",
+        ])
+        self.assertEqual(len(list(menu.iter_search_all("bar", limit=1))), 1)
+        with self.assertRaises(ValueError):
+            menu.iter_search_all("bar", limit=-1)
+
+    def test_jump_to_deeper_level(self):
+        """Test choosing a leaf from the root keeps the ancestor selections."""
+        menu = self.build_three_levels()
+        menu.use_script(['r', 'r', '//', 'code', '0'], render=True).ask("Chart", "chart")
+        self.assertIn("[0]: data1.csv > B > Bar Code", self.held_output.getvalue())
+        menu.use_script(['y'])
+        self.assertEqual(menu.get_all_results(),
+                         {"file": "data1.csv", "class_name": "B", "chart": "Bar Code"})
+
+    def test_jump_to_parent_level(self):
+        """Test choosing a hit above the current level continues below it."""
+        menu = self.build_three_levels()
+        menu.use_script(['//', 'json', '0', '1', '1']).ask("Chart", "chart")
+        menu.use_script(['y'])
+        self.assertEqual(menu.get_all_results(),
+                         {"file": "data2.json", "class_name": "B", "chart": "Bar Chart"})
+
+    def test_indexes_shared_and_extended(self):
+        """Test that each level is indexed once and updated as options are added."""
+        menu = self.build_three_levels()
+        with patch('basic_interactive_menu.interactive_menu.SearchEngine',
+                   wraps=SearchEngine) as engine_class:
+            list(menu.iter_search_all("a"))
+            list(menu.iter_search_all("b"))
+        self.assertEqual(engine_class.call_count, 3)
+        menu.add_option("Area Chart")
+        self.assertEqual([hit.name for hit in menu.iter_search_all("area")], ["Area Chart"])
+
+    def test_page_and_invalid_selection(self):
+        """Test the first page, the total and rejected selections."""
+        menu = InteractiveMenu().enable_global_search()
+        menu.use_script(['//', 'item', '25', 'item 24', '0', 'y'], render=True)
+        menu.set_key("item").add_options(f"Item {i}" for i in range(30)).ask()
+        output = self.held_output.getvalue()
+        self.assertIn("[//]: Search all levels", output)
+        self.assertIn("First 20 matches on all levels", output)
+        self.assertIn("30 matches available", output)
+        self.assertIn("Invalid selection", output)
+        self.assertEqual(menu.get_all_results(), {"item": "Item 24"})
+
+    def test_disabled_by_default(self):
+        """Test that '//' is not a command unless enabled."""
+        menu = InteractiveMenu().enable_search()
+        menu.use_script(['//', 'q'], render=True).add_option("Apple").ask()
+        output = self.held_output.getvalue()
+        self.assertNotIn("Search all levels", output)
+        self.assertIn("Invalid input", output)
+
 
 if __name__ == '__main__':
     unittest.main()
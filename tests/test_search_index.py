@@ -0,0 +1,217 @@
+"""Tests for on-disk search indexes."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.search import SearchEngine
+from basic_interactive_menu.search_index import MappedFile, MappedPostings, MappedStrings
+from basic_interactive_menu.interactive_menu import InteractiveMenu
+
+OPTIONS = [
+    "Margherita Pizza", "Pepperoni Pizza", "Hawaiian Pizza", "Caesar Salad",
+    "Greek Salad", "Garlic Bread", "STRASSE", "Straße", "Crème brûlée", "Ab",
+]
+QUERIES = ["", "a", "pi", "piz", "pizza", "salad", "strasse", "ss", "BRÛL", "xyz", "ab"]
+
+
+class IndexFileTestCase(unittest.TestCase):
+    """Base providing a temporary directory for index files."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "options.idx"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+class TestSaveLoad(IndexFileTestCase):
+    """Test SearchEngine.save() and SearchEngine.load()."""
+
+    def test_round_trip_matches_in_memory_engine(self):
+        """Test that a loaded engine answers like the engine it was saved from."""
+        engine = SearchEngine(OPTIONS)
+        engine.save(self.path)
+        loaded = SearchEngine.load(self.path)
+        self.assertIsInstance(loaded.options, MappedStrings)
+        self.assertIsInstance(loaded._index, MappedPostings)
+        self.assertEqual(list(loaded.options), OPTIONS)
+        for query in QUERIES:
+            loaded.reset_refinements()
+            self.assertEqual(loaded.search(query), SearchEngine(OPTIONS).search(query), query)
+
+    def test_loaded_engine_refines_and_caches(self):
+        """Test typing a query into a loaded engine."""
+        SearchEngine(OPTIONS).save(self.path)
+        loaded = SearchEngine.load(self.path)
+        for prefix in ("p", "pi", "piz", "pizz", "pizza"):
+            self.assertEqual(loaded.search(prefix), SearchEngine(OPTIONS).search(prefix))
+        loaded.search("pizza")
+        self.assertEqual(loaded.cache_info().hits, 1)
+
+    def test_fuzzy_search_on_loaded_engine(self):
+        """Test that fuzzy search works from the mapped corpus."""
+        SearchEngine(OPTIONS).save(self.path)
+        loaded = SearchEngine.load(self.path)
+        self.assertEqual(loaded.fuzzy_search("mgrta"), SearchEngine(OPTIONS).fuzzy_search("mgrta"))
+
+    def test_token_search_on_loaded_engine(self):
+        """Test that the word index is built from the mapped corpus."""
+        SearchEngine(OPTIONS).save(self.path)
+        loaded = SearchEngine.load(self.path)
+        self.assertEqual(loaded.token_search("piz marg"), [0])
+        loaded.add(["Margarita Cocktail"])
+        self.assertEqual(loaded.token_search("marg"), [0, len(OPTIONS)])
+
+    def test_add_after_load(self):
+        """Test that adding options copies the mapped index into memory."""
+        SearchEngine(OPTIONS).save(self.path)
+        loaded = SearchEngine.load(self.path)
+        loaded.search("pizza")
+        mapping = loaded._mapping
+        loaded.add(["Veggie Pizza"])
+        self.assertIsInstance(loaded.options, list)
+        self.assertTrue(mapping.closed)
+        self.assertEqual(loaded.search("pizza"), [0, 1, 2, len(OPTIONS)])
+        self.assertEqual(loaded.options[-1], "Veggie Pizza")
+
+    def test_close(self):
+        """Test that close() unmaps the file after any kind of query."""
+        SearchEngine(OPTIONS).save(self.path)
+        with SearchEngine.load(self.path) as loaded:
+            mapping = loaded._mapping
+            for query in QUERIES:
+                loaded.search(query)
+            next(loaded.iter_search("pizza"))
+            loaded.fuzzy_search("mgrta")
+            loaded.token_search("piz")
+        self.assertTrue(mapping.closed)
+        self.assertIsNone(loaded._mapping)
+        SearchEngine(["Other"]).save(self.path)
+        self.assertEqual(list(SearchEngine.load(self.path).options), ["Other"])
+
+    def test_rejected_file_unmapped(self):
+        """Test that a file failing validation is unmapped before the error is raised."""
+        SearchEngine(OPTIONS).save(self.path)
+        with patch.object(MappedFile, 'close', autospec=True, side_effect=MappedFile.close) as close:
+            with self.assertRaises(ValueError):
+                SearchEngine.load(self.path, options=["Other"])
+            close.assert_called_once()
+        self.assertTrue(close.call_args[0][0].closed)
+
+    def test_empty_engine(self):
+        """Test saving and loading an engine without options."""
+        SearchEngine([]).save(self.path)
+        loaded = SearchEngine.load(self.path)
+        self.assertEqual(loaded.search("abc"), [])
+        self.assertEqual(len(loaded.options), 0)
+
+    def test_options_must_match(self):
+        """Test that the stored content hash is checked against the options."""
+        SearchEngine(OPTIONS).save(self.path)
+        self.assertEqual(len(SearchEngine.load(self.path, options=OPTIONS).options), len(OPTIONS))
+        with self.assertRaises(ValueError):
+            SearchEngine.load(self.path, options=OPTIONS + ["New"])
+
+    def test_invalid_files(self):
+        """Test that files that are not indexes are rejected."""
+        self.path.write_bytes(b"")
+        with self.assertRaises(ValueError):
+            SearchEngine.load(self.path)
+        self.path.write_bytes(b"not an index file at all, just some text" * 4)
+        with self.assertRaises(ValueError):
+            SearchEngine.load(self.path)
+
+    def test_truncated_file(self):
+        """Test that a truncated index is rejected."""
+        SearchEngine(OPTIONS).save(self.path)
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:len(data) // 2])
+        with self.assertRaises(ValueError):
+            SearchEngine.load(self.path)
+
+    def test_missing_file(self):
+        """Test that loading a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            SearchEngine.load(self.path)
+
+
+class TestSearchIndexInMenu(IndexFileTestCase):
+    """Test InteractiveMenu.use_search_index()."""
+
+    def setUp(self):
+        super().setUp()
+        self.held_output = StringIO()
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+        super().tearDown()
+
+    def make_menu(self):
+        menu = InteractiveMenu()
+        return menu.set_key("dish").enable_search().use_search_index(self.path).add_options(OPTIONS)
+
+    @patch('builtins.input', side_effect=['/', 'salad', '4', 'y', '/', 'salad', '3', 'y'])
+    def test_index_saved_then_loaded(self, mock_input):
+        """Test that the first menu writes the index and the next one maps it."""
+        self.make_menu().ask()
+        self.assertTrue(self.path.exists())
+
+        menu = self.make_menu()
+        with patch.object(SearchEngine, 'save') as save:
+            menu.ask()
+        save.assert_not_called()
+        self.assertIsInstance(menu.levels[0].search_engine.options, MappedStrings)
+        self.assertEqual(menu.get_all_results(), {"dish": "Caesar Salad"})
+
+    @patch('builtins.input', side_effect=['/', 'bread', '5', 'y'])
+    def test_stale_index_rebuilt(self, mock_input):
+        """Test that an index written for other options is replaced."""
+        SearchEngine(["Other"]).save(self.path)
+        menu = self.make_menu()
+        menu.ask()
+        self.assertEqual(menu.get_all_results(), {"dish": "Garlic Bread"})
+        self.assertEqual(list(SearchEngine.load(self.path, options=OPTIONS).options), OPTIONS)
+
+    @patch('builtins.input', side_effect=['/', 'bread', '5', 'y'])
+    def test_unwritable_index_ignored(self, mock_input):
+        """Test that search works when the index cannot be saved."""
+        self.path = Path(self.directory.name) / "missing" / "options.idx"
+        menu = self.make_menu()
+        menu.ask()
+        self.assertEqual(menu.get_all_results(), {"dish": "Garlic Bread"})
+        self.assertFalse(self.path.exists())
+
+    @patch('builtins.input', side_effect=['/', 'bread', '5', 'y'])
+    def test_unreadable_index_ignored(self, mock_input):
+        """Test that search works when the index path cannot be read."""
+        self.path.mkdir()
+        menu = self.make_menu()
+        menu.ask()
+        self.assertEqual(menu.get_all_results(), {"dish": "Garlic Bread"})
+        self.assertIsInstance(menu.levels[0].search_engine.options, list)
+
+    @patch('builtins.input', side_effect=['/', 'greek', '4', 'y'])
+    def test_from_file_search_index(self, mock_input):
+        """Test the search_index config key, relative to the config file."""
+        config_path = Path(self.directory.name) / "menu.json"
+        config_path.write_text(json.dumps({
+            "key": "dish", "options": OPTIONS, "search_index": "menu.idx",
+        }))
+        menu = InteractiveMenu.from_file(config_path)
+        menu.ask()
+        self.assertEqual(menu.get_all_results(), {"dish": "Greek Salad"})
+        self.assertTrue((Path(self.directory.name) / "menu.idx").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for parallel sharded search."""
+
+import gc
+import subprocess
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from basic_interactive_menu.search import SearchEngine
+from basic_interactive_menu.sharded_search import _SHARDS, ShardedSearchEngine
+
+
+class TestShardedSearchEngine(unittest.TestCase):
+    """Test that sharded results equal single-engine results."""
+
+    def setUp(self):
+        self.options = [f"Item {i} {'red blue green'.split()[i % 3]}" for i in range(500)]
+        self.reference = SearchEngine(self.options)
+        self.queries = ["item 1", "red", "BLUE", "9", "zzz", "", "m 4"]
+
+    def assert_matches_reference(self, engine):
+        for query in self.queries:
+            self.assertEqual(engine.search(query), self.reference.search(query), query)
+
+    def test_single_shard_in_process(self):
+        """Test that one shard is searched without a pool."""
+        with ShardedSearchEngine(self.options, shards=1) as engine:
+            self.assert_matches_reference(engine)
+            self.assertEqual(engine._pools, [])
+
+    def test_several_shards(self):
+        """Test uneven shard sizes and more shards than workers."""
+        for shards in (2, 3, 7):
+            with ShardedSearchEngine(self.options, shards=shards, workers=2) as engine:
+                self.assert_matches_reference(engine)
+
+    def test_workers_without_fork(self):
+        """Test workers that receive their shards through the initializer."""
+        with ShardedSearchEngine(self.options, shards=2, workers=1) as engine:
+            engine._fork = False
+            _SHARDS.pop(engine._token, None)
+            self.assert_matches_reference(engine)
+
+    def test_fork_only_when_default(self):
+        """Test that workers are forked only where fork is the start method."""
+        with patch('multiprocessing.get_start_method', return_value='spawn'):
+            with ShardedSearchEngine(self.options, shards=2, workers=1) as engine:
+                self.assertFalse(engine._fork)
+                self.assertNotIn(engine._token, _SHARDS)
+                self.assert_matches_reference(engine)
+        with patch('multiprocessing.get_start_method', return_value='fork'):
+            with ShardedSearchEngine(self.options, shards=2, workers=1) as engine:
+                self.assertTrue(engine._fork)
+
+    def test_workers_get_only_their_shards(self):
+        """Test that each worker is handed only the shards it searches."""
+        with ShardedSearchEngine(self.options, shards=5, workers=2) as engine:
+            self.assertEqual([shard for shard, _, _ in engine._split(0)], [0, 2, 4])
+            self.assertEqual([shard for shard, _, _ in engine._split(1)], [1, 3])
+            base, options = engine._split(1)[0][1:]
+            self.assertEqual(options, self.options[base:base + engine._shard_size])
+        with ShardedSearchEngine(["Apple", "Banana"], shards=4, workers=3) as engine:
+            self.assertEqual(engine.workers, 2)
+
+    def test_start_method_left_unset(self):
+        """Test that the engine does not fix the global start method."""
+        script = (
+            "import multiprocessing, sys\n"
+            f"sys.path.insert(0, {os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))!r})\n"
+            "from basic_interactive_menu.sharded_search import ShardedSearchEngine\n"
+            "if __name__ == '__main__':\n"
+            "    with ShardedSearchEngine(['Apple', 'Banana'], shards=2, workers=1) as engine:\n"
+            "        assert engine.search('an') == [1]\n"
+            "    multiprocessing.set_start_method('spawn')\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+    def test_released_when_collected(self):
+        """Test that an engine dropped without close() frees its shards and pool."""
+        engine = ShardedSearchEngine(self.options, shards=2, workers=1)
+        engine.search("red")
+        token, pool = engine._token, engine._pools[0]
+        del engine
+        gc.collect()
+        self.assertNotIn(token, _SHARDS)
+        with self.assertRaises(RuntimeError):
+            pool.submit(len, "")
+
+    def test_more_shards_than_options(self):
+        """Test that surplus shards are not created."""
+        with ShardedSearchEngine(["Apple", "Banana"], shards=8, workers=1) as engine:
+            self.assertEqual(engine._shard_count, 2)
+            self.assertEqual(engine.search("an"), [1])
+        with ShardedSearchEngine([], shards=4, workers=1) as engine:
+            self.assertEqual(engine.search("a"), [])
+
+    def test_summary(self):
+        """Test the match summary."""
+        with ShardedSearchEngine(["Apple", "Banana"], shards=1) as engine:
+            self.assertEqual(engine.get_matches_summary("ban"), "1 match: Banana")
+
+    def test_closed(self):
+        """Test that a closed engine releases its shards and rejects queries."""
+        engine = ShardedSearchEngine(self.options, shards=2, workers=1)
+        engine.search("red")
+        engine.close()
+        self.assertNotIn(engine._token, _SHARDS)
+        with self.assertRaises(ValueError):
+            engine.search("red")
+
+    def test_invalid_counts(self):
+        """Test that shard and worker counts must be positive."""
+        with self.assertRaises(ValueError):
+            ShardedSearchEngine([], shards=0)
+        with self.assertRaises(ValueError):
+            ShardedSearchEngine([], shards=2, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
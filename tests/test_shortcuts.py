@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from basic_interactive_menu.interactive_menu import InteractiveMenu
+from basic_interactive_menu.shortcuts import ShortcutMap
 
 
 class TestShortcutBasics(unittest.TestCase):
@@ -195,6 +196,38 @@ class TestAutoGeneration(unittest.TestCase):
         total_shortcuts = len(menu.shortcuts[0])
         self.assertEqual(total_shortcuts, 3)
 
+    def test_auto_generate_covers_options_added_later(self):
+        """Test that options added after a generation pass still get shortcuts."""
+        menu = InteractiveMenu()
+        menu.add_option("Apple").add_option("Banana")
+        menu._auto_generate_shortcuts()
+        menu.add_option("Cherry")
+        menu._auto_generate_shortcuts()
+        self.assertEqual(menu.shortcuts[0]['c'], 2)
+        self.assertEqual(menu._get_option_shortcut(2), 'c')
+
+
+class TestShortcutMap(unittest.TestCase):
+    """Test the bidirectional shortcut mapping."""
+
+    def test_lookup_both_directions(self):
+        """Test that shortcut and index lookups stay in sync."""
+        shortcuts = ShortcutMap()
+        shortcuts.assign('x', 3)
+        self.assertEqual(shortcuts['x'], 3)
+        self.assertEqual(shortcuts.shortcut_for(3), 'x')
+        self.assertTrue(shortcuts.has_index(3))
+        self.assertIsNone(shortcuts.shortcut_for(0))
+        self.assertEqual(shortcuts, {'x': 3})
+
+    def test_conflicting_assignment_raises(self):
+        """Test that rebinding a shortcut to another option raises."""
+        shortcuts = ShortcutMap()
+        shortcuts.assign('x', 0)
+        with self.assertRaises(ValueError):
+            shortcuts.assign('x', 1)
+        self.assertEqual(shortcuts.shortcut_for(1), None)
+
 
 class TestShortcutsWithSpecialCharacters(unittest.TestCase):
     """Test shortcuts with special characters in option names."""